@@ -0,0 +1,233 @@
+"""
+Runs the benchmark scenarios against a local fake OCI-P server and reports the results.
+
+    python -m benchmarks.run --latency-ms 20 --output report.json
+    python -m benchmarks.run --latency-ms 20 --compare baseline.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Iterator
+from datetime import UTC, datetime
+from importlib import metadata
+from typing import Any
+
+from benchmarks.scenarios import SCENARIOS, BenchConfig
+from benchmarks.server import Dataset, FakeOCIServer
+
+DEFAULT_THRESHOLD = 10.0  # Percent change reported as a regression
+
+# Metrics compared between reports: medians and throughput, as the noisier
+# means, tails and wall times swing too much between runs to gate on
+_LOWER_IS_BETTER = ("p50_ms",)
+_HIGHER_IS_BETTER = ("rows_per_second",)
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _version() -> str | None:
+    try:
+        return metadata.version("mercury-cli")
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def flatten(metrics: dict[str, Any], prefix: str = "") -> Iterator[tuple[str, Any]]:
+    """
+    Yields every numeric metric as a dotted name, e.g. `bulk.batched.rows_per_second`.
+    """
+    for key, value in metrics.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            yield from flatten(value, f"{name}.")
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, value
+
+
+def compare(
+    current: dict[str, Any], baseline: dict[str, Any], threshold: float
+) -> list[dict[str, Any]]:
+    """
+    Compares the median timings and throughputs the two reports share.
+
+    Args:
+        current (dict[str, Any]): This run's report.
+        baseline (dict[str, Any]): An earlier report, e.g. from the last release.
+        threshold (float): Percent worse than the baseline counted as a regression.
+
+    Returns:
+        list[dict[str, Any]]: One row per metric with both values, the change and whether it regressed.
+    """
+    before = dict(flatten(baseline.get("scenarios", {})))
+    rows = []
+    for name, value in flatten(current.get("scenarios", {})):
+        leaf = name.rsplit(".", 1)[-1]
+        if leaf not in _LOWER_IS_BETTER + _HIGHER_IS_BETTER or not before.get(name):
+            continue
+        change = (value - before[name]) / before[name] * 100
+        worse = -change if leaf in _HIGHER_IS_BETTER else change
+        rows.append(
+            {
+                "metric": name,
+                "baseline": before[name],
+                "current": value,
+                "change_percent": round(change, 1),
+                "regressed": worse > threshold,
+            }
+        )
+    return rows
+
+
+def _print_comparison(rows: list[dict[str, Any]], threshold: float) -> None:
+    from rich.console import Console
+    from rich.table import Table
+
+    table = Table(title=f"Compared with baseline (regression > {threshold:g}%)")
+    table.add_column("Metric")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Current", justify="right")
+    table.add_column("Change", justify="right")
+    for row in rows:
+        style = "red" if row["regressed"] else None
+        table.add_row(
+            row["metric"],
+            f"{row['baseline']:g}",
+            f"{row['current']:g}",
+            f"{row['change_percent']:+.1f}%",
+            style=style,
+        )
+    Console().print(table)
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.run",
+        description="Benchmark mercury-cli against a local fake OCI-P server.",
+    )
+    parser.add_argument(
+        "--scenarios",
+        default=",".join(SCENARIOS),
+        help=f"Comma separated scenarios to run, from {', '.join(SCENARIOS)}",
+    )
+    parser.add_argument("--latency-ms", type=float, default=10.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--service-providers", type=int, default=5)
+    parser.add_argument("--groups", type=int, default=10)
+    parser.add_argument("--users", type=int, default=25)
+    parser.add_argument("--rows", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--batch-size", type=int, default=25)
+    parser.add_argument("--pool-size", type=int, default=4)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", help="File the JSON report is written to")
+    parser.add_argument("--compare", help="Earlier JSON report to compare against")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="Percent worse than the baseline counted as a regression",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _parser().parse_args(argv)
+    # mercury_cli parses the command line when it is first imported
+    sys.argv[1:] = []
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    if unknown := [name for name in names if name not in SCENARIOS]:
+        print(f"Unknown scenarios: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    workdir = tempfile.mkdtemp(prefix="mercury-bench-")
+    os.environ["MERCURY_CLI_HOME"] = os.path.join(workdir, "state")
+    config = BenchConfig(
+        repeat=args.repeat,
+        rows=args.rows,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        pool_size=args.pool_size,
+        workdir=workdir,
+    )
+    dataset = Dataset(args.service_providers, args.groups, args.users)
+
+    report: dict[str, Any] = {
+        "meta": {
+            "version": _version(),
+            "revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "started": datetime.now(UTC).isoformat(timespec="seconds"),
+        },
+        "config": {
+            "latency_ms": args.latency_ms,
+            "jitter_ms": args.jitter_ms,
+            "error_rate": args.error_rate,
+            "dataset": vars(dataset),
+            "rows": args.rows,
+            "workers": args.workers,
+            "batch_size": args.batch_size,
+            "pool_size": args.pool_size,
+            "repeat": args.repeat,
+            "seed": args.seed,
+        },
+        "scenarios": {},
+    }
+
+    with FakeOCIServer(
+        dataset,
+        latency=args.latency_ms / 1000,
+        jitter=args.jitter_ms / 1000,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    ) as server:
+        for name in names:
+            print(f"Running {name}...", file=sys.stderr)
+            server.stats.reset()
+            started = time.perf_counter()
+            metrics = SCENARIOS[name](server, config)
+            served = server.stats.snapshot()
+            report["scenarios"][name] = {
+                **metrics,
+                "wall_seconds": round(time.perf_counter() - started, 3),
+                "server": {k: v for k, v in served.items() if k != "by_command"},
+            }
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+        print(f"Report written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as file:
+            rows = compare(report, json.load(file), args.threshold)
+        _print_comparison(rows, args.threshold)
+        if any(row["regressed"] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,329 @@
+import csv
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any
+
+from benchmarks.server import FakeOCIServer
+
+BENCH_USERNAME = "bench"
+PASSWORD_ENV = "MERCURY_BENCH_PASSWORD"
+
+Metrics = dict[str, Any]
+
+
+@dataclass
+class BenchConfig:
+    """
+    Knobs shared by every scenario.
+
+    Args:
+        repeat (int): Times each timed step is repeated; medians and p95s are reported.
+        rows (int): Rows in the bulk scenario's CSV.
+        workers (int): Workers for the concurrent bulk runs and the enterprise audit.
+        batch_size (int): Row commands per request in the batched bulk run.
+        pool_size (int): Sessions the CLI opens, as `--pool-size`.
+        workdir (str): Directory for generated CSVs, outputs and CLI state.
+    """
+
+    repeat: int = 5
+    rows: int = 200
+    workers: int = 8
+    batch_size: int = 25
+    pool_size: int = 4
+    workdir: str = "."
+
+
+def _sample(
+    step: Callable[[], Any], repeat: int, before: Callable[[], Any] | None = None
+):
+    """
+    Times `step` `repeat` times, calling `before` untimed ahead of each run.
+
+    Returns:
+        dict[str, Any]: The `LatencyStats` summary, in milliseconds.
+    """
+    from mercury_cli.utils.metrics import LatencyStats
+
+    stats = LatencyStats()
+    for _ in range(repeat):
+        if before:
+            before()
+        started = time.perf_counter()
+        step()
+        stats.observe(time.perf_counter() - started)
+    return stats.summary()
+
+
+def _forget_responses() -> None:
+    from mercury_cli.globals import MERCURY_CLI
+
+    MERCURY_CLI.cache().clear(include_store=True)
+    MERCURY_CLI.responses().clear()
+
+
+@contextmanager
+def _quiet() -> Iterator[None]:
+    """
+    Silences the CLI's console while an action runs.
+    """
+    from mercury_cli.globals import MERCURY_CLI
+
+    console = MERCURY_CLI.console()
+    quiet, console.quiet = console.quiet, True
+    try:
+        yield
+    finally:
+        console.quiet = quiet
+
+
+def login(server: FakeOCIServer, config: BenchConfig) -> float:
+    """
+    Logs the in-process CLI in to the fake server.
+
+    Returns:
+        float: Seconds the login took.
+    """
+    from mercury_cli.globals import MERCURY_CLI
+
+    started = time.perf_counter()
+    MERCURY_CLI.get().client_auth(
+        username=BENCH_USERNAME,
+        password="bench",
+        host=server.url,
+        pool_size=config.pool_size,
+    )
+    return time.perf_counter() - started
+
+
+def completion(server: FakeOCIServer, config: BenchConfig) -> Metrics:
+    """
+    Time to produce completions: from the server, the in-memory cache and the on-disk index.
+    """
+    from mercury_cli.globals import MERCURY_CLI
+    from mercury_cli.utils.service_group_id_callable import (
+        _get_service_provider_id_completions,
+        _group_candidates,
+        _matching,
+        get_group_ids,
+        get_service_provider_ids,
+    )
+
+    login(server, config)
+    service_provider = server.dataset.service_provider_ids()[0]
+    cache = MERCURY_CLI.cache()
+
+    def _from_index() -> None:
+        cache.clear()  # Memory only, the on-disk index keeps the list
+        get_service_provider_ids()
+
+    return {
+        "service_providers_cold": _sample(
+            get_service_provider_ids, config.repeat, _forget_responses
+        ),
+        "service_providers_index": _sample(
+            get_service_provider_ids, config.repeat, _from_index
+        ),
+        "service_providers_warm": _sample(
+            lambda: _get_service_provider_id_completions(None, None, "SP00"),
+            config.repeat,
+            get_service_provider_ids,
+        ),
+        "groups_cold": _sample(
+            lambda: get_group_ids(service_provider),
+            config.repeat,
+            _forget_responses,
+        ),
+        "groups_search_cold": _sample(
+            lambda: _group_candidates(service_provider, f"{service_provider}-G00"),
+            config.repeat,
+            _forget_responses,
+        ),
+        "groups_match": _sample(
+            lambda: _matching(
+                ("groups", service_provider),
+                get_group_ids(service_provider),
+                f"{service_provider}-G00",
+            ),
+            config.repeat,
+        ),
+    }
+
+
+def _write_users_csv(path: str, server: FakeOCIServer, rows: int) -> None:
+    service_provider = server.dataset.service_provider_ids()[0]
+    group = server.dataset.group_ids(service_provider)[0]
+    with open(path, "w", encoding="utf-8", newline="") as file:
+        writer = csv.writer(file)
+        writer.writerow(
+            [
+                "operation",
+                "serviceProviderId",
+                "groupId",
+                "userId",
+                "lastName",
+                "firstName",
+                "callingLineIdLastName",
+                "callingLineIdFirstName",
+                "password",
+            ]
+        )
+        for row in range(rows):
+            writer.writerow(
+                [
+                    "user.create",
+                    service_provider,
+                    group,
+                    f"bench{row:06d}@example.com",
+                    "Bench",
+                    f"User{row}",
+                    "Bench",
+                    f"User{row}",
+                    "Benchmark1!",
+                ]
+            )
+
+
+def bulk(server: FakeOCIServer, config: BenchConfig) -> Metrics:
+    """
+    Bulk user creation throughput: one row at a time, across workers, and batched.
+    """
+    from mercury_cli.globals import MERCURY_CLI
+
+    login(server, config)
+    csv_path = os.path.join(config.workdir, "bench_users.csv")
+    _write_users_csv(csv_path, server, config.rows)
+
+    variants = {
+        "sequential": (1, 1),
+        "concurrent": (config.workers, 1),
+        "batched": (config.workers, config.batch_size),
+    }
+    metrics: Metrics = {"rows": config.rows}
+    for name, (workers, batch_size) in variants.items():
+        summary_path = os.path.join(config.workdir, f"bench_bulk_{name}.json")
+        with _quiet():
+            MERCURY_CLI.completer().run_action(
+                f"bulk create user {csv_path} --workers {workers} "
+                f"--batch-size {batch_size} --summary {summary_path}"
+            )
+        with open(summary_path, encoding="utf-8") as file:
+            summary = json.load(file)
+        metrics[name] = {
+            "rows_per_second": summary["rows_per_second"],
+            "elapsed_seconds": summary["elapsed_seconds"],
+            "failed": summary["failed"],
+            "p95_ms": summary["latency"]["p95_ms"],
+        }
+    return metrics
+
+
+def audit(server: FakeOCIServer, config: BenchConfig) -> Metrics:
+    """
+    Time to audit one group, and every group in a service provider.
+    """
+    from mercury_cli.globals import MERCURY_CLI
+
+    login(server, config)
+    service_provider = server.dataset.service_provider_ids()[0]
+    group = server.dataset.group_ids(service_provider)[0]
+    output = os.path.join(config.workdir, "bench_audit.jsonl")
+
+    def _run(action: str) -> Callable[[], None]:
+        def _step() -> None:
+            with _quiet():
+                MERCURY_CLI.completer().run_action(action)
+
+        return _step
+
+    group_audit = _run(
+        f"automations group_audit {service_provider} {group} --output {output}"
+    )
+    enterprise = _sample(
+        _run(
+            f"automations enterprise_audit {service_provider} "
+            f"--workers {config.workers} --output {output}"
+        ),
+        config.repeat,
+        _forget_responses,
+    )
+    return {
+        "group_audit_cold": _sample(group_audit, config.repeat, _forget_responses),
+        "group_audit_cached": _sample(group_audit, config.repeat),
+        "enterprise_audit": enterprise,
+        "groups": server.dataset.groups,
+    }
+
+
+_TIMINGS = re.compile(r"(\w+) ([\d.]+)s")
+
+
+def startup(server: FakeOCIServer, config: BenchConfig) -> Metrics:
+    """
+    Cold start of a one-shot `--action` run in a fresh interpreter, by phase.
+    """
+    env = {
+        **os.environ,
+        PASSWORD_ENV: "bench",
+        "MERCURY_CLI_HOME": os.path.join(config.workdir, "startup_state"),
+    }
+    command = [
+        sys.executable,
+        "-m",
+        "mercury_cli",
+        "--username",
+        BENCH_USERNAME,
+        "--password-env",
+        PASSWORD_ENV,
+        "--host",
+        server.url,
+        "--pool-size",
+        str(config.pool_size),
+        "--action",
+        "sysver",
+        "--timings",
+    ]
+
+    phases: dict[str, list[float]] = {}
+    for _ in range(config.repeat):
+        result = subprocess.run(
+            command, env=env, capture_output=True, text=True, timeout=300, check=False
+        )
+        line = next(
+            (
+                output
+                for output in result.stderr.splitlines()
+                if output.startswith("timings:")
+            ),
+            None,
+        )
+        if result.returncode != 0 or line is None:
+            raise RuntimeError(
+                f"Startup run failed ({result.returncode}): {result.stderr.strip()}"
+            )
+        for phase, seconds in _TIMINGS.findall(line):
+            phases.setdefault(phase, []).append(float(seconds))
+
+    return {
+        phase: {
+            "p50_ms": round(statistics.median(values) * 1000, 1),
+            "max_ms": round(max(values) * 1000, 1),
+        }
+        for phase, values in phases.items()
+    }
+
+
+# Every scenario by name, in the order they run by default
+SCENARIOS: dict[str, Callable[[FakeOCIServer, BenchConfig], Metrics]] = {
+    "completion": completion,
+    "bulk": bulk,
+    "audit": audit,
+    "startup": startup,
+}
@@ -0,0 +1,683 @@
+import random
+import threading
+import time
+import uuid
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+from xml.sax.saxutils import escape
+
+from lxml import etree
+
+SERVICE_PATH = "/webservice/services/ProvisioningService"
+XSI = "http://www.w3.org/2001/XMLSchema-instance"
+SOAP_ENV = "http://schemas.xmlsoap.org/soap/envelope/"
+WEBSERVICE_NS = "urn:com:broadsoft:webservice"
+
+# Summary of an injected failure, one the CLI treats as the server shedding load
+BUSY_SUMMARY = "[Error 4962] Server busy, please try again later."
+
+# Summary for a document whose sessionId is missing or in the document's namespace
+NO_SESSION_SUMMARY = "Invalid session: no unqualified sessionId in the request."
+
+# Requests never failed on purpose, so a benchmark can always log in
+_LOGIN_REQUESTS = frozenset(
+    {
+        "AuthenticationRequest",
+        "LoginRequest14sp4",
+        "LoginRequest22V5",
+        "LogoutRequest",
+    }
+)
+
+WSDL = f"""<?xml version="1.0" encoding="UTF-8"?>
+<definitions xmlns="http://schemas.xmlsoap.org/wsdl/"
+             xmlns:soap="http://schemas.xmlsoap.org/wsdl/soap/"
+             xmlns:xsd="http://www.w3.org/2001/XMLSchema"
+             xmlns:tns="{WEBSERVICE_NS}"
+             targetNamespace="{WEBSERVICE_NS}">
+  <types>
+    <xsd:schema targetNamespace="{WEBSERVICE_NS}" elementFormDefault="qualified">
+      <xsd:element name="processOCIMessage">
+        <xsd:complexType><xsd:sequence>
+          <xsd:element name="in0" type="xsd:string"/>
+        </xsd:sequence></xsd:complexType>
+      </xsd:element>
+      <xsd:element name="processOCIMessageResponse">
+        <xsd:complexType><xsd:sequence>
+          <xsd:element name="processOCIMessageReturn" type="xsd:string"/>
+        </xsd:sequence></xsd:complexType>
+      </xsd:element>
+    </xsd:schema>
+  </types>
+  <message name="processOCIMessageRequest">
+    <part name="parameters" element="tns:processOCIMessage"/>
+  </message>
+  <message name="processOCIMessageResponse">
+    <part name="parameters" element="tns:processOCIMessageResponse"/>
+  </message>
+  <portType name="BWProvisioningService">
+    <operation name="processOCIMessage">
+      <input message="tns:processOCIMessageRequest"/>
+      <output message="tns:processOCIMessageResponse"/>
+    </operation>
+  </portType>
+  <binding name="ProvisioningServiceSoapBinding" type="tns:BWProvisioningService">
+    <soap:binding style="document" transport="http://schemas.xmlsoap.org/soap/http"/>
+    <operation name="processOCIMessage">
+      <soap:operation soapAction=""/>
+      <input><soap:body use="literal"/></input>
+      <output><soap:body use="literal"/></output>
+    </operation>
+  </binding>
+  <service name="BWProvisioningServiceService">
+    <port name="ProvisioningService" binding="tns:ProvisioningServiceSoapBinding">
+      <soap:address location="{{location}}"/>
+    </port>
+  </service>
+</definitions>
+"""
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """
+    Shape of the synthetic system the fake server answers for.
+
+    Every entity is derived from its position, so a dataset of any size
+    costs nothing to hold and is the same on every run.
+
+    Args:
+        service_providers (int): Number of service providers.
+        groups (int): Groups in each service provider.
+        users (int): Users in each group.
+    """
+
+    service_providers: int = 5
+    groups: int = 10
+    users: int = 25
+
+    def service_provider_ids(self) -> list[str]:
+        return [f"SP{sp:04d}" for sp in range(1, self.service_providers + 1)]
+
+    def group_ids(self, service_provider_id: str) -> list[str]:
+        if service_provider_id not in self.service_provider_ids():
+            return []
+        return [f"{service_provider_id}-G{g:04d}" for g in range(1, self.groups + 1)]
+
+    def has_group(self, service_provider_id: str, group_id: str) -> bool:
+        return group_id in self.group_ids(service_provider_id)
+
+    def users_in(self, group_id: str) -> list[tuple[str, str, str]]:
+        """
+        Returns each user in a group as (user ID, phone number, extension).
+        """
+        sp, g = (int(part[-4:]) for part in group_id.split("-"))
+        return [
+            (
+                f"user{u:04d}@{group_id.lower()}.example.com",
+                f"+44-{sp:02d}{g:03d}{u:05d}",
+                f"{u:04d}",
+            )
+            for u in range(1, self.users + 1)
+        ]
+
+
+class ServerStats:
+    """
+    Counts what the fake server has been asked to do.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.documents = 0
+        self.commands: Counter = Counter()
+        self.injected_errors = 0
+
+    def record(self, names: Sequence[str], injected: int) -> None:
+        with self._lock:
+            self.documents += 1
+            self.commands.update(names)
+            self.injected_errors += injected
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "documents": self.documents,
+                "commands": sum(self.commands.values()),
+                "injected_errors": self.injected_errors,
+                "by_command": dict(self.commands.most_common()),
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self.documents = 0
+            self.commands.clear()
+            self.injected_errors = 0
+
+
+def _table(name: str, headings: Sequence[str], rows: Sequence[Sequence[Any]]) -> str:
+    return (
+        f"<{name}>"
+        + "".join(f"<colHeading>{escape(h)}</colHeading>" for h in headings)
+        + "".join(
+            "<row>" + "".join(f"<col>{escape(str(c))}</col>" for c in row) + "</row>"
+            for row in rows
+        )
+        + f"</{name}>"
+    )
+
+
+def _fields(**fields: Any) -> str:
+    parts = []
+    for name, value in fields.items():
+        if value is None:
+            continue
+        if isinstance(value, bool):
+            value = str(value).lower()
+        parts.append(f"<{name}>{escape(str(value))}</{name}>")
+    return "".join(parts)
+
+
+def _lower_first(name: str) -> str:
+    return name[:1].lower() + name[1:]
+
+
+def _response(type_name: str, body: str = "") -> str:
+    return f'<command echo="" xsi:type="{type_name}" xmlns="">{body}</command>'
+
+
+def success() -> str:
+    return '<command echo="" xsi:type="c:SuccessResponse" xmlns:c="C" xmlns=""/>'
+
+
+def error(summary: str) -> str:
+    return (
+        '<command type="Error" echo="" xsi:type="c:ErrorResponse" xmlns:c="C" xmlns="">'
+        f"{_fields(summary=summary, summaryEnglish=summary)}</command>"
+    )
+
+
+USER_HEADINGS = (
+    "User Id",
+    "Last Name",
+    "First Name",
+    "Department",
+    "Phone Number",
+    "Phone Number Activated",
+    "Email Address",
+    "Hiragana Last Name",
+    "Hiragana First Name",
+    "In Trunk Group",
+    "Extension",
+    "Country Code",
+    "National Prefix",
+    "User External Id",
+)
+
+DN_HEADINGS = (
+    "Phone Numbers",
+    "Department",
+    "Activated",
+    "User Id",
+    "Last Name",
+    "First Name",
+    "Extension",
+    "Email Address",
+    "User Type",
+    "Country Code",
+    "National Prefix",
+)
+
+SERVICE_HEADINGS = (
+    "Service Name",
+    "Authorized",
+    "Assigned",
+    "Limited",
+    "Quantity",
+    "Usage",
+    "Licensed",
+    "Allowed",
+)
+
+
+class OCIHandlers:
+    """
+    Answers the OCI-P requests the CLI's completions, audits and bulk runs send.
+
+    Unknown read requests get an error response, and any other request is
+    taken to be a change and succeeds without doing anything.
+
+    Args:
+        dataset (Dataset): The system to answer for.
+    """
+
+    def __init__(self, dataset: Dataset):
+        self.dataset = dataset
+        self.handlers: dict[str, Callable[[dict[str, str]], str]] = {
+            "AuthenticationRequest": self.authentication,
+            "LoginRequest14sp4": self.login,
+            "LoginRequest22V5": self.login,
+            "LogoutRequest": lambda fields: success(),
+            "SystemSoftwareVersionGetRequest": self.version,
+            "ServiceProviderGetListRequest": self.service_providers,
+            "GroupGetListInServiceProviderRequest": self.groups,
+            "GroupGetListInServiceProviderPagedSortedListRequest": self.groups_paged,
+            "GroupServiceGetAuthorizedListRequest": self.authorized_services,
+            "GroupGetRequest22V5": self.group,
+            "UserGetListInGroupRequest": self.users,
+            "GroupServiceGetAuthorizationListRequest": self.authorizations,
+            "GroupDnGetAssignmentListRequest18": self.dns,
+        }
+
+    def handle(self, name: str, fields: dict[str, str]) -> str:
+        """
+        Returns the response command for one request command.
+
+        Args:
+            name (str): The request's type, e.g. `ServiceProviderGetListRequest`.
+            fields (dict[str, str]): The request's top-level fields by element name.
+        """
+        handler = self.handlers.get(name)
+        if handler is not None:
+            return handler(fields)
+        if "Get" in name:
+            return error(f"{name} is not supported by the benchmark server.")
+        return success()
+
+    def _group(self, fields: dict[str, str]) -> str | None:
+        if self.dataset.has_group(
+            fields.get("serviceProviderId"), fields.get("groupId")
+        ):
+            return fields["groupId"]
+        return None
+
+    def authentication(self, fields: dict[str, str]) -> str:
+        return _response(
+            "AuthenticationResponse",
+            _fields(
+                userId=fields.get("userId"),
+                nonce=uuid.uuid4().hex,
+                passwordAlgorithm="MD5",
+            ),
+        )
+
+    def login(self, fields: dict[str, str]) -> str:
+        return _response(
+            "LoginResponse22V5",
+            _fields(
+                loginType="System",
+                locale="en_US",
+                encoding="ISO-8859-1",
+                isEnterprise=False,
+                passwordExpiresDays=365,
+                userDomain="example.com",
+            ),
+        )
+
+    def version(self, fields: dict[str, str]) -> str:
+        return _response("SystemSoftwareVersionGetResponse", _fields(version="24.0"))
+
+    def service_providers(self, fields: dict[str, str]) -> str:
+        rows = [
+            (sp, f"Service Provider {sp}", "true", "")
+            for sp in self.dataset.service_provider_ids()
+        ]
+        return _response(
+            "ServiceProviderGetListResponse",
+            _table(
+                "serviceProviderTable",
+                (
+                    "Service Provider Id",
+                    "Service Provider Name",
+                    "Is Enterprise",
+                    "Reseller Id",
+                ),
+                rows,
+            ),
+        )
+
+    def groups(self, fields: dict[str, str]) -> str:
+        rows = [
+            (group, f"Group {group}", self.dataset.users * 2)
+            for group in self.dataset.group_ids(fields.get("serviceProviderId"))
+        ]
+        return _response(
+            "GroupGetListInServiceProviderResponse",
+            _table("groupTable", ("Group Id", "Group Name", "User Limit"), rows),
+        )
+
+    def groups_paged(self, fields: dict[str, str]) -> str:
+        groups = self.dataset.group_ids(fields.get("serviceProviderId"))
+        if fields.get("mode") == "Starts With":  # searchCriteriaGroupId
+            prefix = fields.get("value", "").lower()
+            groups = [group for group in groups if group.lower().startswith(prefix)]
+        if fields.get("responsePageSize"):
+            start = max(int(fields.get("responseStartIndex") or 1), 1) - 1
+            groups = groups[start : start + int(fields["responsePageSize"])]
+        rows = [(group, f"Group {group}", self.dataset.users * 2) for group in groups]
+        return _response(
+            "GroupGetListInServiceProviderPagedSortedListResponse",
+            _table("groupTable", ("Group Id", "Group Name", "User Limit"), rows),
+        )
+
+    def authorized_services(self, fields: dict[str, str]) -> str:
+        if self._group(fields) is None:
+            return error("[Error 4008] Group not found.")
+        return _response(
+            "GroupServiceGetAuthorizedListResponse",
+            "".join(
+                _fields(servicePackName=pack)
+                for pack in ("Basic Pack", "Premium Pack", "Contact Centre Pack")
+            )
+            + _fields(groupServiceName="Hunt Group")
+            + _fields(userServiceName="Voice Messaging User"),
+        )
+
+    def group(self, fields: dict[str, str]) -> str:
+        if (group := self._group(fields)) is None:
+            return error("[Error 4008] Group not found.")
+        return _response(
+            "GroupGetResponse22V5",
+            _fields(
+                serviceProviderId=fields["serviceProviderId"],
+                groupId=group,
+                defaultDomain="example.com",
+                userLimit=self.dataset.users * 2,
+                userCount=self.dataset.users,
+                groupName=f"Group {group}",
+                callingLineIdName=group,
+                timeZone="Europe/London",
+                timeZoneDisplayName="(GMT) Greenwich Mean Time",
+            ),
+        )
+
+    def users(self, fields: dict[str, str]) -> str:
+        if (group := self._group(fields)) is None:
+            return error("[Error 4008] Group not found.")
+        rows = [
+            (
+                user_id,
+                "User",
+                user_id.split("@")[0],
+                "",
+                number,
+                "true",
+                "",
+                "",
+                "",
+                "false",
+                extension,
+                "44",
+                "0",
+                "",
+            )
+            for user_id, number, extension in self.dataset.users_in(group)
+        ]
+        return _response(
+            "UserGetListInGroupResponse", _table("userTable", USER_HEADINGS, rows)
+        )
+
+    def authorizations(self, fields: dict[str, str]) -> str:
+        if self._group(fields) is None:
+            return error("[Error 4008] Group not found.")
+        users = self.dataset.users
+        return _response(
+            "GroupServiceGetAuthorizationListResponse",
+            _table(
+                "servicePacksAuthorizationTable",
+                (
+                    "Service Pack Name",
+                    "Authorized",
+                    "Allocated",
+                    "Allowed",
+                    "Usage",
+                    "Description",
+                ),
+                [("Basic Pack", "true", "Unlimited", "Unlimited", users, "")],
+            )
+            + _table(
+                "groupServicesAuthorizationTable",
+                SERVICE_HEADINGS,
+                [
+                    ("Hunt Group", "true", "true", "false", "", 2, "true", "Unlimited"),
+                    (
+                        "Call Center - Standard",
+                        "true",
+                        "true",
+                        "false",
+                        "",
+                        1,
+                        "true",
+                        "Unlimited",
+                    ),
+                ],
+            )
+            + _table(
+                "userServicesAuthorizationTable",
+                SERVICE_HEADINGS,
+                [
+                    (
+                        "Voice Messaging User",
+                        "true",
+                        "true",
+                        "false",
+                        "",
+                        users,
+                        "true",
+                        "Unlimited",
+                    ),
+                    (
+                        "Call Forwarding Always",
+                        "true",
+                        "true",
+                        "false",
+                        "",
+                        users,
+                        "true",
+                        "Unlimited",
+                    ),
+                ],
+            ),
+        )
+
+    def dns(self, fields: dict[str, str]) -> str:
+        if (group := self._group(fields)) is None:
+            return error("[Error 4008] Group not found.")
+        rows = [
+            (
+                number,
+                "",
+                "true",
+                user_id,
+                "User",
+                "",
+                extension,
+                "",
+                "Normal",
+                "44",
+                "0",
+            )
+            for user_id, number, extension in self.dataset.users_in(group)
+        ]
+        return _response(
+            "GroupDnGetAssignmentListResponse18", _table("dnTable", DN_HEADINGS, rows)
+        )
+
+
+class FakeOCIServer:
+    """
+    Local stand-in for a BroadWorks OCI-P SOAP endpoint, for benchmarks.
+
+    Serves the WSDL and `processOCIMessage` over keep-alive HTTP on a
+    background thread, answering from a synthetic `Dataset`. Each request
+    document is delayed by `latency` (plus up to `jitter`) seconds, and each
+    command in it fails with a "server busy" error with probability
+    `error_rate`, so timings reflect round trips and retries the way they
+    would against a real server.
+
+    Args:
+        dataset (Dataset | None): The system to answer for, a default one if None.
+        latency (float): Seconds added to every request document.
+        jitter (float): Most extra seconds added at random to each document.
+        error_rate (float): Chance each command fails as if the server were overloaded.
+        seed (int | None): Seeds the jitter and failures, for repeatable runs.
+        host (str): Interface to listen on.
+        port (int): Port to listen on, 0 for any free port.
+    """
+
+    def __init__(
+        self,
+        dataset: Dataset | None = None,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        if not 0 <= error_rate < 1:
+            raise ValueError("error_rate must be at least 0 and below 1")
+        if dataset is None:
+            dataset = Dataset()
+        self.dataset = dataset
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.stats = ServerStats()
+        self.handlers = OCIHandlers(dataset)
+        self._random = random.Random(seed)
+        self._random_lock = threading.Lock()
+        self._httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self._httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        """
+        The endpoint to log in to, as given to `--host`.
+        """
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}{SERVICE_PATH}"
+
+    def start(self) -> "FakeOCIServer":
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="fake-oci-server", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def _chance(self) -> float:
+        with self._random_lock:
+            return self._random.random()
+
+    def process(self, document: str) -> str:
+        """
+        Answers one OCI-P request document, holding one or more commands.
+
+        Args:
+            document (str): The `BroadsoftDocument` sent by the client.
+
+        Returns:
+            str: The response document, one response command per request command.
+            Like the real server, every command is rejected if the document has no
+            `sessionId` outside the document's namespace, i.e. `<sessionId xmlns="">`.
+        """
+        root = etree.fromstring(document.encode("ISO-8859-1"))
+        session = (root.findtext("sessionId") or "").strip()
+
+        responses, names, injected = [], [], 0
+        for command in root.iterfind("command"):
+            name = command.get(f"{{{XSI}}}type", "").split(":")[-1]
+            names.append(name)
+            if not session:
+                responses.append(error(NO_SESSION_SUMMARY))
+                continue
+            if (
+                self.error_rate
+                and name not in _LOGIN_REQUESTS
+                and self._chance() < self.error_rate
+            ):
+                responses.append(error(BUSY_SUMMARY))
+                injected += 1
+                continue
+            fields = {  # Nested fields flattened, and some requests spell it `GroupId`
+                _lower_first(etree.QName(leaf).localname): (leaf.text or "")
+                for leaf in command.iterdescendants()
+                if len(leaf) == 0
+            }
+            responses.append(self.handlers.handle(name, fields))
+
+        delay = self.latency + (self.jitter * self._chance() if self.jitter else 0.0)
+        if delay:
+            time.sleep(delay)
+        self.stats.record(names, injected)
+
+        return (
+            '<?xml version="1.0" encoding="ISO-8859-1"?>'
+            f'<BroadsoftDocument protocol="OCI" xmlns="C" xmlns:xsi="{XSI}">'
+            f'<sessionId xmlns="">{escape(session)}</sessionId>'
+            + "".join(responses)
+            + "</BroadsoftDocument>"
+        )
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"  # Keep-alive, like the real server
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+            def _reply(self, body: str, content_type: str, status: int = 200) -> None:
+                payload = body.encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def do_GET(self) -> None:
+                if not self.path.startswith(SERVICE_PATH):
+                    self._reply("Not found", "text/plain", 404)
+                    return
+                self._reply(WSDL.format(location=server.url), "text/xml")
+
+            def do_POST(self) -> None:
+                body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+                try:
+                    envelope = etree.fromstring(body)
+                    document = envelope.find(f".//{{{WEBSERVICE_NS}}}in0").text
+                    result = server.process(document)
+                except Exception as e:  # noqa: BLE001
+                    self._reply(
+                        f'<soapenv:Envelope xmlns:soapenv="{SOAP_ENV}"><soapenv:Body>'
+                        f"<soapenv:Fault><faultcode>soapenv:Server</faultcode>"
+                        f"<faultstring>{escape(str(e))}</faultstring></soapenv:Fault>"
+                        "</soapenv:Body></soapenv:Envelope>",
+                        "text/xml",
+                        500,
+                    )
+                    return
+                self._reply(
+                    f'<soapenv:Envelope xmlns:soapenv="{SOAP_ENV}"><soapenv:Body>'
+                    f'<processOCIMessageResponse xmlns="{WEBSERVICE_NS}">'
+                    f"<processOCIMessageReturn>{escape(result)}</processOCIMessageReturn>"
+                    "</processOCIMessageResponse></soapenv:Body></soapenv:Envelope>",
+                    "text/xml",
+                )
+
+        return Handler
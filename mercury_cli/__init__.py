@@ -1,3 +1,8 @@
+import time
+
+# As close to process start as we can measure, for --timings
+STARTED = time.perf_counter()
+
 from .main import main
 
 __version__ = "0.1.0"
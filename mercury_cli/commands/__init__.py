@@ -1,12 +1,49 @@
-import pkgutil
 import importlib
 
-__all__ = []
+from mercury_cli.globals import MERCURY_CLI
+from mercury_cli.utils.lazy import register_lazy_group
 
-package = __name__
+__all__ = ["automations", "bulk", "misc"]
 
-for finder, fullname, ispkg in pkgutil.walk_packages(__path__, prefix=f"{package}."):
-    importlib.import_module(fullname)
-    short = fullname[len(package) + 1 :].split(".", 1)[0]
-    if not short.startswith("_") and short not in __all__:
-        __all__.append(short)
+# Top-level command groups, mapped to their description and the modules that
+# register their actions. Modules are only imported once the group is used.
+COMMAND_MANIFEST = {
+    "bulk": (
+        "Bulk operations for various entities",
+        (
+            "mercury_cli.commands.bulk.bulk",
+            "mercury_cli.commands.bulk.create",
+            "mercury_cli.commands.bulk.modify",
+            "mercury_cli.commands.bulk.delete",
+            "mercury_cli.commands.bulk.export",
+        ),
+    ),
+    "automations": (
+        "Automation operations for various entities",
+        ("mercury_cli.commands.automations.automations",),
+    ),
+    "plugin": (
+        "Used to view and manage plugins",
+        ("mercury_cli.commands.misc.plugins",),
+    ),
+    "cache": (
+        "Manage the completion cache",
+        ("mercury_cli.commands.misc.cache",),
+    ),
+    "stats": (
+        "Show OCI-P request timings for this session",
+        ("mercury_cli.commands.misc.stats",),
+    ),
+}
+
+# Modules registering root-level actions, cheap enough to import straight away
+EAGER_MODULES = (
+    "mercury_cli.commands.misc.help",
+    "mercury_cli.commands.misc.utils",
+)
+
+for name, (display_meta, modules) in COMMAND_MANIFEST.items():
+    register_lazy_group(MERCURY_CLI.completer(), name, modules, display_meta)
+
+for module in EAGER_MODULES:
+    importlib.import_module(module)
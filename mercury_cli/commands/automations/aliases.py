@@ -0,0 +1,230 @@
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+
+DEFAULT_ALIAS_WORKERS = 4
+ALIAS_TTL = 600.0  # Seconds a group's crawled aliases stay cached
+
+# Entity types searched for aliases, with the SharedOperations method listing
+# each one's details. Same order as `find_alias`, which stops at the first match.
+ALIAS_ENTITIES = (
+    ("Call Center", "fetch_call_center_details"),
+    ("Hunt Group", "fetch_hunt_group_details"),
+    ("Auto Attendant", "fetch_auto_attendant_details"),
+    ("User", "fetch_user_details"),
+)
+
+ALIAS_COLUMNS = ("alias", "found", "entity_type", "entity_id", "group_id")
+
+# A crawled alias: the alias without its domain, the entity type and entity ID
+AliasRow = tuple[str, str, str]
+
+
+def alias_local_part(alias: str) -> str:
+    """
+    Returns an alias without its domain, the part `find_alias` matches on.
+    """
+    return alias.split("@", 1)[0].strip()
+
+
+def entity_type_of(entity: Any) -> str:
+    """
+    Names an entity's type from its response class, e.g. `Hunt Group`.
+
+    Args:
+        entity (Any): The entity `find_alias` matched.
+
+    Returns:
+        str: One of the `ALIAS_ENTITIES` type names.
+    """
+    name = type(entity).__name__
+    for entity_type, _ in ALIAS_ENTITIES[:-1]:
+        if entity_type.replace(" ", "") in name:
+            return entity_type
+    return ALIAS_ENTITIES[-1][0]
+
+
+def alias_candidates(entity: Any) -> list[str]:
+    """
+    Returns every alias assigned to an entity, as `find_alias` reads them.
+
+    Aliases sit either directly on the entity or in its service instance
+    profile, as a single string or a list.
+
+    Args:
+        entity (Any): A user, hunt group, call center or auto attendant response.
+
+    Returns:
+        list[str]: The entity's aliases, with their domains.
+    """
+    if hasattr(entity, "alias"):
+        raw = entity.alias
+    else:
+        profile = getattr(entity, "service_instance_profile", None)
+        raw = (
+            profile.get("alias")
+            if isinstance(profile, Mapping)
+            else getattr(profile, "alias", None)
+        )
+
+    if raw is None:
+        return []
+    if isinstance(raw, str):
+        return [raw]
+    if isinstance(raw, Iterable):
+        return [item for item in raw if isinstance(item, str)]
+    return []
+
+
+def crawl_group_aliases(
+    shared_ops: Any, service_provider_id: str, group_id: str
+) -> list[AliasRow]:
+    """
+    Fetches every alias in a group with the entity it belongs to.
+
+    Rows are in `find_alias` order, so the first entity holding an alias wins.
+
+    Args:
+        shared_ops (Any): Mercury `SharedOperations` for the session's client.
+        service_provider_id (str): The group's service provider.
+        group_id (str): The group to crawl.
+
+    Returns:
+        list[AliasRow]: One `(alias, entity type, entity ID)` row per alias.
+    """
+    rows = []
+    for entity_type, fetcher in ALIAS_ENTITIES:
+        entities = getattr(shared_ops, fetcher)(
+            service_provider_id=service_provider_id, group_id=group_id
+        )
+        for entity in entities or []:
+            entity_id = getattr(entity, "service_user_id", None) or getattr(
+                entity, "user_id", None
+            )
+            for alias in alias_candidates(entity):
+                rows.append(
+                    (alias_local_part(alias), entity_type, str(entity_id or ""))
+                )
+    return rows
+
+
+class AliasIndex:
+    """
+    Alias to entity lookup for one or more groups, built from crawled rows.
+
+    Resolving an alias is a dictionary lookup, so a file of thousands of
+    aliases costs one crawl per group rather than one crawl per alias. Where
+    an alias is assigned more than once, the first entity in `find_alias`
+    order is kept.
+    """
+
+    def __init__(self):
+        self._entries: dict[str, tuple[str, str, str]] = {}
+        self.groups = 0
+
+    def add(self, group_id: str, rows: Iterable[AliasRow]) -> None:
+        """
+        Adds a group's crawled rows to the index.
+
+        Args:
+            group_id (str): The group the rows came from.
+            rows (Iterable[AliasRow]): Rows produced by `crawl_group_aliases`.
+        """
+        self.groups += 1
+        for alias, entity_type, entity_id in rows:
+            self._entries.setdefault(alias, (entity_type, entity_id, group_id))
+
+    def resolve(self, alias: str) -> dict[str, Any]:
+        """
+        Looks up the entity behind an alias.
+
+        Args:
+            alias (str): The alias, with or without its domain.
+
+        Returns:
+            dict[str, Any]: A record keyed by `ALIAS_COLUMNS`.
+        """
+        match = self._entries.get(alias_local_part(alias))
+        entity_type, entity_id, group_id = match or ("", "", "")
+        return {
+            "alias": alias,
+            "found": match is not None,
+            "entity_type": entity_type,
+            "entity_id": entity_id,
+            "group_id": group_id,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def build_alias_index(
+    group_aliases: Callable[[str], list[AliasRow]],
+    group_ids: Iterable[str],
+    workers: int = DEFAULT_ALIAS_WORKERS,
+    on_group: Callable[[str, Exception | None], None] | None = None,
+) -> tuple[AliasIndex, list[tuple[str, str]]]:
+    """
+    Crawls many groups concurrently into one index.
+
+    Groups are added in the order given, so the same alias in two groups
+    resolves to the earlier group whichever crawl finishes first.
+
+    Args:
+        group_aliases (Callable[[str], list[AliasRow]]): Returns a group's rows, e.g. from the cache.
+        group_ids (Iterable[str]): The groups to index.
+        workers (int): Number of groups crawled concurrently.
+        on_group (Callable[[str, Exception | None], None] | None): Called as each group finishes.
+
+    Returns:
+        tuple[AliasIndex, list[tuple[str, str]]]: The index, and each group that
+        could not be crawled with its error.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    group_ids = list(group_ids)
+    crawled: dict[str, list[AliasRow]] = {}
+    failed: list[tuple[str, str]] = []
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="alias") as pool:
+        futures = {
+            pool.submit(group_aliases, group_id): group_id for group_id in group_ids
+        }
+        try:
+            for future in as_completed(futures):
+                group_id = futures[future]
+                try:
+                    crawled[group_id] = future.result()
+                    error = None
+                except Exception as e:  # noqa: BLE001
+                    failed.append((group_id, str(e)))
+                    error = e
+                if on_group:
+                    on_group(group_id, error)
+        finally:
+            for future in futures:
+                future.cancel()
+
+    index = AliasIndex()
+    for group_id in group_ids:
+        if group_id in crawled:
+            index.add(group_id, crawled[group_id])
+    return index, failed
+
+
+def resolve_aliases(
+    index: AliasIndex, aliases: Iterable[str]
+) -> Iterator[dict[str, Any]]:
+    """
+    Resolves every alias against an index, in one pass.
+
+    Args:
+        index (AliasIndex): The crawled groups.
+        aliases (Iterable[str]): The aliases to resolve.
+
+    Yields:
+        dict[str, Any]: One `AliasIndex.resolve` record per alias.
+    """
+    for alias in aliases:
+        yield index.resolve(alias)
@@ -2,17 +2,65 @@ from mercury_ocip.automate.user_digest import UserDetailsResult
 from mercury_ocip.automate.user_digest import UserDigestResult
 from mercury_cli.globals import MERCURY_CLI
 from action_completer import Empty
+from prompt_toolkit.completion import PathCompleter
+from mercury_cli.commands.automations.digest import (
+    DEFAULT_DIGEST_WORKERS,
+    DIGEST_COLUMNS,
+    digest_record,
+    run_user_digests,
+)
+from mercury_cli.commands.automations.aliases import (
+    ALIAS_COLUMNS,
+    ALIAS_TTL,
+    DEFAULT_ALIAS_WORKERS,
+    build_alias_index,
+    crawl_group_aliases,
+    entity_type_of,
+    resolve_aliases,
+)
+from mercury_cli.commands.automations.enterprise import (
+    AUDIT_COLUMNS,
+    AuditRollup,
+    DEFAULT_AUDIT_WORKERS,
+    audit_record,
+    run_enterprise_audit,
+)
+from mercury_cli.utils.options import parse_options
+from mercury_cli.utils.records import (
+    message_console,
+    open_records,
+    read_ids,
+    streams_to_stdout,
+)
+from mercury_cli.utils.response_cache import fresh_responses
 from mercury_cli.utils.service_group_id_callable import (
     _get_group_id_completions,
     _get_service_provider_id_completions,
+    get_group_ids,
 )
 from mercury_ocip.automate.base_automation import AutomationResult
+from mercury_ocip.utils.shared_operations import SharedOperations
+from mercury_ocip.commands.commands import (
+    UserGetListInGroupRequest,
+    UserGetListInGroupResponse,
+)
 
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeRemainingColumn,
+)
 from rich.table import Table
 from rich.panel import Panel
 from rich.tree import Tree
 from rich import box
 from rich.text import Text
+from datetime import datetime
+import json
+import os
 
 console = MERCURY_CLI.console()
 completer = MERCURY_CLI.completer()
@@ -419,8 +467,38 @@ def _format_audit_output(result: AutomationResult) -> None:
         )
 
 
+def _parse_output(options) -> dict | None:
+    """
+    Parses the `--output FORMAT|PATH` option of a single-result automation.
+
+    Prints the error and returns None if the options are invalid.
+    """
+    try:
+        return parse_options(options, {"output": str})
+    except ValueError as e:
+        console.print(f"✘ {e}", style="red")
+        return None
+
+
+def _write_record(target: str, record: dict, columns=None) -> None:
+    """
+    Writes a single automation record instead of rendering it.
+
+    Args:
+        target: The `--output` value, a format streamed to stdout or a file path.
+        record: The record to write.
+        columns: The record fields, in CSV column order.
+    """
+    with open_records(target, columns) as writer:
+        writer.write(record)
+    if not streams_to_stdout(target):
+        console.print(f"[dim]Written to {target}[/]")
+
+
 @completer.automations.action(
-    "group_audit", display_meta="Perform a comprehensive audit of a group"
+    "group_audit",
+    display_meta="Perform a comprehensive audit of a group",
+    capture_all=True,
 )
 @completer.param(
     _get_service_provider_id_completions,
@@ -428,14 +506,30 @@ def _format_audit_output(result: AutomationResult) -> None:
     cast=str,
 )
 @completer.param(_get_group_id_completions, display_meta="Group ID", cast=str)
-def _group_audit(service_provider_id: str, group_id: str):
+def _group_audit(service_provider_id: str, group_id: str, *options: str):
     """
     Perform a comprehensive audit of a group.
 
     Args:
         service_provider_id: The ID of the service provider.
         group_id: The ID of the group to audit.
+        *options: `--output FORMAT|PATH` to write the audit as a record instead.
     """
+    if (parsed := _parse_output(options)) is None:
+        return
+
+    if "output" in parsed:
+        try:
+            result = MERCURY_CLI.agent().automate.audit_group(
+                service_provider_id=service_provider_id, group_id=group_id
+            )
+            _write_record(
+                parsed["output"], audit_record(group_id, result), AUDIT_COLUMNS
+            )
+        except Exception as e:  # noqa: BLE001
+            message_console(console, parsed["output"]).print(f"✘ {e}", style="red")
+        return
+
     with console.status(
         "[cyan]Performing group audit...", spinner="dots", spinner_style="cyan"
     ) as status:
@@ -459,21 +553,186 @@ def _group_audit(service_provider_id: str, group_id: str):
             console.print(f"✘ {e}", style="red")
 
 
+def _format_enterprise_audit_output(summary: dict, service_provider_id: str) -> None:
+    """Format and display an enterprise audit rollup using Rich."""
+
+    console.print(
+        Panel(
+            Text("Enterprise Audit Report", style="header", justify="center"),
+            style="divider",
+        )
+    )
+
+    totals_table = Table(box=None, show_header=False, padding=(0, 2), expand=True)
+    totals_table.add_column(style="label", width=30)
+    totals_table.add_column(style="value")
+
+    totals_table.add_row("Service Provider ID", service_provider_id)
+    totals_table.add_row(
+        "Groups Audited",
+        f"{summary['groups'] - len(summary['failed_groups'])} / {summary['groups']}",
+    )
+    totals_table.add_row(
+        "User Count", f"{summary['user_count']} / {summary['user_limit']}"
+    )
+    totals_table.add_row("Total DNs", str(summary["dn_total"]))
+
+    console.print(
+        Panel(
+            totals_table,
+            title="[bold #d8bbff]Enterprise Totals[/]",
+            border_style="divider",
+        )
+    )
+
+    for name, title, column in (
+        ("group_services", "Group Services Authorization", "Service"),
+        ("service_packs", "Service Packs Authorization", "Service Pack"),
+        ("user_services", "User Services Authorization", "User Service"),
+    ):
+        if not summary["licences"][name]:
+            continue
+
+        table = Table(box=box.SIMPLE, show_header=True, expand=True)
+        table.add_column(column, style="label")
+        table.add_column("Count", style="value", justify="right")
+
+        for service, count in summary["licences"][name].items():
+            table.add_row(service, str(count))
+
+        console.print(
+            Panel(table, title=f"[bold #d8bbff]{title}[/]", border_style="divider")
+        )
+
+    if summary["failed_groups"]:
+        console.print(
+            f"✘ {len(summary['failed_groups'])} groups could not be audited:",
+            style="red",
+        )
+        for failed in summary["failed_groups"]:
+            console.print(f"  [yellow]{failed['group_id']}[/]: {failed['error']}")
+
+
 @completer.automations.action(
-    "user_digest", display_meta="Perform a comprehensive audit of a user"
+    "enterprise_audit",
+    display_meta="Audit every group in a service provider and roll up licences and DNs",
+    capture_all=True,
+)
+@completer.param(
+    _get_service_provider_id_completions,
+    display_meta="Service Provider ID",
+    cast=str,
+)
+def _enterprise_audit(service_provider_id: str, *options: str):
+    """
+    Audit every group in a service provider concurrently.
+
+    Each group's audit is written to a JSON lines file as it completes, and
+    the licence and DN totals across all groups are shown at the end and
+    written alongside it as `<output>.rollup.json`. With `--output FORMAT`
+    the group records are streamed to stdout instead, without the progress
+    bar or rollup.
+
+    Args:
+        service_provider_id: The ID of the service provider (or enterprise).
+        *options: `--workers N` and `--output FORMAT|PATH`.
+    """
+    try:
+        parsed = parse_options(options, {"workers": int, "output": str})
+    except ValueError as e:
+        console.print(f"✘ {e}", style="red")
+        return
+
+    output_path = parsed.get(
+        "output",
+        f"enterprise_audit_{service_provider_id}_{datetime.now():%Y%m%d-%H%M%S}.jsonl",
+    )
+    streaming = streams_to_stdout(output_path)
+    messages = message_console(console, output_path)
+    rollup = AuditRollup()
+
+    with Progress(
+        SpinnerColumn(style="cyan"),
+        TextColumn("[cyan]Auditing groups"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("[red]{task.fields[failed]} failed"),
+        TimeRemainingColumn(),
+        console=console,
+        transient=True,
+        disable=streaming,
+    ) as progress:
+        try:
+            group_ids = get_group_ids(service_provider_id, fresh=True)
+            task = progress.add_task("audit", total=len(group_ids), failed=0)
+
+            with open_records(output_path, AUDIT_COLUMNS) as writer:
+                for record in run_enterprise_audit(
+                    MERCURY_CLI.agent().automate.audit_group,
+                    service_provider_id,
+                    group_ids,
+                    workers=parsed.get("workers", DEFAULT_AUDIT_WORKERS),
+                    writer=writer,
+                ):
+                    rollup.add(record)
+                    progress.update(task, advance=1, failed=len(rollup.failed))
+
+            if streaming:
+                return
+
+            summary = rollup.summary()
+            with open(
+                f"{os.path.splitext(output_path)[0]}.rollup.json", "w", encoding="utf-8"
+            ) as file:
+                json.dump(summary, file, indent=2)
+
+            progress.stop()
+            _format_enterprise_audit_output(summary, service_provider_id)
+            console.print(f"[dim]Group audits written to {output_path}[/]")
+
+        except KeyboardInterrupt:
+            progress.stop()
+            messages.print(
+                f"✘ Interrupted after {rollup.groups} groups. Partial results in {output_path}",
+                style="red",
+            )
+
+        except Exception as e:  # noqa: BLE001
+            progress.stop()
+            messages.print(f"✘ {e}", style="red")
+
+
+@completer.automations.action(
+    "user_digest",
+    display_meta="Perform a comprehensive audit of a user",
+    capture_all=True,
 )
 @completer.param(
     Empty,
     display_meta="User ID",
     cast=str,
 )
-def _user_digest(user_id: str):
+def _user_digest(user_id: str, *options: str):
     """
     Perform a comprehensive audit of a user.
 
     Args:
         user_id: The ID of the user to audit.
+        *options: `--output FORMAT|PATH` to write the digest as a record instead.
     """
+    if (parsed := _parse_output(options)) is None:
+        return
+
+    if "output" in parsed:
+        try:
+            result = MERCURY_CLI.agent().automate.user_digest(user_id=user_id)
+            _write_record(
+                parsed["output"], digest_record(user_id, result), DIGEST_COLUMNS
+            )
+        except Exception as e:  # noqa: BLE001
+            message_console(console, parsed["output"]).print(f"✘ {e}", style="red")
+        return
+
     with console.status(
         "[cyan]Performing user digest...", spinner="dots", spinner_style="cyan"
     ) as status:
@@ -496,8 +755,149 @@ def _user_digest(user_id: str):
             console.print(f"✘ {e}", style="red")
 
 
+def _group_user_ids(service_provider_id: str, group_id: str) -> list[str]:
+    """
+    Fetches the IDs of every user in a group.
+    """
+    users: UserGetListInGroupResponse = MERCURY_CLI.client().command(
+        UserGetListInGroupRequest(
+            service_provider_id=service_provider_id, group_id=group_id
+        )
+    )
+    if getattr(users, "user_table", None) is None:
+        raise ValueError(
+            getattr(users, "summary", None) or f"No users found in '{group_id}'"
+        )
+    return [user.get("user_id", "") for user in users.user_table.to_dict()]
+
+
+def _run_user_digest_batch(user_ids: list[str], label: str, options) -> None:
+    """
+    Digests users concurrently, streaming one row per user to CSV or JSON lines.
+
+    Args:
+        user_ids: The users to digest.
+        label: Names the batch in the default output file, e.g. the group ID.
+        options: `--workers N` and `--output FORMAT|PATH`.
+    """
+    try:
+        parsed = parse_options(options, {"workers": int, "output": str})
+    except ValueError as e:
+        console.print(f"✘ {e}", style="red")
+        return
+
+    output_path = parsed.get(
+        "output", f"user_digest_{label}_{datetime.now():%Y%m%d-%H%M%S}.csv"
+    )
+    streaming = streams_to_stdout(output_path)
+    messages = message_console(console, output_path)
+    done = failed = 0
+
+    with Progress(
+        SpinnerColumn(style="cyan"),
+        TextColumn("[cyan]Digesting users"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("[red]{task.fields[failed]} failed"),
+        TimeRemainingColumn(),
+        console=console,
+        transient=True,
+        disable=streaming,
+    ) as progress:
+        task = progress.add_task("digest", total=len(user_ids), failed=0)
+        try:
+            with open_records(output_path, DIGEST_COLUMNS) as writer:
+                for record in run_user_digests(
+                    MERCURY_CLI.agent().automate.user_digest,
+                    user_ids,
+                    workers=parsed.get("workers", DEFAULT_DIGEST_WORKERS),
+                    writer=writer,
+                ):
+                    done += 1
+                    failed += not record["ok"]
+                    progress.update(task, advance=1, failed=failed)
+
+            if streaming:
+                return
+
+            progress.stop()
+            console.print(
+                f"{'✘' if failed else '✔'} Digested {done - failed} of {done} users"
+                f" ({failed} failed). Written to {output_path}",
+                style="red" if failed else "green",
+            )
+
+        except KeyboardInterrupt:
+            progress.stop()
+            messages.print(
+                f"✘ Interrupted after {done} users. Partial results in {output_path}",
+                style="red",
+            )
+
+        except Exception as e:  # noqa: BLE001
+            progress.stop()
+            messages.print(f"✘ {e}", style="red")
+
+
+completer.automations.user_digest_batch.display_meta = (
+    "Digest many users at once, to a CSV or JSON lines file"
+)
+
+
+@completer.automations.user_digest_batch.action(
+    "group", display_meta="Digest every user in a group", capture_all=True
+)
+@completer.param(
+    _get_service_provider_id_completions,
+    display_meta="Service Provider ID",
+    cast=str,
+)
+@completer.param(_get_group_id_completions, display_meta="Group ID", cast=str)
+def _user_digest_batch_group(service_provider_id: str, group_id: str, *options: str):
+    """
+    Digest every user in a group concurrently.
+
+    Args:
+        service_provider_id: The ID of the service provider.
+        group_id: The ID of the group whose users to digest.
+        *options: `--workers N` and `--output FORMAT|PATH`.
+    """
+    try:
+        user_ids = _group_user_ids(service_provider_id, group_id)
+    except Exception as e:  # noqa: BLE001
+        console.print(f"✘ {e}", style="red")
+        return
+    _run_user_digest_batch(user_ids, group_id, options)
+
+
+@completer.automations.user_digest_batch.action(
+    "file", display_meta="Digest the users listed in a file", capture_all=True
+)
+@completer.param(
+    source=PathCompleter(), display="file_path", display_meta="File of user IDs"
+)
+def _user_digest_batch_file(file_path: str, *options: str):
+    """
+    Digest the users listed in a file concurrently.
+
+    Args:
+        file_path: File of user IDs, one per line or in a CSV `user_id` column.
+        *options: `--workers N` and `--output FORMAT|PATH`.
+    """
+    try:
+        with open(file_path, "r", encoding="utf-8-sig") as file:
+            user_ids = read_ids(file, "user_id")
+    except OSError as e:
+        console.print(f"✘ Cannot read {file_path}: {e}", style="red")
+        return
+    label = os.path.splitext(os.path.basename(file_path))[0]
+    _run_user_digest_batch(user_ids, label, options)
+
+
 @completer.automations.action(
-    "find_alias", display_meta="Find the given entity behind an alias"
+    "find_alias",
+    display_meta="Find the given entity behind an alias",
+    capture_all=True,
 )
 @completer.param(
     _get_service_provider_id_completions,
@@ -506,13 +906,44 @@ def _user_digest(user_id: str):
 )
 @completer.param(_get_group_id_completions, display_meta="Group ID", cast=str)
 @completer.param(Empty, display="alias", display_meta="Alias Number", cast=str)
-def _find_alias(service_provider_id: str, group_id: str, alias: str):
+def _find_alias(service_provider_id: str, group_id: str, alias: str, *options: str):
     """
     Find the entity behind a given alias.
 
     Args:
         alias_name: The name of the alias to look up.
+        *options: `--output FORMAT|PATH` to write the result as a record instead.
     """
+    if (parsed := _parse_output(options)) is None:
+        return
+
+    if "output" in parsed:
+        try:
+            result = MERCURY_CLI.agent().automate.find_alias(
+                group_id=group_id,
+                service_provider_id=service_provider_id,
+                alias=alias,
+            )
+            entity = result.payload.entity if result and result.ok else None
+            _write_record(
+                parsed["output"],
+                {
+                    "alias": alias,
+                    "found": entity is not None,
+                    "entity_type": entity_type_of(entity) if entity else "",
+                    "entity_id": (
+                        getattr(entity, "service_user_id", None)
+                        or getattr(entity, "user_id", None)
+                        or ""
+                    ),
+                    "group_id": group_id if entity else "",
+                },
+                ALIAS_COLUMNS,
+            )
+        except Exception as e:  # noqa: BLE001
+            message_console(console, parsed["output"]).print(f"✘ {e}", style="red")
+        return
+
     with console.status(
         "[cyan]Looking up alias...", spinner="dots", spinner_style="cyan"
     ) as status:
@@ -541,3 +972,186 @@ def _find_alias(service_provider_id: str, group_id: str, alias: str):
         except Exception as e:
             status.stop()
             console.print(f"✘ {e}", style="red")
+
+
+def _group_aliases(service_provider_id: str, group_id: str, fresh: bool = False):
+    """
+    Returns a group's crawled alias rows, from the cache unless `fresh`.
+
+    The rows are kept in memory only: the on-disk completion index would sort
+    them and serve them after `ALIAS_TTL` in a later session.
+    """
+    key = ("aliases", service_provider_id, group_id)
+
+    def _crawl():
+        return crawl_group_aliases(
+            SharedOperations(MERCURY_CLI.client()), service_provider_id, group_id
+        )
+
+    if not fresh:
+        return MERCURY_CLI.cache().get_or_fetch(
+            key, _crawl, ttl=ALIAS_TTL, persist=False
+        )
+
+    MERCURY_CLI.cache().invalidate(key)
+    with fresh_responses():
+        return MERCURY_CLI.cache().get_or_fetch(
+            key, _crawl, ttl=ALIAS_TTL, persist=False
+        )
+
+
+def _run_find_alias_batch(
+    service_provider_id: str, group_ids: list[str], file_path: str, label: str, options
+) -> None:
+    """
+    Indexes the aliases of every given group, then resolves a file of aliases against it.
+
+    Args:
+        service_provider_id: The ID of the service provider.
+        group_ids: The groups to index.
+        file_path: File of aliases, one per line or in a CSV `alias` column.
+        label: Names the run in the default output file, e.g. the group ID.
+        options: `--workers N`, `--output FORMAT|PATH` and `--fresh`.
+    """
+    try:
+        parsed = parse_options(options, {"workers": int, "output": str, "fresh": bool})
+        with open(file_path, "r", encoding="utf-8-sig") as file:
+            aliases = read_ids(file, "alias")
+    except ValueError as e:
+        console.print(f"✘ {e}", style="red")
+        return
+    except OSError as e:
+        console.print(f"✘ Cannot read {file_path}: {e}", style="red")
+        return
+
+    output_path = parsed.get(
+        "output", f"find_alias_{label}_{datetime.now():%Y%m%d-%H%M%S}.csv"
+    )
+    fresh = parsed.get("fresh", False)
+    streaming = streams_to_stdout(output_path)
+    messages = message_console(console, output_path)
+
+    with Progress(
+        SpinnerColumn(style="cyan"),
+        TextColumn("[cyan]Indexing aliases"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("[red]{task.fields[failed]} failed"),
+        TimeRemainingColumn(),
+        console=console,
+        transient=True,
+        disable=streaming,
+    ) as progress:
+        task = progress.add_task("index", total=len(group_ids), failed=0)
+        failures = 0
+
+        def _on_group(group_id, error):
+            nonlocal failures
+            failures += error is not None
+            progress.update(task, advance=1, failed=failures)
+
+        try:
+            index, failed_groups = build_alias_index(
+                lambda group_id: _group_aliases(service_provider_id, group_id, fresh),
+                group_ids,
+                workers=parsed.get("workers", DEFAULT_ALIAS_WORKERS),
+                on_group=_on_group,
+            )
+        except KeyboardInterrupt:
+            progress.stop()
+            messages.print("✘ Interrupted while indexing aliases", style="red")
+            return
+        except Exception as e:  # noqa: BLE001
+            progress.stop()
+            messages.print(f"✘ {e}", style="red")
+            return
+
+    for group_id, error in failed_groups:
+        messages.print(f"  [yellow]{group_id}[/]: {error}")
+
+    found = 0
+    try:
+        with open_records(output_path, ALIAS_COLUMNS) as writer:
+            for record in resolve_aliases(index, aliases):
+                writer.write(record)
+                found += record["found"]
+    except OSError as e:
+        messages.print(f"✘ Cannot write {output_path}: {e}", style="red")
+        return
+
+    if streaming:
+        return
+
+    missing = len(aliases) - found
+    console.print(
+        f"{'✘' if missing else '✔'} Found {found} of {len(aliases)} aliases"
+        f" across {index.groups} groups ({missing} not found)."
+        f" Written to {output_path}",
+        style="red" if missing else "green",
+    )
+
+
+completer.automations.find_alias_batch.display_meta = (
+    "Resolve a file of aliases against a group or enterprise alias index"
+)
+
+
+@completer.automations.find_alias_batch.action(
+    "group", display_meta="Resolve aliases against one group", capture_all=True
+)
+@completer.param(
+    _get_service_provider_id_completions,
+    display_meta="Service Provider ID",
+    cast=str,
+)
+@completer.param(_get_group_id_completions, display_meta="Group ID", cast=str)
+@completer.param(
+    source=PathCompleter(), display="file_path", display_meta="File of aliases"
+)
+def _find_alias_batch_group(
+    service_provider_id: str, group_id: str, file_path: str, *options: str
+):
+    """
+    Resolve a file of aliases against every entity in a group.
+
+    Args:
+        service_provider_id: The ID of the service provider.
+        group_id: The ID of the group to index.
+        file_path: File of aliases, one per line or in a CSV `alias` column.
+        *options: `--workers N`, `--output FORMAT|PATH` and `--fresh`.
+    """
+    _run_find_alias_batch(service_provider_id, [group_id], file_path, group_id, options)
+
+
+@completer.automations.find_alias_batch.action(
+    "enterprise",
+    display_meta="Resolve aliases against every group in a service provider",
+    capture_all=True,
+)
+@completer.param(
+    _get_service_provider_id_completions,
+    display_meta="Service Provider ID",
+    cast=str,
+)
+@completer.param(
+    source=PathCompleter(), display="file_path", display_meta="File of aliases"
+)
+def _find_alias_batch_enterprise(
+    service_provider_id: str, file_path: str, *options: str
+):
+    """
+    Resolve a file of aliases against every entity in a service provider.
+
+    Args:
+        service_provider_id: The ID of the service provider (or enterprise).
+        file_path: File of aliases, one per line or in a CSV `alias` column.
+        *options: `--workers N`, `--output FORMAT|PATH` and `--fresh`.
+    """
+    try:
+        group_ids = get_group_ids(service_provider_id, fresh=True)
+    except Exception as e:  # noqa: BLE001
+        console.print(f"✘ {e}", style="red")
+        return
+    _run_find_alias_batch(
+        service_provider_id, group_ids, file_path, service_provider_id, options
+    )
@@ -0,0 +1,142 @@
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+
+from mercury_cli.utils.records import RecordWriter
+
+DEFAULT_DIGEST_WORKERS = 4
+
+# Columns of a digest record, in the order they are written to CSV
+DIGEST_COLUMNS = (
+    "user_id",
+    "ok",
+    "error",
+    "first_name",
+    "last_name",
+    "service_provider_id",
+    "group_id",
+    "phone_number",
+    "extension",
+    "calling_line_id",
+    "dnd",
+    "forwards",
+    "voicemail_forwards",
+    "devices",
+    "registered_devices",
+    "call_centers",
+    "hunt_groups",
+    "pickup_group",
+)
+
+
+def _join(values: Iterable[Any]) -> str:
+    return ";".join(str(value) for value in values if value)
+
+
+def digest_record(user_id: str, result: Any) -> dict[str, Any]:
+    """
+    Flattens a user digest result into one row.
+
+    Lists (active forwards, devices, memberships) are joined with `;` so the
+    row fits a CSV as well as a JSON line.
+
+    Args:
+        user_id (str): The digested user.
+        result (Any): The `AutomationResult` returned by `automate.user_digest`.
+
+    Returns:
+        dict[str, Any]: The record, keyed by `DIGEST_COLUMNS`.
+    """
+    record: dict[str, Any] = dict.fromkeys(DIGEST_COLUMNS, "")
+    record["user_id"] = user_id
+
+    if not result.ok or result.payload is None:
+        record.update(ok=False, error=result.message)
+        return record
+
+    digest = result.payload
+    details = digest.user_details
+    info = details.user_info if details else None
+    forwards = details.forwards if details else None
+    devices = (details.devices if details else None) or []
+
+    record.update(
+        ok=True,
+        first_name=getattr(info, "first_name", "") or "",
+        last_name=getattr(info, "last_name", "") or "",
+        service_provider_id=getattr(info, "service_provider_id", "") or "",
+        group_id=getattr(info, "group_id", "") or "",
+        phone_number=getattr(info, "phone_number", "") or "",
+        extension=getattr(info, "extension", "") or "",
+        calling_line_id=getattr(info, "calling_line_id_phone_number", "") or "",
+        dnd=str(getattr(details, "dnd_status", "")) == "true",
+        forwards=_join(
+            f"{fwd.variant}:{fwd.forward_to_phone_number or ''}".rstrip(":")
+            for fwd in (getattr(forwards, "user_forwarding", None) or [])
+            if str(fwd.is_active) == "true"
+        ),
+        voicemail_forwards=_join(
+            fwd.variant
+            for fwd in (getattr(forwards, "voicemail_forwarding", None) or [])
+            if str(fwd.is_active) == "true"
+        ),
+        devices=_join(device.device_name for device in devices),
+        registered_devices=_join(
+            device.device_name
+            for device in devices
+            if str(device.is_registered) in ("True", "true")
+        ),
+        call_centers=_join(
+            cc.call_center_id for cc in (digest.call_center_membership or [])
+        ),
+        hunt_groups=_join(
+            hg.hunt_group_id for hg in (digest.hunt_group_membership or [])
+        ),
+        pickup_group=getattr(
+            digest.call_pickup_group_membership, "call_pickup_group_name", ""
+        )
+        or "",
+    )
+    return record
+
+
+def run_user_digests(
+    user_digest: Callable[..., Any],
+    user_ids: Iterable[str],
+    workers: int = DEFAULT_DIGEST_WORKERS,
+    writer: RecordWriter | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Digests many users concurrently, yielding each record as it completes.
+
+    Args:
+        user_digest (Callable[..., Any]): The digest automation, i.e. `agent().automate.user_digest`.
+        user_ids (Iterable[str]): The users to digest.
+        workers (int): Number of users digested concurrently.
+        writer (RecordWriter | None): Where each record is written as it completes.
+
+    Yields:
+        dict[str, Any]: One `digest_record` per user, in completion order.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    def _digest(user_id: str) -> dict[str, Any]:
+        try:
+            return digest_record(user_id, user_digest(user_id=user_id))
+        except Exception as e:  # noqa: BLE001
+            record = dict.fromkeys(DIGEST_COLUMNS, "")
+            record.update(user_id=user_id, ok=False, error=str(e))
+            return record
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="digest") as pool:
+        futures = [pool.submit(_digest, user_id) for user_id in user_ids]
+        try:
+            for future in as_completed(futures):
+                record = future.result()
+                if writer:
+                    writer.write(record)
+                yield record
+        finally:
+            for future in futures:
+                future.cancel()
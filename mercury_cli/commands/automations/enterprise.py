@@ -0,0 +1,182 @@
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+
+from mercury_cli.utils.records import RecordWriter
+
+DEFAULT_AUDIT_WORKERS = 4
+
+# Fields of a group audit record, in CSV column order
+AUDIT_COLUMNS = (
+    "group_id",
+    "ok",
+    "error",
+    "group_name",
+    "user_count",
+    "user_limit",
+    "licences",
+    "dn_total",
+    "dns",
+)
+
+LICENCE_TABLES = {
+    "group_services": "group_services_authorization_table",
+    "service_packs": "service_packs_authorization_table",
+    "user_services": "user_services_authorization_table",
+}
+
+
+def _to_int(value: Any) -> int | None:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _failed_record(group_id: str, error: Any) -> dict[str, Any]:
+    """
+    Returns the record of a group that could not be audited, other fields blank.
+    """
+    record: dict[str, Any] = dict.fromkeys(AUDIT_COLUMNS, "")
+    record.update(group_id=group_id, ok=False, error=error)
+    return record
+
+
+def audit_record(group_id: str, result: Any) -> dict[str, Any]:
+    """
+    Reduces a group audit result to a serialisable record.
+
+    Args:
+        group_id (str): The audited group.
+        result (Any): The `AutomationResult` returned by `automate.audit_group`.
+
+    Returns:
+        dict[str, Any]: The record, keyed by `AUDIT_COLUMNS`: the group's
+        details, licence usage per table and DNs.
+    """
+    if not result.ok or result.payload is None:
+        return _failed_record(group_id, result.message)
+
+    audit = result.payload
+    details = audit.group_details
+    breakdown = audit.license_breakdown
+
+    return {
+        "group_id": group_id,
+        "ok": True,
+        "error": "",
+        "group_name": getattr(details, "group_name", None),
+        "user_count": _to_int(getattr(details, "user_count", None)),
+        "user_limit": _to_int(getattr(details, "user_limit", None)),
+        "licences": {
+            name: dict(getattr(breakdown, attribute, None) or {})
+            for name, attribute in LICENCE_TABLES.items()
+        },
+        "dn_total": audit.group_dns.total if audit.group_dns else 0,
+        "dns": sorted(audit.group_dns.numbers) if audit.group_dns else [],
+    }
+
+
+class AuditRollup:
+    """
+    Aggregates group audit records into an enterprise-wide licence and DN rollup.
+
+    Only totals are kept, so memory does not grow with the number of groups
+    beyond the list of those that failed.
+    """
+
+    def __init__(self):
+        self.groups = 0
+        self.failed: list[dict[str, Any]] = []
+        self.user_count = 0
+        self.user_limit = 0
+        self.dn_total = 0
+        self.licences: dict[str, Counter] = {name: Counter() for name in LICENCE_TABLES}
+
+    def add(self, record: dict[str, Any]) -> None:
+        """
+        Adds one group's record to the totals.
+
+        Args:
+            record (dict[str, Any]): A record produced by `audit_record`.
+        """
+        self.groups += 1
+        if not record["ok"]:
+            self.failed.append(
+                {"group_id": record["group_id"], "error": record["error"]}
+            )
+            return
+
+        self.user_count += record["user_count"] or 0
+        self.user_limit += record["user_limit"] or 0
+        self.dn_total += record["dn_total"]
+        for name, table in record["licences"].items():
+            for service, usage in table.items():
+                count = _to_int(usage)
+                if count is not None:
+                    self.licences[name][service] += count
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Returns the rollup as a serialisable dictionary.
+        """
+        return {
+            "groups": self.groups,
+            "failed_groups": self.failed,
+            "user_count": self.user_count,
+            "user_limit": self.user_limit,
+            "dn_total": self.dn_total,
+            "licences": {
+                name: dict(sorted(counter.items()))
+                for name, counter in self.licences.items()
+            },
+        }
+
+
+def run_enterprise_audit(
+    audit_group: Callable[..., Any],
+    service_provider_id: str,
+    group_ids: Iterable[str],
+    workers: int = DEFAULT_AUDIT_WORKERS,
+    writer: RecordWriter | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Audits many groups concurrently, yielding each record as it completes.
+
+    Records are yielded (and written by `writer`) in completion order, so a
+    slow group never holds up the rest.
+
+    Args:
+        audit_group (Callable[..., Any]): The audit automation, i.e. `agent().automate.audit_group`.
+        service_provider_id (str): The enterprise or service provider the groups belong to.
+        group_ids (Iterable[str]): The groups to audit.
+        workers (int): Number of groups audited concurrently.
+        writer (RecordWriter | None): Where each record is written as it completes.
+
+    Yields:
+        dict[str, Any]: One `audit_record` per group.
+    """
+    if workers < 1:
+        raise ValueError("workers must be at least 1")
+
+    def _audit(group_id: str) -> dict[str, Any]:
+        try:
+            result = audit_group(
+                service_provider_id=service_provider_id, group_id=group_id
+            )
+            return audit_record(group_id, result)
+        except Exception as e:  # noqa: BLE001
+            return _failed_record(group_id, str(e))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="audit") as pool:
+        futures = [pool.submit(_audit, group_id) for group_id in group_ids]
+        try:
+            for future in as_completed(futures):
+                record = future.result()
+                if writer:
+                    writer.write(record)
+                yield record
+        finally:
+            for future in futures:
+                future.cancel()
@@ -0,0 +1,186 @@
+import time
+from collections.abc import Callable
+from typing import Any
+from xml.sax.saxutils import escape
+
+from lxml import etree
+from mercury_ocip.exceptions import MError
+
+from mercury_cli.utils.client_pool import ClientPool, session_expired
+from mercury_cli.utils.instrumentation import InstrumentedClient
+from mercury_cli.utils.response_cache import is_read_only
+
+XSI_NAMESPACE = "http://www.w3.org/2001/XMLSchema-instance"
+
+
+def supports_batching(client: Any) -> bool:
+    """
+    Checks whether a client can send several commands in one request document.
+
+    Only the SOAP requester is supported: the TCP requester frames exactly one
+    command per document.
+
+    Args:
+        client (Any): The Mercury client (or an `InstrumentedClient` around one).
+
+    Returns:
+        bool: True if `send_batch` can be used with the client.
+    """
+    return getattr(client, "conn_type", None) == "SOAP"
+
+
+def _strip_declaration(xml: str) -> str:
+    xml = xml.strip()
+    if xml.startswith("<?xml"):
+        xml = xml.split("?>", 1)[1].strip()
+    return xml
+
+
+def build_batch_document(session_id: str, commands: list[str]) -> bytes:
+    """
+    Builds one OCI-P BroadsoftDocument holding several commands.
+
+    Mirrors `BaseRequester.build_oci_xml`, which only ever wraps one command.
+
+    Args:
+        session_id (str): The session the commands run in.
+        commands (list[str]): Each command's `<command>` XML, as produced by `to_xml()`.
+
+    Returns:
+        bytes: The serialised document, encoded as ISO-8859-1.
+    """
+    # The session, like each command, sits outside the document's default
+    # namespace, i.e. `<sessionId xmlns="">`, as the server expects
+    wrapper = etree.fromstring(
+        (
+            f'<_wrap xmlns:xsi="{XSI_NAMESPACE}">'
+            + f'<sessionId xmlns="">{escape(session_id)}</sessionId>'
+            + "".join(_strip_declaration(command) for command in commands)
+            + "</_wrap>"
+        ).encode("ISO-8859-1")
+    )
+
+    document = etree.Element(
+        "{C}BroadsoftDocument", nsmap={None: "C", "xsi": XSI_NAMESPACE}
+    )
+    document.set("protocol", "OCI")
+    document.extend(list(wrapper))
+
+    return etree.tostring(document, xml_declaration=True, encoding="ISO-8859-1")
+
+
+def split_batch_response(response: str) -> list[str]:
+    """
+    Splits a multi-command response into one single-command document per command.
+
+    Each document keeps the original root and session, so it can be parsed by
+    the client exactly like the response to a single request.
+
+    Args:
+        response (str): The raw response document.
+
+    Returns:
+        list[str]: One response document per command, in request order.
+    """
+    root = etree.fromstring(_strip_declaration(response))
+    session = next((child for child in root if child.tag == "sessionId"), None)
+
+    documents = []
+    for command in (child for child in root if child.tag == "command"):
+        document = etree.Element(root.tag, attrib=dict(root.attrib), nsmap=root.nsmap)
+        if session is not None:
+            document.append(_copy(session))
+        document.append(_copy(command))
+        documents.append(etree.tostring(document, encoding="unicode"))
+    return documents
+
+
+def _copy(element: etree._Element) -> etree._Element:
+    return etree.fromstring(etree.tostring(element))
+
+
+def send_batch(client: Any, commands: list[Any]) -> list[Any]:
+    """
+    Executes several commands in a single round trip.
+
+    Args:
+        client (Any): A SOAP client (see `supports_batching`), or a pool of them.
+        commands (list[Any]): The OCI-P commands to execute, in order.
+
+    Returns:
+        list[Any]: The parsed response for each command, in order. Commands the
+        server rejected come back as an `ErrorResponse`, like `client.command`.
+
+    Raises:
+        MError: If the request could not be sent or the response does not hold
+            one result per command.
+    """
+    pool = client.wrapped if isinstance(client, InstrumentedClient) else client
+    if isinstance(pool, ClientPool):  # Send on one of its sessions, under its governor
+        return pool.run(
+            lambda member: _send_batch(client, member, commands, pool.relogin),
+            all(is_read_only(command) for command in commands),
+        )
+    return _send_batch(client, client, commands)
+
+
+def _send_batch(
+    recorder: Any,
+    client: Any,
+    commands: list[Any],
+    relogin: Callable[[Any], None] | None = None,
+) -> list[Any]:
+    """
+    Sends a batch on one client, recording it on `recorder` if instrumented.
+
+    If the server says the session has expired, the client is logged in again
+    with `relogin` and the batch sent once more, as `ClientPool.command` does.
+    """
+    responses = _exchange(recorder, client, commands)
+    if relogin and responses and session_expired(responses[0]):
+        relogin(client)
+        responses = _exchange(recorder, client, commands)
+
+    if len(responses) != len(commands):
+        raise MError(
+            f"Batch of {len(commands)} commands returned {len(responses)} results"
+        )
+    return responses
+
+
+def _exchange(recorder: Any, client: Any, commands: list[Any]) -> list[Any]:
+    """
+    Sends one batch document and parses each command's response.
+    """
+    if not client.authenticated:
+        client.authenticate()
+
+    requester = client._requester
+    if requester.zclient is None and isinstance(error := requester.connect(), MError):
+        raise error
+
+    payload = build_batch_document(
+        requester.session_id, [command.to_xml() for command in commands]
+    )
+
+    responses = getattr(recorder, "responses", None)
+    started = time.monotonic()
+    response = ""
+    try:
+        if responses is None:
+            response = requester.zclient.service.processOCIMessage(payload)
+        else:
+            with responses.changing(commands):
+                response = requester.zclient.service.processOCIMessage(payload)
+        documents = split_batch_response(response)
+    finally:
+        if isinstance(recorder, InstrumentedClient):
+            recorder.record(
+                f"{type(commands[0]).__name__} (batch)",
+                time.monotonic() - started,
+                request_bytes=len(payload),
+                response_bytes=len(response or ""),
+                error=not response,
+            )
+
+    return [client._receive_response(document) for document in documents]
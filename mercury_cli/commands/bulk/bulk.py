@@ -1,5 +1,37 @@
 from mercury_cli.globals import MERCURY_CLI
+from mercury_cli.commands.bulk.engine import (
+    BulkEngine,
+    BulkTally,
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_HOST_LIMIT,
+    DEFAULT_WORKERS,
+    MAX_REPORTED_FAILURES,
+    UNCHANGED,
+    read_csv_rows,
+)
+from mercury_cli.commands.bulk.diff import BulkDiff, changed_fields
+from mercury_cli.commands.bulk.journal import BulkJournal
+from mercury_cli.commands.bulk.preflight import Preflight, PreflightReport
+from mercury_cli.utils.options import parse_options
+from mercury_cli.utils.records import (
+    message_console,
+    open_records,
+    streams_to_stdout,
+)
+from action_completer.types import Action, ActionParam
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+    TimeRemainingColumn,
+)
+from contextlib import nullcontext
+from collections.abc import Iterable
 import traceback
+import json
 import os
 
 completer = MERCURY_CLI.completer()
@@ -7,19 +39,66 @@ console = MERCURY_CLI.console()
 
 completer.bulk.display_meta = "Bulk operations for various entities"
 
+# Maps each bulk method on agent().bulk to the entity handler that implements it
+BULK_HANDLERS = {
+    "create_hunt_group_from_csv": "hunt_group",
+    "create_call_pickup_from_csv": "call_pickup",
+    "create_call_center_from_csv": "call_center",
+    "create_auto_attendant_from_csv": "auto_attendant",
+    "create_user_from_csv": "users",
+    "create_group_admin_from_csv": "administrator",
+    "create_service_provider_admin_from_csv": "administrator",
+    "modify_call_center_agent_list_from_csv": "call_center",
+    "modify_user_from_csv": "users",
+    "modify_group_admin_policy_from_csv": "administrator",
+    "modify_service_provider_admin_policy_from_csv": "administrator",
+    "delete_group_admin_from_csv": "administrator",
+    "delete_service_provider_admin_from_csv": "administrator",
+}
+
+# Options accepted after the file path, e.g. `bulk create user users.csv --workers 8`
+BULK_OPTIONS = {
+    "workers": int,
+    "host_limit": int,
+    "chunk_size": int,
+    "batch_size": int,
+    "results": str,
+    "summary": str,
+    "output": str,
+    "validate_only": bool,
+    "diff": bool,
+    "dry_run": bool,
+}
+
+# Columns of a row record written by `--output`, in CSV order
+BULK_RECORD_COLUMNS = ("index", "success", "response", "detail", "error", "data")
+
 
 def _cli_wrap_verification(bulk_command: str, entity_name: str, **kwargs):
     """
-    Wrapper to handle bulk CSV operations with spinner and error handling.
+    Wrapper to handle bulk CSV operations with live progress and error handling.
+
+    Rows are streamed from the CSV and executed by the BulkEngine across a
+    worker pool. Each result is tallied and appended to a JSON lines results
+    file as it completes (next to the CSV unless `--results` is given), so
+    memory use does not depend on the size of the file. Completed rows are
+    also journalled so an interrupted job can be picked up with `bulk resume`.
 
     Args:
         bulk_command: The bulk method name to call on the bulk object.
         entity_name: The name of the entity being processed (for display purposes).
-        **kwargs: Additional keyword arguments, expects 'file_path'.
+        **kwargs: Additional keyword arguments, expects 'file_path' and optionally
+            'options', the extra `--option value` fragments given after it.
     """
 
     file_path = kwargs.get("file_path")
 
+    try:
+        options = parse_options(kwargs.get("options", ()), BULK_OPTIONS)
+    except ValueError as e:
+        console.print(f"✘ {e}", style="red")
+        return
+
     # Validate file before starting spinner
     if not file_path.lower().endswith(".csv"):
         console.print("✘ Provided file is not a CSV.", style="red")
@@ -29,26 +108,130 @@ def _cli_wrap_verification(bulk_command: str, entity_name: str, **kwargs):
         console.print(f"✘ File not found: {file_path}", style="red")
         return
 
-    with console.status(
-        "[cyan]Processing CSV...", spinner="dots", spinner_style="cyan"
-    ) as status:
+    if options.get("validate_only"):
+        handler = getattr(MERCURY_CLI.agent().bulk, BULK_HANDLERS.get(bulk_command, ""))
+        report = Preflight.for_handler(handler).check(read_csv_rows(file_path))
+        _print_preflight(report)
+        return
+
+    journal = BulkJournal.create(bulk_command, entity_name, file_path, options)
+    _run_bulk(journal, options)
+
+
+def _run_bulk(journal: BulkJournal, options: dict, retry_failed: bool = False):
+    """
+    Executes (or resumes) the bulk job described by a journal and prints a summary.
+
+    Args:
+        journal: The job's journal. Rows it already records are skipped.
+        options: The parsed bulk options for this run.
+        retry_failed: If True, rows the journal records as failed are run again.
+    """
+    bulk_command = journal.header["bulk_command"]
+    entity_name = journal.header["entity_name"]
+    file_path = journal.header["file_path"]
+    skip = journal.skip_indexes(retry_failed=retry_failed)
+    output = options.get("output")
+    streaming = streams_to_stdout(output)
+    messages = message_console(console, output)
+
+    if not streaming:
+        console.print(f"[dim]Bulk job {journal.job_id}[/]")
+
+    dry_run = options.get("dry_run", False)
+    unchanged = 0
+    changes = []
+
+    tally = None
+    progress = _bulk_progress(disable=streaming)
+    with progress, journal:
         try:
             bulk_obj = MERCURY_CLI.agent().bulk
 
-            bulk_method = getattr(bulk_obj, bulk_command, None)
+            handler = getattr(bulk_obj, BULK_HANDLERS.get(bulk_command, ""), None)
 
-            if not bulk_method:
+            if not handler:
                 raise ValueError(f"Bulk method {bulk_command} not found.")
 
-            output = bulk_method(file_path)
+            differ = (
+                BulkDiff(
+                    handler,
+                    workers=options.get("workers", DEFAULT_WORKERS),
+                    chunk_size=options.get("chunk_size", DEFAULT_CHUNK_SIZE),
+                )
+                if options.get("diff")
+                else None
+            )
+
+            engine = BulkEngine(
+                differ.handler if differ else handler,
+                workers=options.get("workers", DEFAULT_WORKERS),
+                host=MERCURY_CLI.client().host,
+                host_limit=options.get("host_limit", DEFAULT_HOST_LIMIT),
+                chunk_size=options.get("chunk_size", DEFAULT_CHUNK_SIZE),
+                batch_size=options.get("batch_size", DEFAULT_BATCH_SIZE),
+            )
+
+            results_path = options.get(
+                "results", f"{os.path.splitext(file_path)[0]}.results.jsonl"
+            )
+
+            report = Preflight.for_handler(handler).check(read_csv_rows(file_path))
+            if not streaming:
+                progress.console.print(_preflight_summary(report))
+
+            task = progress.add_task(
+                f"Processing {entity_name}",
+                total=max(report.rows - len(skip), 0),
+                **_progress_fields(None),
+            )
+
+            if retry_failed:
+                _drop_results(results_path, journal.failed_indexes())
+
+            records = (  # A resumed job adds to the records it already wrote
+                open_records(output, BULK_RECORD_COLUMNS, append=bool(skip))
+                if output
+                else nullcontext()
+            )
+            with (
+                open(
+                    results_path, "a" if skip else "w", encoding="utf-8"
+                ) as results_file,
+                records as writer,
+            ):
+                tally = BulkTally(results_file)
+                rows = report.screen(
+                    engine.parse_rows(read_csv_rows(file_path), skip=skip)
+                )
+                if differ:
+                    rows = differ.rows(rows)
+                for result in engine.run(rows, dry_run=dry_run):
+                    record = tally.add(result)
+                    journal.record(record)
+                    if writer:
+                        writer.write(record)
+                    if differ and record["success"]:
+                        if record.get("response") == UNCHANGED:
+                            unchanged += 1
+                        elif len(changes) < MAX_REPORTED_FAILURES:
+                            changes.append(record)
+                    progress.update(task, advance=1, **_progress_fields(tally))
 
-            success_count = sum(1 for result in output if result.get("success", False))
-            failed_rows = [
-                result for result in output if not result.get("success", False)
-            ]
-            failure_count = len(output) - success_count
+            success_count = tally.success_count
+            failed_rows = tally.failed_rows
+            failure_count = tally.failure_count
 
-            status.stop()
+            progress.stop()
+            _write_summary(journal, options, tally, skip, "completed")
+
+            if streaming:
+                return
+
+            if skip:
+                console.print(
+                    f"[dim]Skipped {len(skip)} rows completed by a previous run.[/]"
+                )
 
             if failure_count == 0:
                 console.print(
@@ -80,8 +263,243 @@ def _cli_wrap_verification(bulk_command: str, entity_name: str, **kwargs):
                     if detail_msg:
                         console.print(f"    [red]Detail:[/] {detail_msg}")
 
+                if failure_count > len(failed_rows):
+                    console.print(
+                        f"\n  [dim]... and {failure_count - len(failed_rows)} more failed rows.[/]"
+                    )
+
+            if differ:
+                _print_changes(changes, unchanged, entity_name, dry_run)
+            elif dry_run:
+                console.print("[dim]Dry run, nothing was sent.[/]")
+
+            console.print(f"[dim]{_format_rate(tally)}[/]")
+            console.print(f"[dim]Results written to {results_path}[/]")
+
+        except KeyboardInterrupt:
+            progress.stop()
+            _write_summary(journal, options, tally, skip, "interrupted")
+            messages.print(
+                f"✘ Interrupted. Resume with: bulk resume {journal.job_id}",
+                style="red",
+            )
+
         except Exception as e:
-            status.stop()
+            progress.stop()
             error_details = traceback.format_exc()
-            console.print(f"✘ Error processing CSV: {str(e)}", style="red")
-            console.print(f"\n[dim]Full traceback:\n{error_details}[/]")
+            messages.print(f"✘ Error processing CSV: {str(e)}", style="red")
+            messages.print(f"\n[dim]Full traceback:\n{error_details}[/]")
+            messages.print(f"[dim]Resume with: bulk resume {journal.job_id}[/]")
+
+
+def _drop_results(results_path: str, indexes: set[int]) -> None:
+    """
+    Removes the records of rows about to be retried from a results file.
+
+    Retried rows append new records, so without this each would be listed
+    twice, once failed and once as retried.
+
+    Args:
+        results_path: The JSON lines results file.
+        indexes: Row indexes whose records are dropped.
+    """
+    if not indexes or not os.path.exists(results_path):
+        return
+    kept_path = f"{results_path}.tmp"
+    with (
+        open(results_path, encoding="utf-8") as results,
+        open(kept_path, "w", encoding="utf-8") as kept,
+    ):
+        for line in results:
+            try:
+                if json.loads(line).get("index") in indexes:
+                    continue
+            except json.JSONDecodeError:
+                continue
+            kept.write(line)
+    os.replace(kept_path, results_path)
+
+
+def _preflight_summary(report: PreflightReport) -> str:
+    """
+    Formats the one line outcome of a bulk CSV's pre-flight checks.
+    """
+    if not report.invalid:
+        return f"[dim]Pre-flight: {report.rows} rows checked, no problems found.[/]"
+    return (
+        f"[yellow]⚠ Pre-flight: {len(report.invalid)} of {report.rows} rows have"
+        " problems and will not be sent.[/]"
+    )
+
+
+def _print_preflight(report: PreflightReport) -> None:
+    """
+    Prints the outcome of `--validate-only` and each problem found.
+    """
+    if not report.invalid:
+        console.print(
+            f"✔ All {report.rows} rows passed pre-flight checks.", style="green"
+        )
+        return
+
+    console.print(
+        f"✘ {len(report.invalid)} of {report.rows} rows have problems.", style="red"
+    )
+
+    for issue in report.issues:
+        console.print(f"  [yellow]Row {issue.index + 1}[/]: {issue.message}")
+    if report.issue_count > len(report.issues):
+        console.print(
+            f"  [dim]... and {report.issue_count - len(report.issues)} more problems.[/]"
+        )
+
+
+def _print_changes(
+    changes: list, unchanged: int, entity_name: str, dry_run: bool
+) -> None:
+    """
+    Prints what a `--diff` run changed (or would change, with `--dry-run`).
+
+    Args:
+        changes: Records of the first rows that had fields to change.
+        unchanged: Rows already up to date, which were not sent.
+        entity_name: The name of the entity being processed.
+        dry_run: If True, nothing was sent.
+    """
+    console.print(f"[dim]{unchanged} {entity_name} already up to date, not sent.[/]")
+    if not dry_run:
+        return
+
+    console.print("\n[bold]Dry run, nothing was sent. Rows that would change:[/]")
+    for record in changes:
+        fields = ", ".join(changed_fields(record.get("data", {}))) or "-"
+        console.print(f"  [yellow]Row {record['index'] + 1}[/]: {fields}")
+    if not changes:
+        console.print("  [dim]None.[/]")
+
+
+def _bulk_progress(disable: bool = False) -> Progress:
+    """
+    Builds the live progress display for a bulk run.
+
+    Args:
+        disable: If True, nothing is displayed, e.g. while records stream to stdout.
+    """
+    return Progress(
+        SpinnerColumn(style="cyan"),
+        TextColumn("[cyan]{task.description}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("{task.fields[rate]} rows/s"),
+        TextColumn("p50 {task.fields[p50]} p95 {task.fields[p95]}"),
+        TextColumn("[red]{task.fields[failed]} failed"),
+        TimeRemainingColumn(),
+        console=console,
+        transient=True,
+        disable=disable,
+    )
+
+
+def _progress_fields(tally: BulkTally | None) -> dict:
+    """
+    Formats the live counters shown alongside the progress bar.
+    """
+    if tally is None:
+        return {"rate": "-", "p50": "-", "p95": "-", "failed": 0}
+
+    def _ms(seconds: float | None) -> str:
+        return "-" if seconds is None else f"{seconds * 1000:.0f}ms"
+
+    return {
+        "rate": f"{tally.rate:.1f}",
+        "p50": _ms(tally.latency.percentile(50)),
+        "p95": _ms(tally.latency.percentile(95)),
+        "failed": tally.failure_count,
+    }
+
+
+def _format_rate(tally: BulkTally) -> str:
+    """
+    Formats the final throughput and latency line of the summary.
+    """
+    latency = tally.latency.summary()
+    return (
+        f"{tally.total} rows in {tally.stopwatch.elapsed:.1f}s "
+        f"({tally.rate:.1f} rows/s, p50 {latency['p50_ms']}ms, p95 {latency['p95_ms']}ms)"
+    )
+
+
+def _write_summary(
+    journal: BulkJournal,
+    options: dict,
+    tally: BulkTally | None,
+    skip: set[int],
+    status: str,
+) -> None:
+    """
+    Writes the machine-readable run summary if `--summary` was given.
+
+    Args:
+        journal: The job's journal, used for the job details.
+        options: The parsed bulk options for this run.
+        tally: The run's tally, or None if it never started.
+        skip: Row indexes skipped as already completed.
+        status: How the run ended, "completed" or "interrupted".
+    """
+    summary_path = options.get("summary")
+    if not summary_path:
+        return
+
+    summary = {
+        "job_id": journal.job_id,
+        "bulk_command": journal.header["bulk_command"],
+        "entity_name": journal.header["entity_name"],
+        "file_path": journal.header["file_path"],
+        "status": status,
+        "skipped": len(skip),
+        **(tally or BulkTally()).summary(),
+    }
+    with open(summary_path, "w", encoding="utf-8") as file:
+        json.dump(summary, file, indent=2)
+
+
+def _get_job_id_completions(
+    action: Action, param: ActionParam | None = None, value: str = ""
+) -> Iterable[str]:
+    """
+    Provides completions for journalled bulk job IDs, newest first.
+    """
+    try:
+        return [j for j in BulkJournal.list_job_ids() if j.startswith(value)]
+    except OSError:
+        return []
+
+
+@completer.bulk.action(
+    "resume",
+    display_meta="Resume an interrupted bulk job, skipping rows it already completed",
+    capture_all=True,
+)
+@completer.param(_get_job_id_completions, display="job_id", display_meta="Bulk job ID")
+def _bulk_resume(job_id: str, *options: str):
+    try:
+        parsed = parse_options(options, {**BULK_OPTIONS, "retry_failed": bool})
+        journal = BulkJournal.load(job_id)
+    except (ValueError, FileNotFoundError) as e:
+        console.print(f"✘ {e}", style="red")
+        return
+
+    if not os.path.exists(journal.header["file_path"]):
+        console.print(f"✘ File not found: {journal.header['file_path']}", style="red")
+        return
+
+    if journal.file_changed():
+        console.print(
+            f"✘ {journal.header['file_path']} has changed since job {job_id} started,"
+            " so its rows no longer line up with the journal. Start a new job instead.",
+            style="red",
+        )
+        return
+
+    retry_failed = parsed.pop("retry_failed", False)
+    _run_bulk(journal, {**journal.header.get("options", {}), **parsed}, retry_failed)
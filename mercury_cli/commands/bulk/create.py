@@ -9,88 +9,119 @@ completer.bulk.create.display_meta = "Bulk create operations for various entitie
 
 # -- Hunt Group Create Commands -- #
 @completer.bulk.create.action(
-    "hunt_group", display_meta="Bulk create hunt groups from a CSV file"
+    "hunt_group",
+    display_meta="Bulk create hunt groups from a CSV file",
+    capture_all=True,
 )
 @completer.param(
     source=PathCompleter(), display="file_path", display_meta="Path to CSV"
 )
-def _bulk_hunt_group(file_path: str):
+def _bulk_hunt_group(file_path: str, *options: str):
     _cli_wrap_verification(
-        "create_hunt_group_from_csv", "hunt groups", file_path=file_path
+        "create_hunt_group_from_csv",
+        "hunt groups",
+        file_path=file_path,
+        options=options,
     )
 
 
 # -- Call Pickup Create Commands -- #
 @completer.bulk.create.action(
-    "call_pickup", display_meta="Bulk create call pickup groups from a CSV file"
+    "call_pickup",
+    display_meta="Bulk create call pickup groups from a CSV file",
+    capture_all=True,
 )
 @completer.param(
     source=PathCompleter(), display="file_path", display_meta="Path to CSV"
 )
-def _bulk_call_pickup(file_path: str):
+def _bulk_call_pickup(file_path: str, *options: str):
     _cli_wrap_verification(
-        "create_call_pickup_from_csv", "call pickup groups", file_path=file_path
+        "create_call_pickup_from_csv",
+        "call pickup groups",
+        file_path=file_path,
+        options=options,
     )
 
 
 # -- Call Center Create Commands -- #
 @completer.bulk.create.action(
-    "call_center", display_meta="Bulk create call centers from a CSV file"
+    "call_center",
+    display_meta="Bulk create call centers from a CSV file",
+    capture_all=True,
 )
 @completer.param(
     source=PathCompleter(), display="file_path", display_meta="Path to CSV"
 )
-def _bulk_call_center(file_path: str):
+def _bulk_call_center(file_path: str, *options: str):
     _cli_wrap_verification(
-        "create_call_center_from_csv", "call centres", file_path=file_path
+        "create_call_center_from_csv",
+        "call centres",
+        file_path=file_path,
+        options=options,
     )
 
 
 # -- Auto Attendant Create Commands -- #
 @completer.bulk.create.action(
-    "auto_attendant", display_meta="Bulk create auto attendants from a CSV file"
+    "auto_attendant",
+    display_meta="Bulk create auto attendants from a CSV file",
+    capture_all=True,
 )
 @completer.param(
     source=PathCompleter(), display="file_path", display_meta="Path to CSV"
 )
-def _bulk_auto_attendant(file_path: str):
+def _bulk_auto_attendant(file_path: str, *options: str):
     _cli_wrap_verification(
-        "create_auto_attendant_from_csv", "auto attendants", file_path=file_path
+        "create_auto_attendant_from_csv",
+        "auto attendants",
+        file_path=file_path,
+        options=options,
     )
 
 
 # -- User Create Commands -- #
-@completer.bulk.create.action("user", display_meta="Bulk create users from a CSV file")
+@completer.bulk.create.action(
+    "user", display_meta="Bulk create users from a CSV file", capture_all=True
+)
 @completer.param(
     source=PathCompleter(), display="file_path", display_meta="Path to CSV"
 )
-def _bulk_user(file_path: str):
-    _cli_wrap_verification("create_user_from_csv", "users", file_path=file_path)
+def _bulk_user(file_path: str, *options: str):
+    _cli_wrap_verification(
+        "create_user_from_csv", "users", file_path=file_path, options=options
+    )
 
 
 # -- Group Admin Create Commands -- #
 @completer.bulk.create.action(
-    "group_admin", display_meta="Bulk create group admins from a CSV file"
+    "group_admin",
+    display_meta="Bulk create group admins from a CSV file",
+    capture_all=True,
 )
 @completer.param(
     source=PathCompleter(), display="file_path", display_meta="Path to CSV"
 )
-def _bulk_group_admin(file_path: str):
+def _bulk_group_admin(file_path: str, *options: str):
     _cli_wrap_verification(
-        "create_group_admin_from_csv", "group admins", file_path=file_path
+        "create_group_admin_from_csv",
+        "group admins",
+        file_path=file_path,
+        options=options,
     )
 
 
 @completer.bulk.create.action(
     "service_provider_admin",
     display_meta="Bulk create service provider admins from a CSV file",
+    capture_all=True,
 )
 @completer.param(
     source=PathCompleter(), display="file_path", display_meta="Path to CSV"
 )
-def _bulk_service_provider_admin(file_path: str):
+def _bulk_service_provider_admin(file_path: str, *options: str):
     _cli_wrap_verification(
         "create_service_provider_admin_from_csv",
         "service provider admins",
         file_path=file_path,
+        options=options,
     )
@@ -9,14 +9,19 @@ completer.bulk.delete.display_meta = "Bulk delete operations for various entitie
 
 # -- Group Admin Delete Commands -- #
 @completer.bulk.delete.action(
-    "group_admin", display_meta="Bulk delete group admins from a CSV file"
+    "group_admin",
+    display_meta="Bulk delete group admins from a CSV file",
+    capture_all=True,
 )
 @completer.param(
     source=PathCompleter(), display="file_path", display_meta="Path to CSV"
 )
-def _bulk_group_admin(file_path: str):
+def _bulk_group_admin(file_path: str, *options: str):
     _cli_wrap_verification(
-        "delete_group_admin_from_csv", "group admins", file_path=file_path
+        "delete_group_admin_from_csv",
+        "group admins",
+        file_path=file_path,
+        options=options,
     )
 
 
@@ -24,13 +29,15 @@ def _bulk_group_admin(file_path: str):
 @completer.bulk.delete.action(
     "service_provider_admin",
     display_meta="Bulk delete service provider admins from a CSV file",
+    capture_all=True,
 )
 @completer.param(
     source=PathCompleter(), display="file_path", display_meta="Path to CSV"
 )
-def _bulk_service_provider_admin(file_path: str):
+def _bulk_service_provider_admin(file_path: str, *options: str):
     _cli_wrap_verification(
         "delete_service_provider_admin_from_csv",
         "service provider admins",
         file_path=file_path,
+        options=options,
     )
@@ -0,0 +1,249 @@
+import copy
+import dataclasses
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from mercury_ocip.commands.base_command import ErrorResponse
+
+from mercury_cli.commands.bulk.engine import DEFAULT_CHUNK_SIZE, UnchangedRow
+from mercury_cli.utils.response_cache import fresh_responses
+
+
+@dataclass(frozen=True)
+class DiffRead:
+    """
+    How to read the current state of the entity a modify row targets.
+
+    Args:
+        request (str): The OCI-P request returning the entity's current state.
+        keys (tuple[str, ...]): Row fields identifying the entity, passed to the request.
+        state (Callable[[Any], dict[str, Any]] | None): Reduces the response to
+            row-shaped fields. Defaults to the response's own fields.
+    """
+
+    request: str
+    keys: tuple[str, ...]
+    state: Callable[[Any], dict[str, Any]] | None = None
+
+
+def _agent_list_state(response: Any) -> dict[str, Any]:
+    """
+    Returns a call center's agent list shaped like an `agentUserIdList.userId[n]` row.
+    """
+    agents = response.agent_table.to_dict() if response.agent_table else []
+    return {"agent_user_id_list": {"user_id": [a.get("user_id") for a in agents]}}
+
+
+# The read behind each modify operation `--diff` supports
+DIFF_READS = {
+    "user.modify": DiffRead("UserGetRequest23V2", ("user_id",)),
+    "group.admin.modify.policy": DiffRead("GroupAdminGetPolicyRequest20", ("user_id",)),
+    "service.provider.admin.modify.policy": DiffRead(
+        "ServiceProviderAdminGetPolicyRequest20", ("user_id",)
+    ),
+    "call.center.update.agent.list": DiffRead(
+        "GroupCallCenterGetAgentListRequest", ("service_user_id",), _agent_list_state
+    ),
+}
+
+
+# Row fields identifying an entity, never counted as changes
+_KEY_FIELDS = {"operation", *(key for read in DIFF_READS.values() for key in read.keys)}
+
+
+def changed_fields(data: dict[str, Any]) -> list[str]:
+    """
+    Returns the fields a diffed row still sets, i.e. those that change.
+    """
+    return [field for field in data if field not in _KEY_FIELDS]
+
+
+def _plain(value: Any) -> Any:
+    """
+    Reduces a row or response value to plain, comparable data.
+
+    OCI-P types become dictionaries of their fields, booleans the strings
+    `true` / `false` and numbers strings, so a parsed CSV value and the same
+    value read back from the server compare equal.
+    """
+    if value is None or type(value).__name__ == "OCINil":
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            f.name: _plain(getattr(value, f.name)) for f in dataclasses.fields(value)
+        }
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    return value
+
+
+def _same(desired: Any, current: Any) -> bool:
+    """
+    Checks whether setting `desired` would leave `current` as it is.
+
+    Nested values only compare the fields the row sets; lists must match in
+    full, as the modify requests replace them.
+    """
+    if isinstance(desired, dict):
+        return isinstance(current, dict) and all(
+            _same(value, current.get(key)) for key, value in desired.items()
+        )
+    if isinstance(desired, list):
+        return (
+            isinstance(current, list)
+            and len(desired) == len(current)
+            and all(_same(d, c) for d, c in zip(desired, current))
+        )
+    return desired == current
+
+
+class BulkDiff:
+    """
+    Cuts modify rows down to the fields that would actually change.
+
+    For every row with a supported operation (see `DIFF_READS`) the entity's
+    current state is read, concurrently and in row order, and compared field
+    by field. Fields already set as the row asks are dropped, and rows with
+    nothing left to change become an `UnchangedRow` the engine records
+    without sending. Fields the read doesn't return (e.g. passwords) are
+    always sent, and rows whose state can't be read are sent as given.
+
+    Operations whose handler fills in defaults for missing fields are
+    compared with those defaults applied, and `handler` is a copy without
+    them, so dropped fields are left alone rather than reset.
+
+    Args:
+        handler (Any): The entity's Mercury bulk handler.
+        workers (int): Reads in flight at once.
+        chunk_size (int): Maximum rows read ahead of the slowest read.
+    """
+
+    def __init__(
+        self, handler: Any, workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE
+    ):
+        self.workers = max(workers, 1)
+        self.chunk_size = max(chunk_size, self.workers)
+        self.client = handler.client
+        self.defaults: dict[str, dict[str, Any]] = {}
+        self.handler = handler
+
+        mapping = getattr(handler, "operation_mapping", None)
+        if isinstance(mapping, dict) and any(
+            mapping.get(op, {}).get("defaults") for op in DIFF_READS
+        ):
+            self.handler = copy.copy(handler)
+            self.handler.operation_mapping = {
+                op: (
+                    {k: v for k, v in entry.items() if k != "defaults"}
+                    if op in DIFF_READS
+                    else entry
+                )
+                for op, entry in mapping.items()
+            }
+            self.defaults = {
+                op: entry["defaults"]
+                for op, entry in mapping.items()
+                if op in DIFF_READS and entry.get("defaults")
+            }
+
+    def rows(self, rows: Iterable[tuple[int, Any]]) -> Iterator[tuple[int, Any]]:
+        """
+        Diffs parsed rows against the server, yielding them in order.
+
+        Args:
+            rows (Iterable[tuple[int, Any]]): Row indexes and parsed rows, from `BulkEngine.parse_rows`.
+
+        Yields:
+            tuple[int, Any]: Each row cut down to its changes, an `UnchangedRow`,
+            or the row as given if it can't be diffed.
+        """
+        pending = deque()
+        executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="diff"
+        )
+        try:
+            for index, row in rows:
+                pending.append((index, executor.submit(self.diff, row)))
+                while len(pending) >= self.chunk_size:
+                    index, future = pending.popleft()
+                    yield index, future.result()
+            while pending:
+                index, future = pending.popleft()
+                yield index, future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def diff(self, row: Any) -> Any:
+        """
+        Diffs a single parsed row against its entity's current state.
+
+        Args:
+            row (Any): The parsed row, or the error raised parsing it.
+
+        Returns:
+            Any: The row with only its changed fields, an `UnchangedRow`, or the row as given.
+        """
+        if not isinstance(row, dict) or row.get("operation") not in DIFF_READS:
+            return row
+
+        operation = row["operation"]
+        read = DIFF_READS[operation]
+        current = self.current_state(read, row)
+        if current is None:
+            return row
+
+        desired = {**self.defaults.get(operation, {}), **row}
+        fixed = {"operation", *read.keys}
+        changed = {
+            field: value
+            for field, value in desired.items()
+            if field in fixed
+            or field not in current
+            or not _same(_plain(value), current[field])
+        }
+        if changed.keys() <= fixed:
+            return UnchangedRow(row)
+        return changed
+
+    def current_state(
+        self, read: DiffRead, row: dict[str, Any]
+    ) -> dict[str, Any] | None:
+        """
+        Reads the current state of a row's entity as plain, row-shaped fields.
+
+        The read always goes to the server, never the response cache, since
+        a change decided on a stale state could be skipped or undone. It runs
+        on a diff worker thread, which does not inherit the caller's context,
+        so the cache is bypassed here rather than around the whole job.
+
+        Returns:
+            dict[str, Any] | None: The readable fields, or None if the read failed.
+        """
+        from mercury_ocip.commands import commands
+
+        if any(row.get(key) is None for key in read.keys):
+            return None
+        try:
+            request = getattr(commands, read.request)(**{k: row[k] for k in read.keys})
+            with fresh_responses():
+                response = self.client.command(request)
+        except Exception:  # noqa: BLE001
+            return None
+        if response is None or isinstance(response, ErrorResponse):
+            return None
+
+        if read.state:
+            return _plain(read.state(response))
+        return {
+            f.name: _plain(getattr(response, f.name))
+            for f in dataclasses.fields(response)
+        }
@@ -0,0 +1,465 @@
+import csv
+import json
+import threading
+import time
+from collections import deque
+from collections.abc import Container, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    Any,
+    TextIO,
+)
+
+from mercury_ocip.commands.base_command import ErrorResponse
+from mercury_ocip.utils.file_handler import FileHandler
+
+from mercury_cli.commands.bulk.batch import send_batch, supports_batching
+from mercury_cli.utils.metrics import LatencyStats, Stopwatch
+
+DEFAULT_WORKERS = 1
+DEFAULT_HOST_LIMIT = 8  # Max in-flight rows against one application server
+DEFAULT_CHUNK_SIZE = 64  # Rows read ahead of the slowest in-flight row
+DEFAULT_BATCH_SIZE = 1  # Row commands sent per round trip
+MAX_REPORTED_FAILURES = 50  # Failed rows kept in memory for the summary
+
+UNCHANGED = "Unchanged"  # Response recorded for a row with nothing to send
+
+_host_semaphores: dict[str, tuple[int, threading.BoundedSemaphore]] = {}
+_host_semaphores_lock = threading.Lock()
+
+
+def _host_semaphore(host: str, limit: int) -> threading.BoundedSemaphore:
+    """
+    Returns the semaphore capping concurrent requests to a host.
+
+    The semaphore is shared by every engine in the process, so two bulk runs
+    against the same server together never exceed the cap. A different limit
+    for the same host replaces the semaphore for subsequent runs.
+
+    Args:
+        host (str): The server the rows are sent to.
+        limit (int): Maximum number of concurrent rows for the host.
+
+    Returns:
+        threading.BoundedSemaphore: The semaphore for the host.
+    """
+    with _host_semaphores_lock:
+        current_limit, semaphore = _host_semaphores.get(host, (None, None))
+        if current_limit != limit:
+            semaphore = threading.BoundedSemaphore(limit)
+            _host_semaphores[host] = (limit, semaphore)
+        return semaphore
+
+
+def read_csv_rows(file_path: str) -> Iterator[dict[str, Any]]:
+    """
+    Lazily reads a bulk CSV, one row at a time.
+
+    Applies the same normalisation and blank-row skipping as Mercury's
+    `FileHandler.read_csv_to_dict` without loading the whole file.
+
+    Args:
+        file_path (str): Path to the CSV file.
+
+    Yields:
+        dict[str, Any]: Each non-empty row keyed by column header.
+    """
+    with open(file_path, mode="r", encoding="utf-8-sig", newline="") as file:
+        for row in csv.DictReader(file):
+            if any(row.values()):
+                yield {k: FileHandler._normalise(v) for k, v in row.items()}
+
+
+def count_csv_rows(file_path: str) -> int:
+    """
+    Counts the rows `read_csv_rows` would yield, without keeping them.
+
+    Args:
+        file_path (str): Path to the CSV file.
+
+    Returns:
+        int: The number of non-empty rows.
+    """
+    return sum(1 for _ in read_csv_rows(file_path))
+
+
+class UnchangedRow:
+    """
+    Stands in for a row that would change nothing, so the engine records it as done without sending it.
+
+    Args:
+        data (dict[str, Any]): The parsed row.
+    """
+
+    def __init__(self, data: dict[str, Any]):
+        self.data = data
+
+
+class BulkTally:
+    """
+    Incrementally tallies bulk row results and streams them to a results file.
+
+    Only the counts, recent row latencies and the first `max_failures` failed
+    rows are kept in memory, so a run's footprint does not grow with the size
+    of the CSV.
+
+    Args:
+        results_file (TextIO | None): Open file each result is written to as one JSON line.
+        max_failures (int): Number of failed rows retained for the summary.
+    """
+
+    def __init__(
+        self,
+        results_file: TextIO | None = None,
+        max_failures: int = MAX_REPORTED_FAILURES,
+    ):
+        self.results_file = results_file
+        self.max_failures = max_failures
+        self.success_count = 0
+        self.failure_count = 0
+        self.failed_rows: list[dict[str, Any]] = []
+        self.latency = LatencyStats()
+        self.stopwatch = Stopwatch()
+
+    @property
+    def total(self) -> int:
+        return self.success_count + self.failure_count
+
+    @property
+    def rate(self) -> float:
+        """
+        Rows completed per second since the tally was created.
+        """
+        return self.stopwatch.rate(self.total)
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Returns the run's counters as a serialisable dictionary.
+
+        Returns:
+            dict[str, Any]: Row counts, elapsed seconds, rows per second and latency percentiles.
+        """
+        return {
+            "rows": self.total,
+            "succeeded": self.success_count,
+            "failed": self.failure_count,
+            "elapsed_seconds": round(self.stopwatch.elapsed, 3),
+            "rows_per_second": round(self.rate, 2),
+            "latency": self.latency.summary(),
+        }
+
+    def add(self, result: dict[str, Any]) -> dict[str, Any]:
+        """
+        Records a single row result.
+
+        Args:
+            result (dict[str, Any]): The row result returned by the engine.
+
+        Returns:
+            dict[str, Any]: The serialisable record written for the row.
+        """
+        record = self.to_record(result)
+
+        if result.get("elapsed") is not None:
+            self.latency.observe(result["elapsed"])
+
+        if record["success"]:
+            self.success_count += 1
+        else:
+            self.failure_count += 1
+            if len(self.failed_rows) < self.max_failures:
+                self.failed_rows.append(record)
+
+        if self.results_file:
+            self.results_file.write(json.dumps(record, default=str) + "\n")
+
+        return record
+
+    @staticmethod
+    def to_record(result: dict[str, Any]) -> dict[str, Any]:
+        """
+        Reduces a row result to its serialisable fields, dropping the command object.
+
+        Args:
+            result (dict[str, Any]): The row result returned by the engine.
+
+        Returns:
+            dict[str, Any]: The index, success flag, data and any error details.
+        """
+        response = result.get("response")
+        record = {
+            "index": result.get("index"),
+            "success": bool(result.get("success", False)),
+            "data": result.get("data") or {},
+        }
+        if response is not None:
+            record["response"] = (
+                response if isinstance(response, str) else str(response)
+            )
+        for key in ("detail", "error"):
+            if result.get(key):
+                record[key] = result[key]
+        return record
+
+
+class BulkEngine:
+    """
+    Executes bulk CSV rows concurrently on the CLI side.
+
+    Rows are dispatched one at a time to the Mercury bulk handler for the
+    entity (e.g. `agent().bulk.users`) across a worker pool, capped per host.
+    Results are yielded in row order as soon as each is available, using the
+    same result dictionaries the handler returns for a whole file.
+
+    With a `batch_size` above one (and a SOAP client), the commands for that
+    many rows are packed into a single OCI-P request document and the
+    per-command responses are split back out to their rows.
+
+    Args:
+        handler (Any): The entity bulk handler exposing `_process_row` and `execute_from_data`.
+        workers (int): Number of rows processed concurrently.
+        host (str | None): Server the rows are sent to, used for the per-host cap.
+        host_limit (int): Maximum number of concurrent rows against `host`.
+        chunk_size (int): Maximum number of rows read ahead and held in flight.
+        batch_size (int): Number of row commands sent per round trip.
+    """
+
+    def __init__(
+        self,
+        handler: Any,
+        workers: int = DEFAULT_WORKERS,
+        host: str | None = None,
+        host_limit: int = DEFAULT_HOST_LIMIT,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if host_limit < 1:
+            raise ValueError("host_limit must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+
+        self.handler = handler
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.batch_size = batch_size
+        self.batching = batch_size > 1 and supports_batching(handler.client)
+        self.semaphore = _host_semaphore(host or "", host_limit)
+
+    def parse_rows(
+        self, rows: Iterable[dict[str, Any]], skip: Container[int] = ()
+    ) -> Iterator[tuple[int, dict[str, Any]]]:
+        """
+        Parses raw CSV rows into the nested structures the handler expects.
+
+        Args:
+            rows (Iterable[dict[str, Any]]): Raw rows as read from the CSV.
+            skip (Container[int]): Row indexes to leave out, e.g. rows a resumed job already completed.
+
+        Yields:
+            tuple[int, dict[str, Any]]: The row index and parsed row. Rows that fail
+            to parse are yielded as an exception in place of the row.
+        """
+        for index, row in enumerate(rows):
+            if index in skip:
+                continue
+            try:
+                yield index, self.handler._process_row(row)
+            except Exception as e:  # noqa: BLE001
+                yield index, e
+
+    def run(
+        self, rows: Iterable[tuple[int, dict[str, Any]]], dry_run: bool = False
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Executes rows across the worker pool, yielding results in row order.
+
+        At most `chunk_size` rows (and never fewer than one batch per worker)
+        are held in flight, so rows are read lazily from the source and memory
+        stays flat however large it is.
+
+        Args:
+            rows (Iterable[tuple[int, dict[str, Any]]]): Row indexes and parsed rows.
+            dry_run (bool): If True, commands are built but not sent.
+
+        Yields:
+            dict[str, Any]: One result per row, in the order the rows were given.
+        """
+        batch_size = self.batch_size if self.batching else 1
+        window = max(self.chunk_size, self.workers * batch_size)
+        pending = deque()
+        in_flight = 0
+        batch = []
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="bulk"
+        )
+        try:
+            for row in rows:
+                batch.append(row)
+                if len(batch) < batch_size:
+                    continue
+
+                pending.append(executor.submit(self._execute_batch, batch, dry_run))
+                in_flight += len(batch)
+                batch = []
+
+                while in_flight >= window:
+                    results = pending.popleft().result()
+                    in_flight -= len(results)
+                    yield from results
+
+            if batch:
+                pending.append(executor.submit(self._execute_batch, batch, dry_run))
+
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            # Drop queued rows if the caller stops early (e.g. Ctrl+C)
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _execute_batch(
+        self, batch: list[tuple[int, dict[str, Any] | Exception]], dry_run: bool
+    ) -> list[dict[str, Any]]:
+        """
+        Executes a batch of rows, in one round trip when batching is enabled.
+
+        Rows whose command cannot be built fail on their own without holding
+        up the rest of the batch. If the batch request itself fails, every row
+        sent in it fails with that error.
+
+        Args:
+            batch (list[tuple[int, dict[str, Any] | Exception]]): Row indexes and parsed rows.
+            dry_run (bool): If True, commands are built but not sent.
+
+        Returns:
+            list[dict[str, Any]]: One result per row, in batch order.
+        """
+        if not self.batching:
+            return [self._execute(index, row, dry_run) for index, row in batch]
+
+        results: dict[int, dict[str, Any]] = {}
+        commands = []
+        for index, row in batch:
+            if isinstance(row, UnchangedRow):
+                results[index] = self._unchanged(index, row)
+                continue
+            if isinstance(row, Exception):
+                results[index] = self._failure(index, getattr(row, "data", {}), row)
+                continue
+
+            data = dict(row)
+            try:
+                operation = data.pop("operation")
+                command = self.handler._create_command(data, operation)
+            except Exception as e:  # noqa: BLE001
+                results[index] = self._failure(index, data, e)
+                continue
+            commands.append((index, data, command))
+
+        if commands:
+            with self.semaphore:
+                started = time.monotonic()
+                try:
+                    responses = (
+                        [None] * len(commands)
+                        if dry_run
+                        else send_batch(
+                            self.handler.client, [c for _, _, c in commands]
+                        )
+                    )
+                except Exception as e:  # noqa: BLE001
+                    responses = [e] * len(commands)
+                elapsed = time.monotonic() - started
+
+            for (index, data, command), response in zip(commands, responses):
+                if isinstance(response, Exception):
+                    result = self._failure(index, data, response)
+                else:
+                    result = self._result(index, data, command, response)
+                result["elapsed"] = elapsed
+                results[index] = result
+
+        return [results[index] for index, _ in batch]
+
+    def _execute(
+        self, index: int, row: dict[str, Any] | Exception, dry_run: bool
+    ) -> dict[str, Any]:
+        """
+        Executes a single row through the handler.
+
+        Args:
+            index (int): The row's index in the CSV.
+            row (dict[str, Any] | Exception): The parsed row, the error raised parsing it, or an `UnchangedRow`.
+            dry_run (bool): If True, the command is built but not sent.
+
+        Returns:
+            dict[str, Any]: The handler's result for the row, with the seconds
+            spent executing it (excluding any wait for the host cap) as `elapsed`.
+        """
+        if isinstance(row, UnchangedRow):
+            return self._unchanged(index, row)
+        if isinstance(row, Exception):
+            return self._failure(index, getattr(row, "data", {}), row)
+
+        data = dict(row)
+        with self.semaphore:
+            started = time.monotonic()
+            try:
+                result = self.handler.execute_from_data([row], dry_run)[0]
+            except Exception as e:  # noqa: BLE001
+                result = self._failure(index, data, e)
+            result["elapsed"] = time.monotonic() - started
+
+        result["index"] = index
+        return result
+
+    @staticmethod
+    def _result(
+        index: int, data: dict[str, Any], command: Any, response: Any
+    ) -> dict[str, Any]:
+        """
+        Builds a row result from a batched response in the handler's result format.
+        """
+        result = {
+            "index": index,
+            "data": data,
+            "command": command,
+            "response": response,
+            "success": True,
+        }
+        if isinstance(response, ErrorResponse):
+            result["response"] = response.summary
+            result["detail"] = response.detail
+            result["success"] = False
+        return result
+
+    @staticmethod
+    def _unchanged(index: int, row: UnchangedRow) -> dict[str, Any]:
+        """
+        Builds the successful result of a row that needed no request.
+        """
+        return {
+            "index": index,
+            "data": row.data,
+            "command": None,
+            "response": UNCHANGED,
+            "success": True,
+        }
+
+    @staticmethod
+    def _failure(index: int, data: dict[str, Any], error: Exception) -> dict[str, Any]:
+        """
+        Builds a failed row result in the handler's result format.
+        """
+        return {
+            "index": index,
+            "data": data,
+            "command": None,
+            "response": None,
+            "success": False,
+            "error": str(error),
+        }
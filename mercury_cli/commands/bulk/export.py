@@ -0,0 +1,226 @@
+from datetime import datetime
+
+from rich.progress import (
+    BarColumn,
+    MofNCompleteColumn,
+    Progress,
+    SpinnerColumn,
+    TextColumn,
+)
+
+from mercury_cli.commands.bulk.exporter import (
+    DEFAULT_EXPORT_WORKERS,
+    EXPORTS,
+    BulkExporter,
+    CsvSpool,
+)
+from mercury_cli.globals import MERCURY_CLI
+from mercury_cli.utils.options import parse_options
+from mercury_cli.utils.service_group_id_callable import (
+    _get_service_provider_id_completions,
+    get_group_ids,
+)
+
+completer = MERCURY_CLI.completer()
+console = MERCURY_CLI.console()
+
+completer.bulk.export.display_meta = (
+    "Export entities to CSVs the matching create command accepts"
+)
+
+# Options accepted after the service provider, e.g. `bulk export user SP1 --workers 8`.
+# The CSV is named by `--file`, as `--output` elsewhere also takes a format for stdout
+EXPORT_OPTIONS = {"group": str, "workers": int, "file": str}
+
+
+def _run_export(entity: str, entity_name: str, service_provider_id: str, options):
+    """
+    Exports every entity of one kind in a service provider to a create CSV.
+
+    Args:
+        entity (str): The entity, a key of `EXPORTS`.
+        entity_name (str): The name of the entity, for messages.
+        service_provider_id (str): The service provider (or enterprise) to export.
+        options: `--group ID`, `--workers N` and `--file PATH`.
+    """
+    try:
+        parsed = parse_options(options, EXPORT_OPTIONS)
+        exporter = BulkExporter(
+            MERCURY_CLI.client(),
+            EXPORTS[entity],
+            workers=parsed.get("workers", DEFAULT_EXPORT_WORKERS),
+        )
+    except ValueError as e:
+        console.print(f"✘ {e}", style="red")
+        return
+
+    output_path = parsed.get(
+        "file",
+        f"export_{entity}_{service_provider_id}_{datetime.now():%Y%m%d-%H%M%S}.csv",
+    )
+    failures = []
+
+    with Progress(
+        SpinnerColumn(style="cyan"),
+        TextColumn(f"[cyan]Exporting {entity_name}"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("[green]{task.fields[rows]} rows"),
+        TextColumn("[red]{task.fields[failed]} failed"),
+        console=console,
+        transient=True,
+    ) as progress:
+        try:
+            if not EXPORTS[entity].per_group:
+                group_ids = []
+            elif "group" in parsed:
+                group_ids = [parsed["group"]]
+            else:
+                group_ids = get_group_ids(service_provider_id, fresh=True)
+            task = progress.add_task(
+                "export", total=len(group_ids) or 1, rows=0, failed=0
+            )
+
+            with CsvSpool(output_path, exporter.column_order) as spool:
+                for entity_id, row in exporter.rows(
+                    service_provider_id,
+                    group_ids,
+                    on_group=lambda *_: progress.advance(task),
+                ):
+                    if isinstance(row, Exception):
+                        failures.append((entity_id, row))
+                    else:
+                        spool.write(row)
+                    progress.update(task, rows=spool.count, failed=len(failures))
+
+        except KeyboardInterrupt:
+            progress.stop()
+            console.print(
+                f"✘ Interrupted. Partial export in {output_path}", style="red"
+            )
+            return
+
+        except Exception as e:  # noqa: BLE001
+            progress.stop()
+            console.print(f"✘ {e}", style="red")
+            return
+
+    if failures:
+        console.print(f"✘ {len(failures)} could not be read:", style="red")
+        for entity_id, error in failures:
+            console.print(f"  [yellow]{entity_id}[/]: {error}")
+
+    console.print(
+        f"✔ Exported {spool.count} {entity_name} to {output_path}", style="green"
+    )
+
+
+# -- Export Commands -- #
+@completer.bulk.export.action(
+    "user",
+    display_meta="Export a service provider's users as a create CSV",
+    capture_all=True,
+)
+@completer.param(
+    _get_service_provider_id_completions,
+    display_meta="Service Provider ID",
+    cast=str,
+)
+def _export_user(service_provider_id: str, *options: str):
+    """
+    Export a service provider's users to a CSV `bulk create user` accepts.
+
+    Args:
+        service_provider_id: The ID of the service provider (or enterprise).
+        *options: `--group ID`, `--workers N` and `--file PATH`.
+    """
+    _run_export("user", "users", service_provider_id, options)
+
+
+@completer.bulk.export.action(
+    "hunt_group",
+    display_meta="Export a service provider's hunt groups as a create CSV",
+    capture_all=True,
+)
+@completer.param(
+    _get_service_provider_id_completions,
+    display_meta="Service Provider ID",
+    cast=str,
+)
+def _export_hunt_group(service_provider_id: str, *options: str):
+    """
+    Export a service provider's hunt groups, with their agents, to a CSV `bulk create hunt_group` accepts.
+
+    Args:
+        service_provider_id: The ID of the service provider (or enterprise).
+        *options: `--group ID`, `--workers N` and `--file PATH`.
+    """
+    _run_export("hunt_group", "hunt groups", service_provider_id, options)
+
+
+@completer.bulk.export.action(
+    "call_center",
+    display_meta="Export a service provider's call centers as a create CSV",
+    capture_all=True,
+)
+@completer.param(
+    _get_service_provider_id_completions,
+    display_meta="Service Provider ID",
+    cast=str,
+)
+def _export_call_center(service_provider_id: str, *options: str):
+    """
+    Export a service provider's call centers to a CSV `bulk create call_center` accepts.
+
+    Args:
+        service_provider_id: The ID of the service provider (or enterprise).
+        *options: `--group ID`, `--workers N` and `--file PATH`.
+    """
+    _run_export("call_center", "call centers", service_provider_id, options)
+
+
+@completer.bulk.export.action(
+    "group_admin",
+    display_meta="Export a service provider's group admins as a create CSV",
+    capture_all=True,
+)
+@completer.param(
+    _get_service_provider_id_completions,
+    display_meta="Service Provider ID",
+    cast=str,
+)
+def _export_group_admin(service_provider_id: str, *options: str):
+    """
+    Export a service provider's group admins to a CSV `bulk create group_admin` accepts.
+
+    Args:
+        service_provider_id: The ID of the service provider (or enterprise).
+        *options: `--group ID`, `--workers N` and `--file PATH`.
+    """
+    _run_export("group_admin", "group admins", service_provider_id, options)
+
+
+@completer.bulk.export.action(
+    "service_provider_admin",
+    display_meta="Export a service provider's admins as a create CSV",
+    capture_all=True,
+)
+@completer.param(
+    _get_service_provider_id_completions,
+    display_meta="Service Provider ID",
+    cast=str,
+)
+def _export_service_provider_admin(service_provider_id: str, *options: str):
+    """
+    Export a service provider's admins to a CSV `bulk create service_provider_admin` accepts.
+
+    Args:
+        service_provider_id: The ID of the service provider (or enterprise).
+        *options: `--group ID`, `--workers N` and `--file PATH`.
+    """
+    _run_export(
+        "service_provider_admin",
+        "service provider admins",
+        service_provider_id,
+        options,
+    )
@@ -0,0 +1,451 @@
+import csv
+import dataclasses
+import json
+import os
+import re
+import typing
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Self
+
+from mercury_ocip.commands.base_command import ErrorResponse
+from mercury_ocip.utils.defines import snake_to_camel
+
+DEFAULT_EXPORT_WORKERS = 4
+
+
+@dataclass(frozen=True)
+class ExportSpec:
+    """
+    How to read every entity of one kind back as rows of its create CSV.
+
+    Entities are listed per group (or per service provider), then each one is
+    read in full with `get_request`, or taken straight from its list row if
+    there is none. Rows keep only the fields the create command accepts.
+
+    Args:
+        operation (str): The create operation rows are written for, e.g. `user.create`.
+        command (str): That operation's OCI-P command, which decides the columns.
+        list_request (str): The request listing the entities in a group or service provider.
+        table (str): The list response's table of entities.
+        id_column (str): The table column holding each entity's ID.
+        key (str): The row field the ID is written to, and passed to `get_request` as.
+        get_request (str | None): The request reading one entity in full.
+        per_group (bool): Whether entities are listed per group, or once per service provider.
+        extra (Callable[[Any], dict[str, Any]] | None): Adds fields the get
+            response holds in another shape, e.g. a table of agents.
+        exclude (tuple[str, ...]): Command fields left out of the export.
+    """
+
+    operation: str
+    command: str
+    list_request: str
+    table: str
+    id_column: str
+    key: str
+    get_request: str | None = None
+    per_group: bool = True
+    extra: Callable[[Any], dict[str, Any]] | None = None
+    exclude: tuple[str, ...] = ()
+
+
+def _agent_user_ids(response: Any) -> dict[str, Any]:
+    """
+    Returns a hunt group's agents as the `agentUserId[n]` columns it is created with.
+    """
+    table = getattr(response, "agent_user_table", None)
+    agents = table.to_dict() if table else []
+    return {"agent_user_id": [agent.get("user_id") for agent in agents]}
+
+
+# What `bulk export <entity>` reads, by entity
+EXPORTS = {
+    "user": ExportSpec(
+        operation="user.create",
+        command="UserConsolidatedAddRequest22",
+        list_request="UserGetListInGroupRequest",
+        table="user_table",
+        id_column="user_id",
+        key="user_id",
+        get_request="UserGetRequest23V2",
+        # Devices and trunks are read back in a different shape than they are added
+        exclude=(
+            "access_device_endpoint",
+            "trunk_addressing",
+            "shared_call_appearance_access_device_endpoint",
+        ),
+    ),
+    "hunt_group": ExportSpec(
+        operation="hunt.group.create",
+        command="GroupHuntGroupAddInstanceRequest20",
+        list_request="GroupHuntGroupGetInstanceListRequest",
+        table="hunt_group_table",
+        id_column="service_user_id",
+        key="service_user_id",
+        get_request="GroupHuntGroupGetInstanceRequest20",
+        extra=_agent_user_ids,
+    ),
+    "call_center": ExportSpec(
+        operation="call.center.create",
+        command="GroupCallCenterAddInstanceRequest22",
+        list_request="GroupCallCenterGetInstanceListRequest",
+        table="call_center_table",
+        id_column="service_user_id",
+        key="service_user_id",
+        get_request="GroupCallCenterGetInstanceRequest22",
+    ),
+    "group_admin": ExportSpec(
+        operation="group.admin.create",
+        command="GroupAdminAddRequest",
+        list_request="GroupAdminGetListRequest",
+        table="group_admin_table",
+        id_column="administrator_id",
+        key="user_id",
+    ),
+    "service_provider_admin": ExportSpec(
+        operation="service.provider.admin.create",
+        command="ServiceProviderAdminAddRequest14",
+        list_request="ServiceProviderAdminGetListRequest14",
+        table="service_provider_admin_table",
+        id_column="administrator_id",
+        key="user_id",
+        per_group=False,
+    ),
+}
+
+
+def _field_type(hint: Any) -> Any:
+    """
+    Unwraps `Optional`, `Nillable` and `List` hints to the type they hold.
+    """
+    while typing.get_args(hint):
+        args = [
+            arg
+            for arg in typing.get_args(hint)
+            if arg is not type(None) and getattr(arg, "__name__", "") != "OCINil"
+        ]
+        if not args:
+            return None
+        hint = args[0]
+    return hint
+
+
+def _is_list(hint: Any) -> bool:
+    """
+    Checks whether a hint, e.g. `list[str] | None`, holds a list.
+    """
+    if typing.get_origin(hint) is list:
+        return True
+    return any(_is_list(arg) for arg in typing.get_args(hint))
+
+
+def _project(value: Any, hint: Any) -> Any:
+    """
+    Reduces a response value to plain data holding only the fields `hint` accepts.
+
+    Args:
+        value (Any): A response field, e.g. a read service instance profile.
+        hint (Any): The command field's type, e.g. `ServiceInstanceAddProfile`.
+
+    Returns:
+        Any: Strings, dictionaries and lists, or None where there is nothing to keep.
+    """
+    if value is None or type(value).__name__ == "OCINil":
+        return None
+    if isinstance(value, (list, tuple)):
+        items = [_project(item, hint) for item in value]
+        return [item for item in items if item is not None] or None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+
+    target = _field_type(hint)
+    if dataclasses.is_dataclass(value) or isinstance(value, dict):
+        fields = (
+            value
+            if isinstance(value, dict)
+            else {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+        )
+        if isinstance(target, type) and dataclasses.is_dataclass(target):
+            # Abstract types, e.g. `DepartmentKey`, take the fields of the one given
+            accepts = _hints(type(value) if isinstance(value, target) else target)
+        else:
+            accepts = {name: None for name in fields}
+        plain = {
+            name: _project(fields[name], accepts[name])
+            for name in accepts
+            if name in fields
+        }
+        return {k: v for k, v in plain.items() if v is not None} or None
+    return str(value)
+
+
+def _hints(cls: type) -> dict[str, Any]:
+    """
+    Returns a command or type's fields with their type hints, in field order.
+    """
+    hints = typing.get_type_hints(cls)
+    return {f.name: hints.get(f.name) for f in dataclasses.fields(cls)}
+
+
+_INDEX = re.compile(r"\[\d+\]")
+_INDEX_NUMBER = re.compile(r"\[(\d+)\]")
+
+
+def _column_templates(
+    fields: dict[str, Any], prefix: str = "", depth: int = 0
+) -> Iterator[str]:
+    """
+    Yields every column a command's fields can produce, in field order, with `[]` for list indexes.
+    """
+    for name, hint in fields.items():
+        column = f"{prefix}{snake_to_camel(name)}"
+        if _is_list(hint):
+            column += "[]"
+        target = _field_type(hint)
+        if isinstance(target, type) and dataclasses.is_dataclass(target) and depth < 4:
+            yield from _column_templates(_hints(target), f"{column}.", depth + 1)
+        else:
+            yield column
+
+
+def _flatten(value: Any, column: str) -> Iterator[tuple[str, str]]:
+    """
+    Yields the CSV columns for a value, e.g. `serviceInstanceProfile.name` or `alias[0]`.
+    """
+    if isinstance(value, dict):
+        for name, item in value.items():
+            yield from _flatten(item, f"{column}.{snake_to_camel(name)}")
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _flatten(item, f"{column}[{index}]")
+    else:
+        yield column, value
+
+
+class BulkExporter:
+    """
+    Reads every entity of one kind in a service provider back as create CSV rows.
+
+    Each group's list request and each entity's get request run across
+    `workers` threads, with only a few reads per worker waiting at once, and
+    rows are yielded as their reads complete rather than in any fixed order.
+
+    Args:
+        client (Any): The session's client, i.e. `MERCURY_CLI.client()`.
+        spec (ExportSpec): What to read, from `EXPORTS`.
+        workers (int): Reads in flight at once.
+    """
+
+    def __init__(
+        self, client: Any, spec: ExportSpec, workers: int = DEFAULT_EXPORT_WORKERS
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.client = client
+        self.spec = spec
+        self.workers = workers
+
+        from mercury_ocip.commands import commands
+
+        self._commands = commands
+        self.fields = _hints(getattr(commands, spec.command))
+        for name in spec.exclude:
+            self.fields.pop(name, None)
+        self._templates: dict[str, int] | None = None
+
+    def rows(
+        self,
+        service_provider_id: str,
+        group_ids: Iterable[str] = (),
+        on_group: Callable[[str, Exception | None], None] | None = None,
+    ) -> Iterator[tuple[str, Any]]:
+        """
+        Lists and reads every entity, yielding each as soon as it is read.
+
+        Args:
+            service_provider_id (str): The service provider (or enterprise) to export.
+            group_ids (Iterable[str]): The groups to list, unless the spec lists per service provider.
+            on_group (Callable[[str, Exception | None], None] | None): Called as each group is listed.
+
+        Yields:
+            tuple[str, Any]: Each entity's ID with its row, or the error raised reading it.
+        """
+        scopes = list(group_ids) if self.spec.per_group else [None]
+        todo = deque(
+            (self._list, (service_provider_id, group_id)) for group_id in scopes
+        )
+        pending: dict[Any, tuple[str, Any]] = {}
+
+        with ThreadPoolExecutor(
+            max_workers=self.workers, thread_name_prefix="export"
+        ) as pool:
+            try:
+                while todo or pending:
+                    # Reads are queued in the order found, a bounded number at a time
+                    while todo and len(pending) < self.workers * 2:
+                        task, args = todo.popleft()
+                        pending[pool.submit(task, *args)] = (task, args)
+
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        task, args = pending.pop(future)
+                        if task == self._list:
+                            _, group_id = args
+                            try:
+                                entries = future.result()
+                            except Exception as e:  # noqa: BLE001
+                                if on_group:
+                                    on_group(group_id or service_provider_id, e)
+                                yield group_id or service_provider_id, e
+                                continue
+                            if on_group:
+                                on_group(group_id or service_provider_id, None)
+                            todo.extend(
+                                (self._read, (service_provider_id, group_id, entry))
+                                for entry in entries
+                            )
+                        else:
+                            entity_id = args[2].get(self.spec.id_column)
+                            try:
+                                yield entity_id, future.result()
+                            except Exception as e:  # noqa: BLE001
+                                yield entity_id, e
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def _send(self, request: str, **kwargs: Any) -> Any:
+        response = self.client.command(getattr(self._commands, request)(**kwargs))
+        if response is None or isinstance(response, ErrorResponse):
+            raise ValueError(
+                response.summary
+                if response is not None
+                else f"No response to {request}"
+            )
+        return response
+
+    def _list(
+        self, service_provider_id: str, group_id: str | None
+    ) -> list[dict[str, Any]]:
+        """
+        Lists the entities in a group, or a service provider, as table rows.
+        """
+        scope = {"service_provider_id": service_provider_id}
+        if group_id is not None:
+            scope["group_id"] = group_id
+        table = getattr(self._send(self.spec.list_request, **scope), self.spec.table)
+        return table.to_dict() if table else []
+
+    def _read(
+        self, service_provider_id: str, group_id: str | None, entry: dict[str, Any]
+    ) -> dict[str, str]:
+        """
+        Reads one entity, returning its create CSV row.
+        """
+        entity_id = entry.get(self.spec.id_column)
+        state: dict[str, Any] = {**entry, self.spec.key: entity_id}
+        if self.spec.get_request:
+            response = self._send(self.spec.get_request, **{self.spec.key: entity_id})
+            state.update(
+                {
+                    f.name: getattr(response, f.name)
+                    for f in dataclasses.fields(response)
+                }
+            )
+            if self.spec.extra:
+                state.update(self.spec.extra(response))
+        state["service_provider_id"] = service_provider_id
+        if group_id is not None:
+            state["group_id"] = group_id
+        return self.row(state)
+
+    def row(self, state: dict[str, Any]) -> dict[str, str]:
+        """
+        Turns an entity's fields into a create CSV row, keeping those the command accepts.
+
+        Args:
+            state (dict[str, Any]): The entity's fields, snake case.
+
+        Returns:
+            dict[str, str]: The row, with the `operation` and camel case column paths.
+        """
+        row = {"operation": self.spec.operation}
+        for name, hint in self.fields.items():
+            value = _project(state.get(name), hint)
+            if value is not None:
+                row.update(_flatten(value, snake_to_camel(name)))
+        return row
+
+    def column_order(self, column: str) -> tuple:
+        """
+        Sorts columns in command field order, with list indexes in number order.
+        """
+        if self._templates is None:
+            self._templates = {
+                template: i
+                for i, template in enumerate(
+                    ["operation", *_column_templates(self.fields)]
+                )
+            }
+        template = _INDEX.sub("[]", column)
+        indexes = tuple(int(i) for i in _INDEX_NUMBER.findall(column))
+        return (self._templates.get(template, len(self._templates)), indexes, column)
+
+
+class CsvSpool:
+    """
+    Writes rows to a CSV whose columns are only known once every row is in.
+
+    Rows are appended to a `<path>.part` file and flushed as they arrive, so
+    memory stays flat and nothing read is lost, and `close` writes the CSV with
+    every column any row used. List columns (agents, aliases) vary from row to
+    row, so the header can't be settled from the first row alone. The spool is
+    open inside a `with` block.
+
+    Args:
+        path (str): The CSV file to write.
+        order (Callable[[str], Any] | None): Sort key for the header's columns.
+    """
+
+    def __init__(self, path: str, order: Callable[[str], Any] | None = None):
+        self.path = path
+        self.order = order
+        self.count = 0
+        self.columns: dict[str, None] = {}
+        self._spool_path = f"{path}.part"
+        self._spool = None
+
+    def write(self, row: dict[str, str]) -> None:
+        self.columns.update(dict.fromkeys(row))
+        self._spool.write(json.dumps(row) + "\n")
+        self._spool.flush()
+        self.count += 1
+
+    def close(self) -> None:
+        """
+        Writes the CSV from the spooled rows and removes the spool.
+        """
+        self._spool.close()
+        header = (
+            sorted(self.columns, key=self.order) if self.order else list(self.columns)
+        )
+        with (
+            open(self._spool_path, encoding="utf-8") as spool,
+            open(self.path, "w", encoding="utf-8", newline="") as file,
+        ):
+            writer = csv.DictWriter(file, fieldnames=header)
+            writer.writeheader()
+            for line in spool:
+                writer.writerow(json.loads(line))
+        os.remove(self._spool_path)
+
+    def __enter__(self) -> Self:
+        self._spool = open(self._spool_path, "w", encoding="utf-8")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
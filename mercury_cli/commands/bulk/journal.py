@@ -0,0 +1,229 @@
+import hashlib
+import json
+import os
+import uuid
+from datetime import datetime
+from typing import Any, Self
+
+from mercury_cli.utils.paths import state_dir
+
+JOURNAL_SUFFIX = ".journal"
+
+
+def file_fingerprint(path: str) -> dict[str, Any]:
+    """
+    Identifies a file's contents by size and SHA-256.
+
+    Args:
+        path (str): The file.
+
+    Returns:
+        dict[str, Any]: The fingerprint, as stored in a job header.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(1 << 20), b""):
+            digest.update(block)
+    return {"size": os.path.getsize(path), "sha256": digest.hexdigest()}
+
+
+class BulkJournal:
+    """
+    Append-only on-disk journal of a bulk job's completed rows.
+
+    The first line holds the job header (bulk method, entity, CSV path and
+    fingerprint, and options). Every following line records one completed row as
+    `{"i": index, "ok": success}`, plus a short `"e"` error for failures.
+    Lines are flushed as they are written, so a job killed mid-run can be
+    resumed from its journal with `bulk resume <job-id>`. Rows are recorded
+    inside a `with journal:` block, which holds the file open for appending.
+
+    Args:
+        job_id (str): The job identifier.
+        header (dict[str, Any]): The job header.
+        completed (dict[int, bool] | None): Row indexes already completed mapped to success.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        header: dict[str, Any],
+        completed: dict[int, bool] | None = None,
+    ):
+        self.job_id = job_id
+        self.header = header
+        self.completed = completed or {}
+        self._file = None
+
+    @staticmethod
+    def directory() -> str:
+        """
+        Returns the directory journals are stored in.
+        """
+        return state_dir("jobs")
+
+    @classmethod
+    def path_for(cls, job_id: str) -> str:
+        """
+        Returns the journal file path for a job.
+        """
+        return os.path.join(cls.directory(), f"{job_id}{JOURNAL_SUFFIX}")
+
+    @classmethod
+    def create(
+        cls,
+        bulk_command: str,
+        entity_name: str,
+        file_path: str,
+        options: dict[str, Any],
+    ) -> "BulkJournal":
+        """
+        Starts a new job and writes its header.
+
+        Args:
+            bulk_command (str): The bulk method being run.
+            entity_name (str): The entity display name.
+            file_path (str): The CSV being processed.
+            options (dict[str, Any]): The parsed bulk options.
+
+        Returns:
+            BulkJournal: The new job's journal.
+        """
+        job_id = f"{datetime.now():%Y%m%d-%H%M%S}-{uuid.uuid4().hex[:6]}"
+        header = {
+            "job_id": job_id,
+            "bulk_command": bulk_command,
+            "entity_name": entity_name,
+            "file_path": os.path.abspath(file_path),
+            "fingerprint": file_fingerprint(file_path),
+            "options": options,
+            "created": datetime.now().isoformat(timespec="seconds"),
+        }
+        with open(cls.path_for(job_id), "w", encoding="utf-8") as file:
+            file.write(_encode(header))
+        return cls(job_id, header)
+
+    @classmethod
+    def load(cls, job_id: str) -> "BulkJournal":
+        """
+        Reads an existing job's journal.
+
+        A partially written final line (from a crash mid-write) is ignored.
+
+        Args:
+            job_id (str): The job identifier.
+
+        Returns:
+            BulkJournal: The journal with its completed rows loaded.
+
+        Raises:
+            FileNotFoundError: If no journal exists for the job.
+            ValueError: If the journal has no valid header.
+        """
+        path = cls.path_for(job_id)
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No bulk job found with ID '{job_id}'")
+
+        header: dict[str, Any] | None = None
+        completed: dict[int, bool] = {}
+        with open(path, "r", encoding="utf-8") as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if header is None:
+                    header = entry
+                elif "i" in entry:
+                    completed[entry["i"]] = entry.get("ok", False)
+
+        if not header or "bulk_command" not in header:
+            raise ValueError(f"Journal for job '{job_id}' is missing its header")
+
+        return cls(job_id, header, completed)
+
+    @classmethod
+    def list_job_ids(cls) -> list[str]:
+        """
+        Returns the IDs of every journalled job, newest first.
+        """
+        return sorted(
+            (
+                name[: -len(JOURNAL_SUFFIX)]
+                for name in os.listdir(cls.directory())
+                if name.endswith(JOURNAL_SUFFIX)
+            ),
+            reverse=True,
+        )
+
+    def record(self, record: dict[str, Any]) -> None:
+        """
+        Appends a completed row.
+
+        Args:
+            record (dict[str, Any]): The row record produced by `BulkTally.to_record`.
+        """
+        entry: dict[str, Any] = {"i": record["index"], "ok": record["success"]}
+        if not record["success"]:
+            entry["e"] = str(
+                record.get("response") or record.get("error") or "Unknown error"
+            )[:200]
+        self.completed[record["index"]] = record["success"]
+        self._file.write(_encode(entry))
+        self._file.flush()
+
+    def file_changed(self) -> bool:
+        """
+        Checks whether the job's CSV differs from the one the job started with.
+
+        Rows are resumed by their position in the file, so a changed file
+        would skip or repeat the wrong rows. A journal without a fingerprint
+        can't show the file is the same, so it counts as changed.
+
+        Returns:
+            bool: True if the file is missing, unfingerprinted or its contents changed.
+        """
+        expected = self.header.get("fingerprint")
+        path = self.header["file_path"]
+        if not expected or not os.path.exists(path):
+            return True
+        if os.path.getsize(path) != expected["size"]:
+            return True
+        return file_fingerprint(path)["sha256"] != expected["sha256"]
+
+    def failed_indexes(self) -> set[int]:
+        """
+        Returns the row indexes whose last recorded run failed.
+        """
+        return {i for i, ok in self.completed.items() if not ok}
+
+    def skip_indexes(self, retry_failed: bool = False) -> set[int]:
+        """
+        Returns the row indexes a resumed run should not execute again.
+
+        Args:
+            retry_failed (bool): If True, rows that failed are run again.
+
+        Returns:
+            set[int]: Indexes of rows to skip.
+        """
+        return {i for i, ok in self.completed.items() if ok or not retry_failed}
+
+    def close(self) -> None:
+        """
+        Closes the journal file.
+        """
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> Self:
+        self._file = open(self.path_for(self.job_id), "a", encoding="utf-8")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _encode(entry: dict[str, Any]) -> str:
+    return json.dumps(entry, separators=(",", ":"), default=str) + "\n"
@@ -0,0 +1,305 @@
+import dataclasses
+import re
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+from mercury_ocip.utils.defines import to_snake_case
+
+MAX_REPORTED_ISSUES = 50  # Issues kept for the pre-flight report
+
+# Columns identifying the entity a row acts on, most specific first. Rows
+# repeating the first set the file has, for the same operation, are duplicates.
+KEY_COLUMNS = (
+    ("serviceUserId",),
+    ("userId",),
+    ("serviceProviderId", "groupId", "name"),
+)
+
+_PHONE_NUMBER = re.compile(r"\+?(\d{1,3}-)?\d{2,23}")
+_EXTENSION = re.compile(r"\d{2,20}")
+_SEGMENT = re.compile(r"\[\d+\]$")
+
+# A column value check, returning what is wrong with the value or None
+Check = Callable[[str], str | None]
+
+
+class PreflightError(ValueError):
+    """
+    Stands in for a row that failed pre-flight checks, so the engine fails it.
+
+    Args:
+        message (str): The row's problems.
+        data (dict[str, Any]): The parsed row, kept for its failure record.
+    """
+
+    def __init__(self, message: str, data: dict[str, Any] | None = None):
+        super().__init__(message)
+        self.data = data or {}
+
+
+@dataclass
+class PreflightIssue:
+    """
+    A problem found in one row of a bulk CSV.
+
+    Args:
+        index (int): The row's index, as used by the bulk engine.
+        message (str): What is wrong with it.
+    """
+
+    index: int
+    message: str
+
+
+@dataclass
+class PreflightReport:
+    """
+    The outcome of checking a bulk CSV before it is sent.
+
+    Args:
+        rows (int): Rows checked.
+        invalid (dict[int, list[str]]): The problems in each row that failed, by row index.
+        issues (list[PreflightIssue]): The first `MAX_REPORTED_ISSUES` problems, in file order.
+        issue_count (int): Every problem found, including those not kept.
+    """
+
+    rows: int = 0
+    invalid: dict[int, list[str]] = field(default_factory=dict)
+    issues: list[PreflightIssue] = field(default_factory=list)
+    issue_count: int = 0
+
+    def add(self, index: int, message: str) -> None:
+        """
+        Records a problem with a row, marking the row invalid.
+        """
+        self.invalid.setdefault(index, []).append(message)
+        self.issue_count += 1
+        if len(self.issues) < MAX_REPORTED_ISSUES:
+            self.issues.append(PreflightIssue(index, message))
+
+    def screen(self, rows: Iterable[tuple[int, Any]]) -> Iterator[tuple[int, Any]]:
+        """
+        Swaps each invalid row for a `PreflightError`, so it fails without being sent.
+
+        Args:
+            rows (Iterable[tuple[int, Any]]): Row indexes and parsed rows, from `BulkEngine.parse_rows`.
+
+        Yields:
+            tuple[int, Any]: The same rows, with invalid ones replaced by their error.
+        """
+        for index, row in rows:
+            if index in self.invalid:
+                row = PreflightError(
+                    "Pre-flight: " + "; ".join(self.invalid[index]),
+                    row if isinstance(row, dict) else None,
+                )
+            yield index, row
+
+
+def _leaf(column: str) -> str:
+    """
+    Returns the last field of a column path, e.g. `phoneNumber` for `alias[0].phoneNumber`.
+    """
+    return _SEGMENT.sub("", column.rsplit(".", 1)[-1])
+
+
+def _top(column: str) -> str:
+    """
+    Returns the top-level field a column sets, in snake case.
+    """
+    return to_snake_case(_SEGMENT.sub("", re.split(r"[.\[]", column, 1)[0]))
+
+
+def _blank(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+class Preflight:
+    """
+    Checks a bulk CSV locally, in a single pass, before any row is sent.
+
+    Each column's checks are worked out once from the header, then every
+    row's values are run through them. Rows are checked for:
+
+    - an `operation` the entity's handler supports,
+    - the fields its command requires that the handler has no default for,
+    - whole numbers in the handler's integer fields,
+    - phone number and extension formats,
+    - the same entity twice for the same operation (see `KEY_COLUMNS`),
+    - a phone number given to two rows, or an extension given to two rows in one group.
+
+    Args:
+        operation_mapping (dict[str, dict[str, Any]] | None): The handler's
+            operation mapping. Without one only the format, duplicate and
+            conflict checks run.
+        command_types (Callable[[str], Any] | None): Looks up a command class by
+            name, used to find its required fields.
+    """
+
+    def __init__(
+        self,
+        operation_mapping: dict[str, dict[str, Any]] | None = None,
+        command_types: Callable[[str], Any] | None = None,
+    ):
+        self.operation_mapping = (
+            operation_mapping if isinstance(operation_mapping, dict) else None
+        )
+        self.command_types = command_types
+        self._required: dict[str, tuple[str, ...]] = {}
+
+    @classmethod
+    def for_handler(cls, handler: Any) -> "Preflight":
+        """
+        Builds the checks for a Mercury bulk handler, e.g. `agent().bulk.users`.
+        """
+        from mercury_ocip.commands import commands
+
+        return cls(
+            getattr(handler, "operation_mapping", None),
+            lambda name: getattr(commands, name, None),
+        )
+
+    def required_fields(self, operation: str) -> tuple[str, ...]:
+        """
+        Returns the snake case fields a row must set for an operation.
+
+        These are the fields its command requires, less any the handler fills
+        in by default.
+
+        Args:
+            operation (str): The row's operation, e.g. `user.create`.
+
+        Returns:
+            tuple[str, ...]: The required fields, empty if they can't be known.
+        """
+        if operation in self._required:
+            return self._required[operation]
+
+        required: tuple[str, ...] = ()
+        mapping = (self.operation_mapping or {}).get(operation) or {}
+        command = (
+            self.command_types(mapping["command"]) if "command" in mapping else None
+        )
+        if command is not None and dataclasses.is_dataclass(command):
+            defaults = mapping.get("defaults") or {}
+            required = tuple(
+                f.name
+                for f in dataclasses.fields(command)
+                if f.default is dataclasses.MISSING
+                and f.default_factory is dataclasses.MISSING
+                and f.name not in defaults
+            )
+        self._required[operation] = required
+        return required
+
+    def check(self, rows: Iterable[dict[str, Any]]) -> PreflightReport:
+        """
+        Checks every row, returning what is wrong with each invalid one.
+
+        Args:
+            rows (Iterable[dict[str, Any]]): The rows as read by `read_csv_rows`.
+
+        Returns:
+            PreflightReport: The rows checked and the problems found.
+        """
+        report = PreflightReport()
+        columns: list[tuple[str, str, list[Check]]] | None = None
+        key_columns: tuple[str, ...] = ()
+        seen_keys: dict[tuple, int] = {}
+        seen_numbers: dict[str, int] = {}
+        seen_extensions: dict[tuple[str, str, str], int] = {}
+
+        for index, row in enumerate(rows):
+            report.rows += 1
+            if columns is None:
+                columns = self._plan(list(row))
+                key_columns = next(
+                    (keys for keys in KEY_COLUMNS if keys[-1] in row), ()
+                )
+
+            operation = row.get("operation")
+            if _blank(operation):
+                report.add(index, "missing operation")
+            elif self.operation_mapping is not None:
+                if operation not in self.operation_mapping:
+                    report.add(index, f"unknown operation '{operation}'")
+                else:
+                    present = {_top(c) for c, value in row.items() if not _blank(value)}
+                    for name in self.required_fields(operation):
+                        if name not in present:
+                            report.add(index, f"missing required field {name}")
+
+            if key_columns and not _blank(row.get(key_columns[-1])):
+                key = (operation, *(row.get(c) or "" for c in key_columns))
+                if (first := seen_keys.setdefault(key, index)) != index:
+                    report.add(index, f"duplicate {key_columns[-1]} of row {first + 1}")
+
+            group = (row.get("serviceProviderId") or "", row.get("groupId") or "")
+            for column, leaf, checks in columns:
+                value = row.get(column)
+                if _blank(value) or value.strip().lower() == "null":
+                    continue
+                for check in checks:
+                    if message := check(value):
+                        report.add(index, f"{column} {message}")
+
+                if leaf == "phoneNumber":
+                    number = value.strip().lstrip("+")
+                    if (first := seen_numbers.setdefault(number, index)) != index:
+                        report.add(
+                            index, f"phone number {value} also used by row {first + 1}"
+                        )
+                elif leaf == "extension":
+                    key = (*group, value.strip())
+                    if (first := seen_extensions.setdefault(key, index)) != index:
+                        report.add(
+                            index, f"extension {value} also used by row {first + 1}"
+                        )
+
+        return report
+
+    def _plan(self, header: list[str]) -> list[tuple[str, str, list[Check]]]:
+        """
+        Works out the format checks for each column of the header.
+        """
+        plan = []
+        # Matched the way the handler's `_process_row` matches them
+        integer_fields = {
+            name
+            for mapping in (self.operation_mapping or {}).values()
+            for name in (mapping.get("integer_fields") or [])
+        }
+        for column in header:
+            if column == "operation":
+                continue
+            leaf = _leaf(column)
+            checks: list[Check] = []
+            if leaf.lower().endswith("phonenumber"):
+                checks.append(_check_phone_number)
+            elif leaf.lower() == "extension":
+                checks.append(_check_extension)
+            if to_snake_case(column) in integer_fields:
+                checks.append(_check_integer)
+            plan.append((column, leaf, checks))
+        return plan
+
+
+def _check_phone_number(value: str) -> str | None:
+    if not _PHONE_NUMBER.fullmatch(value.strip()):
+        return f"'{value}' is not a phone number"
+    return None
+
+
+def _check_extension(value: str) -> str | None:
+    if not _EXTENSION.fullmatch(value.strip()):
+        return f"'{value}' is not an extension (2 to 20 digits)"
+    return None
+
+
+def _check_integer(value: str) -> str | None:
+    try:
+        int(value)
+    except ValueError:
+        return f"'{value}' is not a whole number"
+    return None
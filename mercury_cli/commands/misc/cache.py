@@ -0,0 +1,41 @@
+from mercury_cli.globals import MERCURY_CLI
+from mercury_cli.utils.response_cache import fresh_responses
+from mercury_cli.utils.service_group_id_callable import get_service_provider_ids
+
+completer = MERCURY_CLI.completer()
+console = MERCURY_CLI.console()
+
+cache_group = completer.cache
+cache_group.display_meta = "Manage the completion and response caches"
+
+
+@cache_group.action("refresh", display_meta="Re-fetch every cached completion list")
+def _cache_refresh():
+    with console.status(
+        "[cyan]Refreshing completion cache...", spinner="dots", spinner_style="cyan"
+    ) as status:
+        try:
+            MERCURY_CLI.responses().clear()
+            with fresh_responses():
+                refreshed = MERCURY_CLI.cache().refresh()
+                if refreshed == 0:  # Nothing cached yet, warm the service provider list
+                    get_service_provider_ids()
+                    refreshed = 1
+
+            status.stop()
+            console.print(f"✔ Refreshed {refreshed} cached lists.", style="green")
+        except Exception as e:  # noqa: BLE001
+            status.stop()
+            console.print(f"✘ {e}", style="red")
+
+
+@cache_group.action(
+    "clear", display_meta="Drop every cached completion list and response"
+)
+def _cache_clear():
+    MERCURY_CLI.cache().clear(include_store=True)
+    MERCURY_CLI.responses().clear()
+    console.print(
+        "✔ Completion cache, on-disk index and response cache cleared.",
+        style="green",
+    )
@@ -1,20 +1,42 @@
 from action_completer.types import Empty
 from action_completer.completer import ActionCompleter, ActionParam
+from functools import partial
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any
 import inspect
+import json
+import os
 from mercury_cli.globals import MERCURY_CLI
+from mercury_cli.utils.lazy import LazyChildren
+from mercury_cli.utils.paths import state_dir
 from mercury_ocip.utils.defines import to_snake_case
 from mercury_ocip.plugins.base_plugin import BasePlugin
 
+PLUGIN_ENTRY_POINTS = "mercury_ocip.plugins"  # Entry point group plugins register under
+PLUGIN_MANIFEST = "plugins.json"  # Cached plugin metadata, in the state directory
+MANIFEST_VERSION = 1
+
 completer: ActionCompleter = MERCURY_CLI.completer()
 
-plugin_group = completer.group("plugin", display_meta="Used to view and manage plugins")
+plugin_group = completer.plugin
+plugin_group.display_meta = "Used to view and manage plugins"
 
 
 @plugin_group.action("list", display_meta="List all available plugins")
 def _list_plugins():
-    plugins = MERCURY_CLI.agent().list_plugins()
-    for plugin in plugins:
-        print(plugin.name)
+    entrypoints = discover_plugins()
+    manifest = read_manifest(entrypoints)
+    if manifest is None:
+        manifest, _ = _build_manifest(entrypoints)
+    # Only entry points that loaded as plugins are in the manifest
+    for metadata in manifest:
+        print(metadata["entrypoint"])
+        for name, command in metadata["commands"].items():
+            params = " ".join(f"<{param['name']}>" for param in command["params"])
+            line = f"  {name} {params}".rstrip()
+            print(
+                f"{line} - {command['description']}" if command["description"] else line
+            )
 
 
 def _create_plugin_command(plugin_instance, command_class, full_command_name):
@@ -55,62 +77,237 @@ def _create_plugin_command(plugin_instance, command_class, full_command_name):
     return command_function
 
 
-def load_plugins():
-    for entrypoint in MERCURY_CLI.agent().list_plugins():
-        try:
-            plugin_class = entrypoint.load()
+def discover_plugins() -> list[EntryPoint]:
+    """
+    Returns the installed plugins' entry points, without importing any plugin code.
+    """
+    return list(entry_points(group=PLUGIN_ENTRY_POINTS))
 
-            if not (
-                inspect.isclass(plugin_class)
-                and issubclass(plugin_class, BasePlugin)
-                and plugin_class is not BasePlugin
-            ):
-                continue
 
-            plugin_instance = plugin_class(MERCURY_CLI.client())
-        except Exception as e:
-            print(f"Failed to load plugin {entrypoint.name}: {e}")
-            continue
+def _manifest_key(entrypoints: list[EntryPoint]) -> list[str]:
+    """
+    Identifies the installed plugins by entry point and distribution version.
 
-        named_group = plugin_group.group(
-            to_snake_case(plugin_class.__name__),
-            display_meta=f"{plugin_instance.description}",
-        )
+    Installing, removing or upgrading a plugin changes the key, so the
+    manifest is rebuilt.
+    """
+    key = []
+    for entrypoint in entrypoints:
+        dist = getattr(entrypoint, "dist", None)
+        version = f"{dist.name}=={dist.version}" if dist else ""
+        key.append(f"{entrypoint.name}={entrypoint.value}@{version}")
+    return sorted(key)
 
-        if hasattr(plugin_instance, "get_commands"):
-            commands = plugin_instance.get_commands()
 
-            for command_name, command_class in commands.items():
-                full_command_name = f"{plugin_class.__name__}.{command_name}"
+def _manifest_path() -> str:
+    return os.path.join(state_dir(), PLUGIN_MANIFEST)
+
+
+def read_manifest(entrypoints: list[EntryPoint]) -> list[dict[str, Any]] | None:
+    """
+    Returns the cached plugin metadata, if it was built for these plugins.
+
+    Args:
+        entrypoints (list[EntryPoint]): The installed plugins, from `discover_plugins`.
+
+    Returns:
+        list[dict[str, Any]] | None: Each plugin's group, description and
+        commands, or None if there is no manifest or it is out of date.
+    """
+    try:
+        with open(_manifest_path(), encoding="utf-8") as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if manifest.get("version") != MANIFEST_VERSION or manifest.get("key") != (
+        _manifest_key(entrypoints)
+    ):
+        return None
+    return manifest.get("plugins")
+
+
+def _write_manifest(entrypoints: list[EntryPoint], plugins: list[dict[str, Any]]):
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "key": _manifest_key(entrypoints),
+        "plugins": plugins,
+    }
+    try:
+        path = _manifest_path()
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(manifest, file, indent=2)
+        os.replace(f"{path}.tmp", path)
+    except (OSError, TypeError, ValueError):
+        pass  # Only costs a slower start next time
+
+
+def _instantiate(entrypoint: EntryPoint):
+    """
+    Imports a plugin, creates it with the session's client and attaches it to the agent.
+
+    Returns:
+        The plugin class and instance, or None if the entry point isn't a plugin.
+    """
+    plugin_class = entrypoint.load()
+    if not (
+        inspect.isclass(plugin_class)
+        and issubclass(plugin_class, BasePlugin)
+        and plugin_class is not BasePlugin
+    ):
+        return None
+    plugin_instance = plugin_class(MERCURY_CLI.client())
+
+    # Reachable as e.g. `agent.mock_plugin`, as if the agent had loaded it
+    if (agent := MERCURY_CLI.agent()) is not None:
+        name = getattr(plugin_instance, "name", "") or entrypoint.name
+        setattr(agent, to_snake_case(name), plugin_instance)
+    return plugin_class, plugin_instance
+
+
+def _plugin_metadata(entrypoint: EntryPoint, plugin_class, plugin_instance) -> dict:
+    """
+    Describes a loaded plugin for the manifest: its group, description and commands.
+    """
+    commands = (
+        plugin_instance.get_commands()
+        if hasattr(plugin_instance, "get_commands")
+        else {}
+    )
+    return {
+        "entrypoint": entrypoint.name,
+        "group": to_snake_case(plugin_class.__name__),
+        "description": f"{plugin_instance.description}",
+        "commands": {
+            command_name: {
+                "description": str(getattr(command_class, "description", "")),
+                "params": [
+                    {
+                        "name": param_name,
+                        "help": str(
+                            param_info.get("help", param_info.get("description", ""))
+                        ),
+                    }
+                    for param_name, param_info in getattr(
+                        command_class, "params", {}
+                    ).items()
+                ],
+            }
+            for command_name, command_class in commands.items()
+        },
+    }
 
-                command_func = _create_plugin_command(
-                    plugin_instance, command_class, full_command_name
-                )
 
-                cmd_description = getattr(command_class, "description", "")
-                cmd_params = getattr(command_class, "params", {})
-
-                action_params = []
-
-                for param_name, param_info in cmd_params.items():
-                    if (
-                        source := param_info.get("source", None)
-                    ) is not Empty or callable(source):
-                        param_name = (
-                            None  # Hide from display if source is Empty or callable
-                        )
-
-                    action_params.append(
-                        ActionParam(
-                            source=param_info.get("source", None),
-                            cast=param_info.get("cast", str),
-                            display=param_name,
-                            display_meta=param_info.get(
-                                "help", param_info.get("description", "")
-                            ),
-                        )
+def _register_commands(named_group, entrypoint: EntryPoint, loaded=None) -> None:
+    """
+    Registers a plugin's commands on its group, importing and creating it if needed.
+
+    Args:
+        named_group: The plugin's group, e.g. `plugin mock_plugin`.
+        entrypoint (EntryPoint): The plugin's entry point.
+        loaded: The plugin class and instance, if already created.
+    """
+    try:
+        loaded = loaded or _instantiate(entrypoint)
+    except Exception as e:  # noqa: BLE001
+        print(f"Failed to load plugin {entrypoint.name}: {e}")
+        return
+    if loaded is None:
+        return
+    plugin_class, plugin_instance = loaded
+
+    if hasattr(plugin_instance, "get_commands"):
+        commands = plugin_instance.get_commands()
+
+        for command_name, command_class in commands.items():
+            full_command_name = f"{plugin_class.__name__}.{command_name}"
+
+            command_func = _create_plugin_command(
+                plugin_instance, command_class, full_command_name
+            )
+
+            cmd_description = getattr(command_class, "description", "")
+            cmd_params = getattr(command_class, "params", {})
+
+            action_params = []
+
+            for param_name, param_info in cmd_params.items():
+                if (source := param_info.get("source", None)) is not Empty or callable(
+                    source
+                ):
+                    param_name = (
+                        None  # Hide from display if source is Empty or callable
                     )
 
-                named_group.action(
-                    command_name, display_meta=cmd_description, params=action_params
-                )(command_func)
+                action_params.append(
+                    ActionParam(
+                        source=param_info.get("source", None),
+                        cast=param_info.get("cast", str),
+                        display=param_name,
+                        display_meta=param_info.get(
+                            "help", param_info.get("description", "")
+                        ),
+                    )
+                )
+
+            named_group.action(
+                command_name, display_meta=cmd_description, params=action_params
+            )(command_func)
+
+
+def _build_manifest(entrypoints: list[EntryPoint]):
+    """
+    Loads every plugin to describe it, caching the result as the manifest.
+
+    Entry points that fail to load or aren't plugins are left out. The
+    manifest is only cached if none failed, so those are tried again.
+
+    Returns:
+        The manifest's plugin entries, and the loaded plugin classes and
+        instances by entry point name.
+    """
+    manifest, loaded = [], {}
+    complete = True
+    for entrypoint in entrypoints:
+        try:
+            if (plugin := _instantiate(entrypoint)) is None:
+                continue
+        except Exception as e:  # noqa: BLE001
+            print(f"Failed to load plugin {entrypoint.name}: {e}")
+            complete = False
+            continue
+        loaded[entrypoint.name] = plugin
+        manifest.append(_plugin_metadata(entrypoint, *plugin))
+    if complete:  # Plugins that failed are tried again next start
+        _write_manifest(entrypoints, manifest)
+    return manifest, loaded
+
+
+def load_plugins():
+    """
+    Registers a group for every installed plugin, importing as little as possible.
+
+    Plugin names and descriptions come from a manifest cached in the state
+    directory, keyed by the installed plugins and their versions. A plugin is
+    only imported and created when its group is first completed or run. Without
+    an up to date manifest every plugin is loaded once to build it.
+    """
+    entrypoints = discover_plugins()
+    manifest = read_manifest(entrypoints)
+    loaded = {}
+    if manifest is None:
+        manifest, loaded = _build_manifest(entrypoints)
+
+    by_name = {entrypoint.name: entrypoint for entrypoint in entrypoints}
+    for metadata in manifest:
+        entrypoint = by_name[metadata["entrypoint"]]
+        named_group = plugin_group.group(
+            metadata["group"], display_meta=metadata["description"]
+        )
+        named_group.children = LazyChildren(
+            loader=partial(
+                _register_commands,
+                named_group,
+                entrypoint,
+                loaded.get(entrypoint.name),
+            )
+        )
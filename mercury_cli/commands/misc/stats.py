@@ -0,0 +1,57 @@
+from rich import box
+from rich.table import Table
+
+from mercury_cli.globals import MERCURY_CLI
+
+completer = MERCURY_CLI.completer()
+console = MERCURY_CLI.console()
+
+stats_group = completer.stats
+stats_group.display_meta = "Show OCI-P request timings for this session"
+
+
+def _ms(value) -> str:
+    return "-" if value is None else f"{value:.1f}"
+
+
+@stats_group.action("show", display_meta="Per-request-type latency percentiles")
+def _stats_show():
+    rows = MERCURY_CLI.stats().rows()
+    if not rows:
+        console.print("No requests recorded yet.", style="yellow")
+        return
+
+    table = Table(box=box.SIMPLE_HEAD, header_style="subheader")
+    table.add_column("Request", style="label")
+    for column in ("Count", "Errors", "p50 ms", "p95 ms", "Max ms", "Total ms"):
+        table.add_column(column, justify="right", style="value")
+    table.add_column("Sent / Recv KB", justify="right", style="value")
+
+    for row in rows:
+        table.add_row(
+            row["request_type"],
+            str(row["count"]),
+            f"[red]{row['errors']}[/]" if row["errors"] else "0",
+            _ms(row["p50_ms"]),
+            _ms(row["p95_ms"]),
+            _ms(row["max_ms"]),
+            _ms(row["total_ms"]),
+            f"{row['request_bytes'] / 1024:.1f} / {row['response_bytes'] / 1024:.1f}",
+        )
+
+    console.print(table)
+
+    governor = getattr(MERCURY_CLI.client(), "governor", None)
+    if governor is not None:
+        state = governor.snapshot()
+        console.print(
+            f"Concurrency limit {state['limit']:g} of {state['max_concurrency']}, "
+            f"{state['retries']} retries, cut {state['throttled']} times under load",
+            style="label",
+        )
+
+
+@stats_group.action("reset", display_meta="Clear the recorded request timings")
+def _stats_reset():
+    MERCURY_CLI.stats().reset()
+    console.print("✔ Request stats cleared.", style="green")
@@ -1,10 +1,25 @@
+import threading
+import uuid
+from typing import TYPE_CHECKING
+
 from action_completer import ActionCompleter
-from mercury_ocip import Client
-from mercury_ocip import Agent
 from prompt_toolkit import PromptSession
 from rich.console import Console
 from rich.theme import Theme
 
+from mercury_cli.utils.cache import TTLCache
+from mercury_cli.utils.client_pool import DEFAULT_POOL_SIZE, ClientPool
+from mercury_cli.utils.completion_index import CompletionIndex
+from mercury_cli.utils.governor import DEFAULT_MAX_RETRIES, TrafficGovernor
+from mercury_cli.utils.instrumentation import InstrumentedClient, RequestStats
+from mercury_cli.utils.response_cache import DEFAULT_RESPONSE_TTL, ResponseCache
+
+if TYPE_CHECKING:  # mercury_ocip loads its full command catalogue on import
+    from mercury_ocip import Agent, Client
+
+# Held while the Agent's plugin loading flag is set, see `agent_auth`
+_AGENT_LOCK = threading.Lock()
+
 
 class MERCURY_CLI:
     """
@@ -17,10 +32,14 @@ class MERCURY_CLI:
 
     __instance: "MERCURY_CLI" = None
     __completer: ActionCompleter
-    __client: Client = None
+    __client: "Client" = None
     __session: PromptSession = None
-    __agent: Agent = None
+    __agent: "Agent" = None
     __console: Console = None
+    __cache: TTLCache = None
+    __stats: RequestStats = None
+    __responses: ResponseCache = None
+    __error_console: Console = None
 
     def __new__(cls: "MERCURY_CLI"):
         """
@@ -34,40 +53,101 @@ class MERCURY_CLI:
 
     def __init__(self):
         """
-        Initializes the action completer for the CLI.
+        Initializes the action completer, completion and response caches and request stats for the CLI.
         """
         self.__completer = ActionCompleter()
-        self.__console = Console(
-            theme=Theme(
-                {
-                    "header": "bold #deaaff",
-                    "subheader": "bold #d8bbff",
-                    "version": "bold #c0fdff",
-                    "divider": "#666666",
-                    "separator": "#666666",
-                    "label": "#ffffff",
-                    "value": "#87d787",
-                    "success": "bold #C3EBC3",
-                    "error": "bold #FFB6B0",
-                    "prompt": "bold #c0fdff",
-                }
-            )
+        self.__cache = TTLCache()
+        self.__stats = RequestStats()
+        self.__responses = ResponseCache()
+        theme = Theme(
+            {
+                "header": "bold #deaaff",
+                "subheader": "bold #d8bbff",
+                "version": "bold #c0fdff",
+                "divider": "#666666",
+                "separator": "#666666",
+                "label": "#ffffff",
+                "value": "#87d787",
+                "success": "bold #C3EBC3",
+                "error": "bold #FFB6B0",
+                "prompt": "bold #c0fdff",
+            }
         )
+        self.__console = Console(theme=theme)
+        # Messages while command output is streamed to stdout, see `message_console`
+        self.__error_console = Console(theme=theme, stderr=True)
 
-    def client_auth(self, username: str, password: str, host: str, tls: bool = True):
+    def client_auth(
+        self,
+        username: str,
+        password: str,
+        host: str,
+        tls: bool = True,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        max_rate: float | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        response_ttl: float = DEFAULT_RESPONSE_TTL,
+    ):
         """
         Authenticates the client with the provided credentials.
 
+        Up to `pool_size` sessions are opened on demand (see `ClientPool`), so
+        concurrent requests don't queue on one session, and idle sessions are
+        kept alive. Requests are paced by a `TrafficGovernor`, which adapts
+        how many run at once to the server's latency and errors and retries
+        transient failures. The pool is wrapped so every request it makes is
+        recorded in the session's request stats, and responses to read-only
+        requests are reused for `response_ttl` seconds (see `ResponseCache`).
+        Any cached completions and stats from a previous session are dropped
+        and the service provider list is prefetched in the background.
+        Completion lists are also persisted to an on-disk index for this host
+        and user, so a later session can serve them before its own fetches
+        complete.
+
         Args:
             username (str): Username for authentication.
             password (str): Password for authentication.
             host (str): Host address of the server.
             tls (bool): Whether to use TLS for the connection. Defaults to True.
+            pool_size (int): Most sessions opened at once. Defaults to DEFAULT_POOL_SIZE.
+            max_rate (float | None): Most requests started per second. Defaults to no cap.
+            max_retries (int): Retries for a transiently failing request. Defaults to DEFAULT_MAX_RETRIES.
+            response_ttl (float): Seconds a read-only response is reused, 0 to always ask the server.
         """
-        self.__client = Client(
-            username=username, password=password, host=host, conn_type="SOAP", tls=tls
+        from mercury_ocip import Client
+
+        def _login() -> "Client":
+            return Client(
+                username=username,
+                password=password,
+                host=host,
+                conn_type="SOAP",
+                tls=tls,
+                session_id=str(uuid.uuid4()),  # The default is shared by every Client
+            )
+
+        governor = TrafficGovernor(
+            max_concurrency=pool_size, rate=max_rate, max_retries=max_retries
         )
+        pool = ClientPool(_login, size=pool_size, governor=governor)
+        if self.__client is not None:
+            self.__client.disconnect()
+        self.__responses.clear()
+        self.__responses.ttl = response_ttl
+        self.__client = InstrumentedClient(pool, self.__stats, self.__responses)
+        pool.start_keepalive()
         self.agent_auth()
+        self.__cache.clear()
+        if self.__cache.store is not None:
+            self.__cache.store.close()
+        self.__cache.store = CompletionIndex.for_account(host, username)
+        self.__stats.reset()
+
+        from mercury_cli.utils.service_group_id_callable import (
+            prefetch_service_provider_ids,
+        )
+
+        prefetch_service_provider_ids()
 
     def agent_auth(self):
         """
@@ -78,7 +158,23 @@ class MERCURY_CLI:
         """
         if not self.__client:
             raise Exception("Client not initialized. Call client_auth() first.")
-        self.__agent = Agent.get_instance(client=self.__client)
+
+        from mercury_ocip import Agent
+
+        # Plugins are loaded on first use by `load_plugins`, which attaches
+        # each to the agent, so the agent mustn't import and create them all up
+        # front. mercury_ocip has no option for that, so this relies on the
+        # re-entrancy guard of `Agent.load_plugins`: it returns at once while
+        # the class flag `_loading_plugins` is set. The flag is shared by every
+        # thread, so it is only set under a lock and put back as it was, and
+        # test_agent_auth_defers_plugin_loading checks it still has this effect.
+        with _AGENT_LOCK:
+            loading = Agent._loading_plugins
+            Agent._loading_plugins = True
+            try:
+                self.__agent = Agent.get_instance(client=self.__client)
+            finally:
+                Agent._loading_plugins = loading
 
     def session_create(self, **kwargs):
         """
@@ -100,7 +196,7 @@ class MERCURY_CLI:
         return MERCURY_CLI.__instance
 
     @staticmethod
-    def client() -> Client:
+    def client() -> "Client":
         """
         Retrieves the authenticated client instance.
 
@@ -130,7 +226,7 @@ class MERCURY_CLI:
         return MERCURY_CLI.__instance.__completer
 
     @staticmethod
-    def agent() -> Agent:
+    def agent() -> "Agent":
         """
         Retrieves the initialized agent instance.
 
@@ -149,5 +245,45 @@ class MERCURY_CLI:
         """
         return MERCURY_CLI.__instance.__console
 
+    @staticmethod
+    def error_console() -> Console:
+        """
+        Retrieves the Rich console writing to stderr.
+
+        Returns:
+            Console: The console for messages while output is streamed to stdout.
+        """
+        return MERCURY_CLI.__instance.__error_console
+
+    @staticmethod
+    def cache() -> TTLCache:
+        """
+        Retrieves the completion cache.
+
+        Returns:
+            TTLCache: The cache shared by the dynamic completers.
+        """
+        return MERCURY_CLI.__instance.__cache
+
+    @staticmethod
+    def stats() -> RequestStats:
+        """
+        Retrieves the session's request statistics.
+
+        Returns:
+            RequestStats: Latency, size and error counts per OCI-P request type.
+        """
+        return MERCURY_CLI.__instance.__stats
+
+    @staticmethod
+    def responses() -> ResponseCache:
+        """
+        Retrieves the cache of read-only request responses.
+
+        Returns:
+            ResponseCache: Responses reused by the client until they expire or a change invalidates them.
+        """
+        return MERCURY_CLI.__instance.__responses
+
 
 MERCURY_CLI()
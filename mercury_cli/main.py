@@ -1,17 +1,22 @@
 import sys
 import os
-from importlib import metadata
+import threading
+import time
+from importlib import import_module, metadata
 from prompt_toolkit.styles import Style
 from rich.text import Text
 from rich.prompt import Prompt
 from prompt_toolkit.auto_suggest import AutoSuggestFromHistory
 
+import mercury_cli
 from mercury_cli.globals import MERCURY_CLI
-from mercury_cli.utils.egg import main as egg_main  # noqa: F401
-from mercury_cli.commands.misc.plugins import load_plugins
-import mercury_cli.commands  # noqa: F401
+from mercury_cli.utils.async_completer import BackgroundCompleter
+from mercury_cli.utils.client_pool import DEFAULT_POOL_SIZE
+from mercury_cli.utils.governor import DEFAULT_MAX_RETRIES
+from mercury_cli.utils.response_cache import DEFAULT_RESPONSE_TTL
+from mercury_cli.utils.script import run_script
+import mercury_cli.commands
 import argparse
-from mercury_ocip.exceptions import MError
 
 SPLASH_ART = """
 ███╗   ███╗███████╗██████╗  ██████╗██╗   ██╗██████╗ ██╗   ██╗      ██████╗██╗     ██╗
@@ -31,6 +36,43 @@ parser.add_argument("--username", required=False, type=str)
 parser.add_argument("--password-env", required=False, type=str)
 parser.add_argument("--host", required=False, type=str)
 parser.add_argument("--action", required=False, type=str)
+parser.add_argument(
+    "--script", required=False, type=str, help="File of actions to run, or - for stdin"
+)
+parser.add_argument("--fail-fast", required=False, action="store_true")
+parser.add_argument(
+    "--pool-size",
+    required=False,
+    type=int,
+    default=DEFAULT_POOL_SIZE,
+    help="Most server sessions opened at once for concurrent requests",
+)
+parser.add_argument(
+    "--max-rate",
+    required=False,
+    type=float,
+    help="Most requests sent to the server per second (default: no cap)",
+)
+parser.add_argument(
+    "--max-retries",
+    required=False,
+    type=int,
+    default=DEFAULT_MAX_RETRIES,
+    help="Retries for a request that times out or is rejected under load",
+)
+parser.add_argument(
+    "--response-ttl",
+    required=False,
+    type=float,
+    default=DEFAULT_RESPONSE_TTL,
+    help="Seconds read-only responses are reused within the session, 0 to disable",
+)
+parser.add_argument(
+    "--timings",
+    required=False,
+    action="store_true",
+    help="Print how long startup, login and --action/--script took",
+)
 args = parser.parse_args()
 
 
@@ -50,6 +92,18 @@ def show_splash() -> None:
     console.print(welcome_text, justify="center", overflow="crop", no_wrap=True)
 
 
+def connection_options() -> dict:
+    """
+    Returns the session pool, traffic and response cache options given on the command line.
+    """
+    return {
+        "pool_size": args.pool_size,
+        "max_rate": args.max_rate,
+        "max_retries": args.max_retries,
+        "response_ttl": args.response_ttl,
+    }
+
+
 def authenticate() -> None:
     """
     Prompts the user for authentication details and authenticates the mercury client.
@@ -63,16 +117,90 @@ def authenticate() -> None:
     )
 
     MERCURY_CLI.get().client_auth(
-        username=username, password=password, host=host, tls=True
+        username=username,
+        password=password,
+        host=host,
+        tls=True,
+        **connection_options(),
     )  # Authenticate mercury client
 
 
+def run_script_file(path: str, fail_fast: bool = False) -> int:
+    """
+    Runs a script of actions on the authenticated session, one action per line.
+
+    Args:
+        path (str): The script file, or "-" to read actions from stdin.
+        fail_fast (bool): If True, stop at the first failed line.
+
+    Returns:
+        int: The process exit code, 1 if any line failed, otherwise 0.
+    """
+    try:
+        if path == "-":
+            results = run_script(
+                MERCURY_CLI.completer(),
+                console,
+                sys.stdin,
+                fail_fast=fail_fast,
+                error_console=MERCURY_CLI.error_console(),
+            )
+        else:
+            with open(path, "r", encoding="utf-8") as file:
+                results = run_script(
+                    MERCURY_CLI.completer(),
+                    console,
+                    file,
+                    fail_fast=fail_fast,
+                    error_console=MERCURY_CLI.error_console(),
+                )
+    except OSError as e:
+        console.print(f"[error]Cannot read script: {e}[/error]")
+        return 1
+    finally:
+        MERCURY_CLI.client().disconnect()  # Mercury Client Cleanup
+
+    return 1 if any(not result.ok for result in results) else 0
+
+
+def print_timings(**phases: float) -> None:
+    """
+    Prints startup phase timings to stderr when --timings is given.
+
+    Args:
+        **phases (float): Phase names mapped to the seconds they took, in order.
+    """
+    if not args.timings:
+        return
+    total = time.perf_counter() - mercury_cli.STARTED
+    timings = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in phases.items())
+    print(f"timings: {timings}, total {total:.2f}s", file=sys.stderr)
+
+
+def preload_client_library() -> None:
+    """
+    Imports mercury_ocip in the background while the user types their login.
+
+    Loading its command catalogue takes a few seconds, which would otherwise
+    all land after the credentials are entered.
+    """
+    threading.Thread(target=import_module, args=("mercury_ocip",), daemon=True).start()
+
+
 def main():
     """
     Main entry point for the mercury_cli application.
 
     Handles user authentication, session creation, and command processing loop.
+    Command modules and the mercury_ocip client library are only imported once
+    they are needed, so one-shot `--action` runs stay fast to start.
     """
+    started = time.perf_counter()
+    startup = started - mercury_cli.STARTED
+
+    if not (args.username and args.password_env and args.host) and not args.no_login:
+        preload_client_library()
+
     show_splash()
 
     while True:  # If authentication fails, prompt again
@@ -85,30 +213,46 @@ def main():
                     password=os.getenv(args.password_env),
                     host=args.host,
                     tls=True,
+                    **connection_options(),
                 )
+                logged_in = time.perf_counter()
 
                 if args.action:  # Run single action and exit
                     MERCURY_CLI.completer().run_action(args.action)
+                    print_timings(
+                        startup=startup,
+                        login=logged_in - started,
+                        action=time.perf_counter() - logged_in,
+                    )
                     sys.exit()
+
+                if args.script:  # Run every action in the script on this session
+                    exit_code = run_script_file(args.script, args.fail_fast)
+                    print_timings(
+                        startup=startup,
+                        login=logged_in - started,
+                        script=time.perf_counter() - logged_in,
+                    )
+                    sys.exit(exit_code)
             elif not args.no_login:  # Skip login if --no-login is provided
                 authenticate()
             break
-        except MError as e:
-            console.print(
-                f"[error]Authentication failed: {e} \n Please try again.\n [/error]"
-            )
-            continue
         except Exception as e:
             console.print(
                 f"[error]Authentication failed: {e} \n Please try again.\n [/error]"
             )
+            # Imported here as mercury_ocip is loaded lazily, and is by now
+            from mercury_ocip.exceptions import MError
+
+            if isinstance(e, MError):
+                continue
             sys.exit()
 
     MERCURY_CLI.get().session_create(  # Create terminal prompt session
         message="mercury_cli >>> ",
         style=Style.from_dict({"prompt": "ansicyan bold #c0fdff"}),
         refresh_interval=1,
-        completer=MERCURY_CLI.completer(),
+        completer=BackgroundCompleter(MERCURY_CLI.completer()),
         auto_suggest=AutoSuggestFromHistory(),
     )
 
@@ -118,6 +262,8 @@ def main():
                 "[yellow]Warning: You are running in no-login mode. There is no client session, no commands can be sent to the server.[/]"
             )
         else:
+            from mercury_cli.commands.misc.plugins import load_plugins
+
             load_plugins()
     except Exception as e:
         print(f"Plugins failed to load: {e}")
@@ -145,6 +291,8 @@ def command_loop() -> None:
                 case "":  # If command is empty, ignore and re-prompt
                     continue
                 case "mercury":  # Hidden easter egg command
+                    from mercury_cli.utils.egg import main as egg_main
+
                     egg_main()
                     continue
                 case _:  # Default case to run any other command
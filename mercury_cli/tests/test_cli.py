@@ -1,11 +1,15 @@
 import sys
 import os
+import subprocess
 from unittest.mock import MagicMock, patch
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
 
 from mercury_cli.globals import MERCURY_CLI
-from mercury_cli.main import authenticate, show_splash
+from mercury_cli.main import authenticate, run_script_file, show_splash
+from mercury_cli.utils.client_pool import DEFAULT_POOL_SIZE
+from mercury_cli.utils.governor import DEFAULT_MAX_RETRIES
+from mercury_cli.utils.response_cache import DEFAULT_RESPONSE_TTL
 
 
 def test_singleton_instance():
@@ -30,6 +34,25 @@ def test_globals():
     assert hasattr(instance, "session_create")
 
 
+def test_agent_auth_defers_plugin_loading():
+    """agent_auth relies on Agent._loading_plugins to keep the agent from loading plugins."""
+    from mercury_ocip import Agent
+
+    instance = MERCURY_CLI.get()
+    with (
+        patch.object(instance, "_MERCURY_CLI__client", MagicMock()),
+        patch.object(instance, "_MERCURY_CLI__agent", None),
+        patch.object(Agent, "_Agent__instance", None),
+        patch("importlib.metadata.entry_points") as entry_points,
+    ):
+        instance.agent_auth()
+        assert entry_points.call_count == 0
+        assert Agent._loading_plugins is False
+
+        MERCURY_CLI.agent().load_plugins()  # The flag is what skipped it
+        assert entry_points.call_count == 1
+
+
 def test_show_splash(capsys):
     """Test that show_splash prints to stdout."""
     show_splash()
@@ -56,5 +79,91 @@ def test_authenticate_flow(mock_cli_get, mock_prompt):
 
     # Verify client_auth was called on the singleton instance with correct args
     mock_instance.client_auth.assert_called_once_with(
-        username="testuser", password="secret", host="https://test.host", tls=True
-    )
\ No newline at end of file
+        username="testuser",
+        password="secret",
+        host="https://test.host",
+        tls=True,
+        pool_size=DEFAULT_POOL_SIZE,
+        max_rate=None,
+        max_retries=DEFAULT_MAX_RETRIES,
+        response_ttl=DEFAULT_RESPONSE_TTL,
+    )
+
+
+@patch("mercury_cli.globals.MERCURY_CLI.client")
+@patch("mercury_cli.globals.MERCURY_CLI.completer")
+def test_run_script_file(mock_completer, mock_client, tmp_path, capsys):
+    """Each script line runs on the same session and reports its status."""
+    console = MERCURY_CLI.console()
+
+    def run_action(action):
+        if action == "bad":
+            console.print("✘ Something went wrong.", style="red")
+        if action == "raises":
+            raise ValueError("boom")
+
+    mock_completer.return_value.run_action.side_effect = run_action
+    script = tmp_path / "actions.txt"
+    script.write_text("# nightly\nsysver\n\nbad\nraises\nsysver\n")
+
+    assert run_script_file(str(script)) == 1
+    assert mock_completer.return_value.run_action.call_count == 4
+    mock_client.return_value.disconnect.assert_called_once()
+
+    output = capsys.readouterr().out
+    assert "✔ line 2" in output
+    assert "✘ line 4" in output
+    assert "✘ line 5" in output and "boom" in output
+    assert "4 actions, 2 failed" in output
+
+    mock_completer.return_value.run_action.reset_mock()
+    assert run_script_file(str(script), fail_fast=True) == 1
+    assert mock_completer.return_value.run_action.call_count == 2
+
+
+@patch("mercury_cli.globals.MERCURY_CLI.agent")
+@patch("mercury_cli.globals.MERCURY_CLI.client")
+def test_run_script_counts_failures_reported_on_stderr(
+    mock_client, mock_agent, tmp_path, capsys
+):
+    """A line streaming its output to stdout still fails on the error it prints to stderr."""
+    mock_agent.return_value.automate.audit_group.side_effect = RuntimeError("boom")
+    script = tmp_path / "actions.txt"
+    script.write_text("automations group_audit SP1 G1 --output jsonl\n")
+
+    assert run_script_file(str(script)) == 1
+    captured = capsys.readouterr()
+    assert "✘ boom" in captured.err
+    assert "✘ line 1" in captured.out
+
+
+def test_startup_defers_heavy_imports():
+    """Startup budget: command modules and mercury_ocip load only when first used."""
+    deferred = (
+        "mercury_ocip",
+        "asciimatics",
+        "mercury_cli.commands.bulk.bulk",
+        "mercury_cli.commands.automations.automations",
+    )
+    code = (
+        "import sys; sys.argv = ['mercury-cli']; import mercury_cli.main; "
+        f"print([m for m in {deferred!r} if m in sys.modules])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_lazy_command_groups_load_on_use():
+    """Every manifest group is registered up front and fills in when looked inside."""
+    from mercury_cli.commands import COMMAND_MANIFEST
+    from mercury_cli.utils.lazy import LazyChildren
+
+    root = MERCURY_CLI.completer().root
+    for name, (display_meta, modules) in COMMAND_MANIFEST.items():
+        group = root.children[name]
+        assert isinstance(group.children, LazyChildren)
+        assert group.display_meta == display_meta
+        assert len(group.children) > 0
+        assert all(module in sys.modules for module in modules)
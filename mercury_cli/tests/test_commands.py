@@ -1,13 +1,17 @@
 import sys
 import os
+import json
 from unittest.mock import MagicMock, patch
 import pytest
 from mercury_cli.globals import MERCURY_CLI
 from mercury_cli.commands.misc.plugins import load_plugins
+from mercury_cli.utils import response_cache
 from mercury_ocip.plugins.base_plugin import BasePlugin
 from mercury_cli.utils.service_group_id_callable import (
         _get_group_id_completions,
         _get_service_provider_id_completions,
+        _group_candidates,
+        get_group_ids,
     )
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
@@ -33,6 +37,11 @@ def mock_cli_components():
         mocks.bulk = mock_bulk
         yield mocks
 
+@pytest.fixture(autouse=True)
+def isolated_state_dir(monkeypatch, tmp_path):
+    """Keep bulk job journals out of the real home directory."""
+    monkeypatch.setenv("MERCURY_CLI_HOME", str(tmp_path / "state"))
+
 @pytest.fixture(autouse=True)
 def clear_plugin_actions_between_tests():
     """Ensure plugin-related actions don't leak between tests.
@@ -55,16 +64,627 @@ def clear_plugin_actions_between_tests():
             if key != "list":
                 plugin_action.children.pop(key, None)
 
-def test_bulk_create(mock_cli_components):
+def test_bulk_create(mock_cli_components, tmp_path):
     """Test bulk create command invocation."""
-    test_file = "items.csv"
+    test_file = tmp_path / "items.csv"
+    test_file.write_text("operation,userId\nuser.create,alice\nuser.create,bob\n")
     command = f"bulk create user {test_file}"
-    
-    # Mock file existence so argument validation passes
-    with patch("os.path.exists", return_value=True):
-        MERCURY_CLI.completer().run_action(command)
-        
-    mock_cli_components.agent.bulk.create_user_from_csv.assert_called_once_with(test_file)
+
+    users = mock_cli_components.agent.bulk.users
+    users._process_row.side_effect = lambda row: {"user_id": row["userId"]}
+    users.execute_from_data.side_effect = lambda rows, dry_run: [
+        {"index": 0, "data": rows[0], "success": True}
+    ]
+
+    MERCURY_CLI.completer().run_action(command)
+
+    assert users.execute_from_data.call_count == 2
+    users.execute_from_data.assert_any_call([{"user_id": "alice"}], False)
+    users.execute_from_data.assert_any_call([{"user_id": "bob"}], False)
+
+
+def test_bulk_create_with_workers(capsys, mock_cli_components, tmp_path):
+    """Rows run across the worker pool and are reported in row order."""
+    test_file = tmp_path / "items.csv"
+    test_file.write_text(
+        "operation,userId\n" + "".join(f"user.create,u{i}\n" for i in range(20))
+    )
+
+    users = mock_cli_components.agent.bulk.users
+    users._process_row.side_effect = lambda row: {"user_id": row["userId"]}
+    users.execute_from_data.side_effect = lambda rows, dry_run: [
+        {"index": 0, "data": rows[0], "success": rows[0]["user_id"] != "u7"}
+    ]
+
+    MERCURY_CLI.completer().run_action(f"bulk create user {test_file} --workers 4")
+
+    captured = capsys.readouterr()
+    assert users.execute_from_data.call_count == 20
+    assert "1 users failed to process. 19 succeeded." in captured.out
+    assert "Row 8" in captured.out
+
+def test_bulk_resume_skips_completed_rows(capsys, mock_cli_components, tmp_path):
+    """An interrupted job resumes from its journal without re-running finished rows."""
+    from mercury_cli.commands.bulk.journal import BulkJournal
+
+    test_file = tmp_path / "items.csv"
+    test_file.write_text(
+        "operation,userId\n" + "".join(f"user.create,u{i}\n" for i in range(5))
+    )
+
+    users = mock_cli_components.agent.bulk.users
+    users._process_row.side_effect = lambda row: {"user_id": row["userId"]}
+
+    def execute(rows, dry_run):
+        if rows[0]["user_id"] == "u3":
+            raise KeyboardInterrupt
+        return [{"index": 0, "data": rows[0], "success": rows[0]["user_id"] != "u1"}]
+
+    users.execute_from_data.side_effect = execute
+    MERCURY_CLI.completer().run_action(f"bulk create user {test_file} --chunk-size 1")
+
+    (job_id,) = BulkJournal.list_job_ids()
+    assert f"bulk resume {job_id}" in capsys.readouterr().out
+
+    users.execute_from_data.reset_mock()
+    users.execute_from_data.side_effect = lambda rows, dry_run: [
+        {"index": 0, "data": rows[0], "success": True}
+    ]
+    MERCURY_CLI.completer().run_action(f"bulk resume {job_id} --retry-failed")
+
+    resumed = [c.args[0][0]["user_id"] for c in users.execute_from_data.call_args_list]
+    assert resumed == ["u1", "u3", "u4"]
+    assert "Skipped 2 rows" in capsys.readouterr().out
+
+    results = [json.loads(line) for line in (tmp_path / "items.results.jsonl").read_text().splitlines()]
+    assert sorted(r["index"] for r in results) == [0, 1, 2, 3, 4]
+    assert all(r["success"] for r in results)
+
+def test_bulk_resume_refuses_an_edited_csv(capsys, mock_cli_components, tmp_path):
+    """Resuming after the CSV changed would skip the wrong rows, so it is refused."""
+    from mercury_cli.commands.bulk.journal import BulkJournal
+
+    test_file = tmp_path / "items.csv"
+    test_file.write_text("operation,userId\nuser.create,u0\nuser.create,u1\n")
+
+    users = mock_cli_components.agent.bulk.users
+    users._process_row.side_effect = lambda row: {"user_id": row["userId"]}
+    users.execute_from_data.side_effect = lambda rows, dry_run: [
+        {"index": 0, "data": rows[0], "success": False}
+    ]
+    MERCURY_CLI.completer().run_action(f"bulk create user {test_file}")
+    (job_id,) = BulkJournal.list_job_ids()
+
+    test_file.write_text("operation,userId\nuser.create,u9\nuser.create,u1\n")
+    users.execute_from_data.reset_mock()
+    capsys.readouterr()
+    MERCURY_CLI.completer().run_action(f"bulk resume {job_id} --retry-failed")
+
+    assert users.execute_from_data.call_count == 0
+    assert "has changed since job" in " ".join(capsys.readouterr().out.split())
+
+    # Without a fingerprint there is no telling the file is unchanged
+    journal_path = BulkJournal.path_for(job_id)
+    with open(journal_path, encoding="utf-8") as file:
+        header, *rows = file.read().splitlines()
+    header = json.loads(header)
+    del header["fingerprint"]
+    with open(journal_path, "w", encoding="utf-8") as file:
+        file.write("\n".join([json.dumps(header), *rows]) + "\n")
+    MERCURY_CLI.completer().run_action(f"bulk resume {job_id} --retry-failed")
+
+    assert users.execute_from_data.call_count == 0
+    assert "has changed since job" in " ".join(capsys.readouterr().out.split())
+
+
+def test_bulk_results_streamed_to_file(mock_cli_components, tmp_path):
+    """Each row result is written to the results file as it completes."""
+    test_file = tmp_path / "items.csv"
+    test_file.write_text("operation,userId\nuser.create,alice\n\nuser.create,bob\n")
+    results_file = tmp_path / "out.jsonl"
+
+    users = mock_cli_components.agent.bulk.users
+    users._process_row.side_effect = lambda row: {"user_id": row["userId"]}
+    users.execute_from_data.side_effect = lambda rows, dry_run: [
+        {
+            "index": 0,
+            "data": rows[0],
+            "command": object(),
+            "response": "Already exists" if rows[0]["user_id"] == "bob" else None,
+            "success": rows[0]["user_id"] != "bob",
+        }
+    ]
+
+    MERCURY_CLI.completer().run_action(
+        f"bulk create user {test_file} --chunk-size 1 --results {results_file}"
+    )
+
+    records = [json.loads(line) for line in results_file.read_text().splitlines()]
+    assert [r["index"] for r in records] == [0, 1]
+    assert records[1] == {
+        "index": 1,
+        "success": False,
+        "data": {"user_id": "bob"},
+        "response": "Already exists",
+    }
+
+
+def test_bulk_output_streams_records_to_stdout(capsys, mock_cli_components, tmp_path):
+    """--output jsonl writes only the row records to stdout, without the progress or summary."""
+    test_file = tmp_path / "items.csv"
+    test_file.write_text("operation,userId\nuser.create,alice\nuser.create,bob\n")
+
+    users = mock_cli_components.agent.bulk.users
+    users._process_row.side_effect = lambda row: {"user_id": row["userId"]}
+    users.execute_from_data.side_effect = lambda rows, dry_run: [
+        {"index": 0, "data": rows[0], "success": rows[0]["user_id"] != "bob"}
+    ]
+
+    MERCURY_CLI.completer().run_action(f"bulk create user {test_file} --output jsonl")
+
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [(r["data"]["user_id"], r["success"]) for r in records] == [
+        ("alice", True),
+        ("bob", False),
+    ]
+
+
+def test_bulk_batches_rows_per_round_trip(mock_cli_components, tmp_path):
+    """With --batch-size, row commands share a round trip and results are split back out."""
+    from mercury_ocip.commands.base_command import ErrorResponse
+
+    test_file = tmp_path / "items.csv"
+    test_file.write_text(
+        "operation,userId\n" + "".join(f"user.create,u{i}\n" for i in range(5))
+    )
+    results_file = tmp_path / "out.jsonl"
+
+    users = mock_cli_components.agent.bulk.users
+    users.client.conn_type = "SOAP"
+    users._process_row.side_effect = lambda row: dict(row)
+    users._create_command.side_effect = lambda data, operation: data["userId"]
+
+    batches = []
+
+    def send_batch(client, commands):
+        batches.append(commands)
+        return [
+            ErrorResponse(summary="Duplicate", detail="exists") if c == "u3" else None
+            for c in commands
+        ]
+
+    with patch("mercury_cli.commands.bulk.engine.send_batch", side_effect=send_batch):
+        MERCURY_CLI.completer().run_action(
+            f"bulk create user {test_file} --batch-size 2 --results {results_file}"
+        )
+
+    assert batches == [["u0", "u1"], ["u2", "u3"], ["u4"]]
+    users.execute_from_data.assert_not_called()
+    records = [json.loads(line) for line in results_file.read_text().splitlines()]
+    assert [r["success"] for r in records] == [True, True, True, False, True]
+    assert records[3]["response"] == "Duplicate"
+    assert records[3]["data"] == {"userId": "u3"}
+
+
+def test_bulk_preflight_only_sends_clean_rows(capsys, mock_cli_components, tmp_path):
+    """Rows failing local checks are reported and failed without being sent."""
+    from mercury_ocip.bulk.user import UserBulkOperations
+
+    test_file = tmp_path / "users.csv"
+    test_file.write_text(
+        "operation,userId,lastName,firstName,callingLineIdLastName,callingLineIdFirstName,phoneNumber,extension\n"
+        "user.create,alice,A,Alice,A,Alice,+44-1234567,1001\n"
+        "user.create,alice,A,Alice,A,Alice,,\n"
+        "user.create,bob,,Bob,B,Bob,+44-12abc,\n"
+        "user.create,carol,C,Carol,C,Carol,+44-1234567,1001\n"
+        "user.remove,dave,D,Dave,D,Dave,,\n"
+        "user.create,erin,E,Erin,E,Erin,,1002\n"
+    )
+
+    users = mock_cli_components.agent.bulk.users
+    users.operation_mapping = UserBulkOperations(MagicMock()).operation_mapping
+    users._process_row.side_effect = lambda row: {"user_id": row["userId"]}
+    users.execute_from_data.side_effect = lambda rows, dry_run: [
+        {"index": 0, "data": rows[0], "success": True}
+    ]
+
+    MERCURY_CLI.completer().run_action(f"bulk create user {test_file} --validate-only")
+    captured = capsys.readouterr()
+    assert users.execute_from_data.call_count == 0
+    assert "4 of 6 rows have problems." in captured.out
+    assert "duplicate userId of row 1" in captured.out
+    assert "missing required field last_name" in captured.out
+    assert "phoneNumber '+44-12abc' is not a phone number" in captured.out
+    assert "phone number +44-1234567 also used by row 1" in captured.out
+    assert "extension 1001 also used by row 1" in captured.out
+    assert "unknown operation 'user.remove'" in captured.out
+
+    MERCURY_CLI.completer().run_action(f"bulk create user {test_file}")
+    captured = capsys.readouterr()
+    sent = [call.args[0][0]["user_id"] for call in users.execute_from_data.call_args_list]
+    assert sent == ["alice", "erin"]
+    assert "4 users failed to process. 2 succeeded." in captured.out
+
+
+def test_bulk_diff_only_sends_changed_fields(capsys, mock_cli_components, tmp_path):
+    """With --diff, rows are cut to the fields that differ from the server."""
+    from dataclasses import dataclass
+
+    from mercury_ocip.bulk.user import UserBulkOperations
+
+    @dataclass
+    class CurrentUser:
+        user_id: str
+        last_name: str
+        first_name: str
+
+    current = {
+        "alice": CurrentUser("alice", "A", "Alice"),
+        "bob": CurrentUser("bob", "B", "Bob"),
+        "carol": CurrentUser("carol", "C", "Carol"),
+    }
+    test_file = tmp_path / "users.csv"
+    test_file.write_text(
+        "operation,userId,lastName,firstName\n"
+        "user.modify,alice,A,Alice\n"
+        "user.modify,bob,Brown,Bob\n"
+        "user.modify,carol,C,Caz\n"
+    )
+
+    users = mock_cli_components.agent.bulk.users
+    users.operation_mapping = UserBulkOperations(MagicMock()).operation_mapping
+    cached_reads = []
+
+    def read(request):
+        cached_reads.append(not response_cache._bypass.get())
+        return current[request.user_id]
+
+    users.client.command.side_effect = read
+    users._process_row.side_effect = lambda row: {
+        "operation": row["operation"],
+        "user_id": row["userId"],
+        "last_name": row["lastName"],
+        "first_name": row["firstName"],
+    }
+    users.execute_from_data.side_effect = lambda rows, dry_run: [
+        {"index": 0, "data": rows[0], "success": True}
+    ]
+
+    MERCURY_CLI.completer().run_action(f"bulk modify user {test_file} --diff --dry-run")
+    captured = capsys.readouterr()
+    assert all(call.args[1] for call in users.execute_from_data.call_args_list)
+    assert "1 users already up to date, not sent." in captured.out
+    assert "Row 2: last_name" in captured.out
+    assert "Row 3: first_name" in captured.out
+
+    users.execute_from_data.reset_mock()
+    MERCURY_CLI.completer().run_action(f"bulk modify user {test_file} --diff")
+    sent = [call.args[0][0] for call in users.execute_from_data.call_args_list]
+    assert sent == [
+        {"operation": "user.modify", "user_id": "bob", "last_name": "Brown"},
+        {"operation": "user.modify", "user_id": "carol", "first_name": "Caz"},
+    ]
+    assert cached_reads and not any(cached_reads)  # Always read from the server
+
+
+def test_bulk_summary_written(mock_cli_components, tmp_path):
+    """A machine-readable summary of the run is written with --summary."""
+    test_file = tmp_path / "items.csv"
+    test_file.write_text("operation,userId\nuser.create,alice\nuser.create,bob\n")
+    summary_file = tmp_path / "summary.json"
+
+    users = mock_cli_components.agent.bulk.users
+    users._process_row.side_effect = lambda row: {"user_id": row["userId"]}
+    users.execute_from_data.side_effect = lambda rows, dry_run: [
+        {"index": 0, "data": rows[0], "success": rows[0]["user_id"] == "alice"}
+    ]
+
+    MERCURY_CLI.completer().run_action(
+        f"bulk create user {test_file} --summary {summary_file}"
+    )
+
+    summary = json.loads(summary_file.read_text())
+    assert summary["status"] == "completed"
+    assert (summary["rows"], summary["succeeded"], summary["failed"]) == (2, 1, 1)
+    assert summary["latency"]["count"] == 2
+    assert summary["rows_per_second"] > 0
+
+
+def test_enterprise_audit_rolls_up_groups(mock_cli_components, tmp_path):
+    """Every group is audited, streamed to disk and rolled up into one report."""
+    from types import SimpleNamespace
+
+    def audit_group(service_provider_id, group_id):
+        if group_id == "g3":
+            raise RuntimeError("Group not found")
+        return SimpleNamespace(
+            ok=True,
+            message="Successful.",
+            payload=SimpleNamespace(
+                group_details=SimpleNamespace(
+                    group_name=group_id, user_count="2", user_limit="10"
+                ),
+                license_breakdown=SimpleNamespace(
+                    group_services_authorization_table={"Hunt Group": "1"},
+                    service_packs_authorization_table={"Pack": "2"},
+                    user_services_authorization_table={},
+                ),
+                group_dns=SimpleNamespace(total=2, numbers={"1001", "1002"}),
+            ),
+        )
+
+    mock_cli_components.agent.automate.audit_group.side_effect = audit_group
+    output = tmp_path / "audit.jsonl"
+
+    with patch(
+        "mercury_cli.commands.automations.automations.get_group_ids",
+        return_value=["g1", "g2", "g3"],
+    ):
+        MERCURY_CLI.completer().run_action(
+            f"automations enterprise_audit SP1 --workers 2 --output {output}"
+        )
+
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert sorted(r["group_id"] for r in records) == ["g1", "g2", "g3"]
+
+    rollup = json.loads((tmp_path / "audit.rollup.json").read_text())
+    assert rollup["groups"] == 3
+    assert rollup["failed_groups"] == [{"group_id": "g3", "error": "Group not found"}]
+    assert (rollup["user_count"], rollup["user_limit"], rollup["dn_total"]) == (4, 20, 4)
+    assert rollup["licences"]["service_packs"] == {"Pack": 4}
+
+
+def test_enterprise_audit_csv_keeps_every_column(mock_cli_components, tmp_path):
+    """A failed group written first doesn't cut the fields of later successes."""
+    import csv
+    from types import SimpleNamespace
+
+    def audit_group(service_provider_id, group_id):
+        if group_id == "g0":
+            return SimpleNamespace(ok=False, message="Group not found", payload=None)
+        return SimpleNamespace(
+            ok=True,
+            message="Successful.",
+            payload=SimpleNamespace(
+                group_details=SimpleNamespace(
+                    group_name=group_id, user_count="2", user_limit="10"
+                ),
+                license_breakdown=SimpleNamespace(
+                    group_services_authorization_table={"Hunt Group": "1"},
+                    service_packs_authorization_table={},
+                    user_services_authorization_table={},
+                ),
+                group_dns=SimpleNamespace(total=1, numbers={"1001"}),
+            ),
+        )
+
+    mock_cli_components.agent.automate.audit_group.side_effect = audit_group
+    output = tmp_path / "audit.csv"
+
+    with patch(
+        "mercury_cli.commands.automations.automations.get_group_ids",
+        return_value=["g0", "g1"],
+    ):
+        MERCURY_CLI.completer().run_action(
+            f"automations enterprise_audit SP1 --workers 1 --output {output}"
+        )
+
+    with open(output, newline="") as file:
+        failed, audited = csv.DictReader(file)
+    assert (failed["group_id"], failed["error"], failed["dns"]) == (
+        "g0",
+        "Group not found",
+        "",
+    )
+    assert audited["user_count"] == "2" and audited["error"] == ""
+    assert json.loads(audited["licences"])["group_services"] == {"Hunt Group": "1"}
+    assert json.loads(audited["dns"]) == ["1001"]
+
+
+def test_bulk_export_writes_a_reimportable_csv(capsys, mock_cli_components, tmp_path):
+    """Hunt groups are read across groups into the CSV their create command takes."""
+    import csv
+    from mercury_ocip.bulk.hunt_group import HuntGroupBulkOperations
+    from mercury_ocip.commands import commands
+    from mercury_ocip.commands.base_command import OCITable, OCITableRow
+
+    def hunt_group(service_user_id, agents):
+        return commands.GroupHuntGroupGetInstanceResponse20(
+            service_instance_profile=commands.ServiceInstanceReadProfile19sp1(
+                name=service_user_id,
+                calling_line_id_last_name="Hunt",
+                calling_line_id_first_name="Group",
+                extension="1000",
+                time_zone_display_name="(GMT) London",
+            ),
+            policy="Circular",
+            hunt_after_no_answer=True,
+            no_answer_number_of_rings=5,
+            forward_after_timeout=False,
+            forward_timeout_seconds=0,
+            agent_user_table=OCITable(
+                ["User Id", "Last Name"], [OCITableRow([a, "A"]) for a in agents]
+            ),
+            allow_call_waiting_for_agents=False,
+            use_system_hunt_group_clid_setting=True,
+            include_hunt_group_name_in_clid=True,
+            enable_not_reachable_forwarding=False,
+            make_busy_when_not_reachable=False,
+            allow_members_to_control_group_busy=False,
+            enable_group_busy=False,
+            apply_group_busy_when_terminating_to_agent=False,
+        )
+
+    hunt_groups = {"hg1": hunt_group("hg1", ["u1", "u2", "u3"]), "hg2": hunt_group("hg2", [])}
+
+    def command(request):
+        if isinstance(request, commands.GroupHuntGroupGetInstanceListRequest):
+            if request.group_id == "g3":
+                raise RuntimeError("Group not found")
+            ids = ["hg1"] if request.group_id == "g1" else ["hg2"]
+            return commands.GroupHuntGroupGetInstanceListResponse(
+                hunt_group_table=OCITable(
+                    ["Service User Id", "Name"], [OCITableRow([i, i]) for i in ids]
+                )
+            )
+        return hunt_groups[request.service_user_id]
+
+    mock_cli_components.client.command.side_effect = command
+    output = tmp_path / "hunt_groups.csv"
+
+    with patch(
+        "mercury_cli.commands.bulk.export.get_group_ids",
+        return_value=["g1", "g2", "g3"],
+    ):
+        MERCURY_CLI.completer().run_action(
+            f"bulk export hunt_group SP1 --workers 2 --file {output}"
+        )
+
+    captured = capsys.readouterr()
+    assert "Exported 2 hunt groups" in captured.out
+    assert "g3" in captured.out and "Group not found" in captured.out
+
+    with open(output, newline="") as file:
+        rows = sorted(csv.DictReader(file), key=lambda row: row["serviceUserId"])
+    assert rows[0]["agentUserId[2]"] == "u3" and rows[1]["agentUserId[0]"] == ""
+    assert "serviceInstanceProfile.timeZoneDisplayName" not in rows[0]
+
+    client = MagicMock()
+    client._dispatch_table = vars(commands)
+    handler = HuntGroupBulkOperations(client)
+    created = []
+    for row in rows:
+        parsed = handler._process_row(row)
+        created.append(handler._create_command(parsed, parsed.pop("operation")))
+    assert [c.group_id for c in created] == ["g1", "g2"]
+    assert created[0].agent_user_id == ["u1", "u2", "u3"]
+    assert created[0].service_instance_profile.extension == "1000"
+    assert created[0].no_answer_number_of_rings == 5
+
+
+def test_group_audit_output_writes_a_record(capsys, mock_cli_components):
+    """--output csv writes the audit as a CSV row instead of rendering the report."""
+    import csv
+    from types import SimpleNamespace
+
+    mock_cli_components.agent.automate.audit_group.return_value = SimpleNamespace(
+        ok=True,
+        message="Successful.",
+        payload=SimpleNamespace(
+            group_details=SimpleNamespace(group_name="Main", user_count="2", user_limit="10"),
+            license_breakdown=None,
+            group_dns=SimpleNamespace(total=1, numbers={"1001"}),
+        ),
+    )
+
+    MERCURY_CLI.completer().run_action("automations group_audit SP1 G1 --output csv")
+
+    out = capsys.readouterr().out
+    assert "Group Audit Report" not in out
+    (row,) = csv.DictReader(out.splitlines())
+    assert (row["group_id"], row["user_count"], row["dn_total"]) == ("G1", "2", "1")
+    assert json.loads(row["dns"]) == ["1001"]
+
+
+def test_user_digest_batch_streams_csv(mock_cli_components, tmp_path):
+    """Users listed in a file are digested concurrently and written one row each."""
+    import csv
+    from types import SimpleNamespace
+
+    def user_digest(user_id):
+        if user_id == "bob":
+            return SimpleNamespace(ok=False, message="User not found", payload=None)
+        info = SimpleNamespace(
+            first_name=user_id.title(),
+            last_name="Smith",
+            service_provider_id="SP1",
+            group_id="G1",
+            phone_number="1000",
+            extension="1000",
+            calling_line_id_phone_number="",
+        )
+        forward = SimpleNamespace(
+            variant="always", is_active="true", forward_to_phone_number="2000"
+        )
+        return SimpleNamespace(
+            ok=True,
+            message="Successful.",
+            payload=SimpleNamespace(
+                user_details=SimpleNamespace(
+                    user_info=info,
+                    dnd_status="false",
+                    forwards=SimpleNamespace(
+                        user_forwarding=[forward], voicemail_forwarding=[]
+                    ),
+                    devices=[],
+                ),
+                call_center_membership=None,
+                hunt_group_membership=[SimpleNamespace(hunt_group_id="hg1")],
+                call_pickup_group_membership=None,
+            ),
+        )
+
+    mock_cli_components.agent.automate.user_digest.side_effect = user_digest
+    users = tmp_path / "users.txt"
+    users.write_text("# support ticket\nalice\nbob\n\ncarol\nalice\n")
+    output = tmp_path / "digest.csv"
+
+    MERCURY_CLI.completer().run_action(
+        f"automations user_digest_batch file {users} --workers 3 --output {output}"
+    )
+
+    with open(output, newline="") as file:
+        rows = {row["user_id"]: row for row in csv.DictReader(file)}
+    assert sorted(rows) == ["alice", "bob", "carol"]
+    assert rows["alice"]["forwards"] == "always:2000"
+    assert rows["alice"]["hunt_groups"] == "hg1"
+    assert rows["bob"]["ok"] == "False" and rows["bob"]["error"] == "User not found"
+
+
+def test_find_alias_batch_crawls_each_group_once(mock_cli_components, tmp_path):
+    """A file of aliases is resolved against one cached crawl of the group."""
+    import csv
+    from types import SimpleNamespace
+
+    shared_ops = MagicMock()
+    shared_ops.fetch_call_center_details.return_value = [
+        SimpleNamespace(service_user_id="cc1@example.com", alias="sales@example.com")
+    ]
+    shared_ops.fetch_hunt_group_details.return_value = [
+        SimpleNamespace(
+            service_user_id="hg1@example.com",
+            service_instance_profile={"alias": ["support@example.com", "help"]},
+        )
+    ]
+    shared_ops.fetch_auto_attendant_details.return_value = []
+    shared_ops.fetch_user_details.return_value = [
+        SimpleNamespace(user_id="alice\tb@example.com", alias=["sales", "alice"])
+    ]
+    MERCURY_CLI.cache().clear()
+
+    aliases = tmp_path / "aliases.csv"
+    aliases.write_text("alias,note\nsales@example.com,x\nhelp,y\nalice,z\nnobody,w\n")
+    output = tmp_path / "found.csv"
+
+    with patch(
+        "mercury_cli.commands.automations.automations.SharedOperations",
+        return_value=shared_ops,
+    ):
+        for _ in range(2):
+            MERCURY_CLI.completer().run_action(
+                f"automations find_alias_batch group SP1 G1 {aliases} --output {output}"
+            )
+
+    with open(output, newline="") as file:
+        rows = {row["alias"]: row for row in csv.DictReader(file)}
+    assert rows["sales@example.com"]["entity_id"] == "cc1@example.com"
+    assert rows["help"]["entity_type"] == "Hunt Group"
+    assert rows["alice"]["entity_id"] == "alice\tb@example.com"  # IDs kept whole
+    assert rows["alice"]["group_id"] == "G1"
+    assert rows["nobody"]["found"] == "False"
+    assert shared_ops.fetch_user_details.call_count == 1
+    MERCURY_CLI.cache().clear()
+
 
 def test_completer_actions():
     """Test that actions are correctly registered in the completer."""
@@ -128,7 +748,7 @@ def test_plugin_found_listing_with_installed(mock_cli_components):
     fake_entrypoint.name = "MockPlugin"
     fake_entrypoint.load.return_value = MockPlugin
 
-    with patch.object(mock_cli_components.agent, 'list_plugins', return_value=[fake_entrypoint]):
+    with patch("mercury_cli.commands.misc.plugins.discover_plugins", return_value=[fake_entrypoint]):
 
         load_plugins()
         
@@ -144,7 +764,7 @@ def test_plugin_found_listing_with_installed(mock_cli_components):
         assert plugin_action.children["mock_plugin"].display_meta == "Mock plugin description"
 
 def test_plugin_not_found_listing_with_none_installed(mock_cli_components):
-    with patch.object(mock_cli_components.agent, 'list_plugins', return_value=[]):
+    with patch("mercury_cli.commands.misc.plugins.discover_plugins", return_value=[]):
 
         load_plugins()
         
@@ -157,3 +777,109 @@ def test_plugin_not_found_listing_with_none_installed(mock_cli_components):
         assert plugin_action.display_meta == "Used to view and manage plugins"
 
         assert len(plugin_action.children) == 1 # Only 'list' command should be present
+
+
+def test_plugins_load_on_first_use_from_the_manifest(capsys, mock_cli_components):
+    """Once the manifest is cached, a plugin is only imported when its group is used."""
+    calls = []
+
+    class HelloCommand:
+        description = "Say hello"
+        params = {"name": {"help": "Who to greet"}}
+
+        def __init__(self, plugin):
+            pass
+
+        def execute(self, name):
+            calls.append(name)
+
+    class GreeterPlugin(BasePlugin):
+        def __init__(self, client):
+            self.description = "Greets people"
+
+        def get_commands(self):
+            return {"hello": HelloCommand}
+
+    fake_entrypoint = MagicMock()
+    fake_entrypoint.name = "greeter"
+    fake_entrypoint.load.return_value = GreeterPlugin
+    not_a_plugin = MagicMock()
+    not_a_plugin.name = "helper"
+    not_a_plugin.load.return_value = object
+    plugin_action = MERCURY_CLI.completer().root.children["plugin"]
+
+    with patch(
+        "mercury_cli.commands.misc.plugins.discover_plugins",
+        return_value=[fake_entrypoint, not_a_plugin],
+    ):
+        load_plugins()  # Builds the manifest
+        assert fake_entrypoint.load.call_count == 1
+
+        plugin_action.children.pop("greeter_plugin")
+        fake_entrypoint.load.reset_mock()
+        load_plugins()
+        assert fake_entrypoint.load.call_count == 0
+        assert plugin_action.children["greeter_plugin"].display_meta == "Greets people"
+
+        MERCURY_CLI.completer().run_action("plugin list")
+        listed = capsys.readouterr().out
+        assert "hello <name> - Say hello" in listed
+        assert "helper" not in listed
+        assert fake_entrypoint.load.call_count == 0
+
+        MERCURY_CLI.completer().run_action("plugin greeter_plugin hello world")
+        assert fake_entrypoint.load.call_count == 1
+        assert calls == ["world"]
+        assert isinstance(mock_cli_components.agent.greeter, GreeterPlugin)
+
+
+def test_service_provider_completions_are_cached(mock_cli_components):
+    """Repeated completions are served from the cache instead of the server."""
+    mock_table = MagicMock()
+    mock_table.to_dict.return_value = [
+        {"service_provider_id": "SP1"},
+        {"service_provider_id": "SP2"},
+    ]
+    mock_cli_components.client.command.return_value.service_provider_table = mock_table
+
+    MERCURY_CLI.cache().clear()
+    try:
+        assert _get_service_provider_id_completions(MagicMock(), value="SP") == ["SP1", "SP2"]
+        assert _get_service_provider_id_completions(MagicMock(), value="SP2") == ["SP2"]
+        assert mock_cli_components.client.command.call_count == 1
+    finally:
+        MERCURY_CLI.cache().clear()
+
+
+def test_group_ids_are_fetched_in_pages(mock_cli_components):
+    """Group lists are paged, and completions only fetch a page matching the typed prefix."""
+    def _page(*group_ids):
+        response = MagicMock()
+        response.group_table.to_dict.return_value = [{"group_id": g} for g in group_ids]
+        return response
+
+    client = mock_cli_components.client
+    MERCURY_CLI.cache().clear()
+    try:
+        with patch("mercury_cli.utils.service_group_id_callable.GROUP_PAGE_SIZE", 2):
+            client.command.side_effect = [_page("grp10", "grp11"), _page("grp12")]
+            key, groups = _group_candidates("sp1", "Grp1")
+            assert groups == ["grp10", "grp11"]
+            request = client.command.call_args.args[0]
+            assert request.search_criteria_group_id[0].value == "grp1"
+            assert request.response_paging_control.response_page_size == 2
+
+            # A longer prefix only goes back to the server while the shorter page was full
+            assert _group_candidates("sp1", "grp12")[1] == ["grp12"]
+            assert client.command.call_count == 2
+
+            client.command.side_effect = [_page("a", "b"), _page("c", "d"), _page("e")]
+            assert get_group_ids("sp2") == ["a", "b", "c", "d", "e"]
+            starts = [
+                call.args[0].response_paging_control.response_start_index
+                for call in client.command.call_args_list[2:]
+            ]
+            assert starts == [1, 3, 5]
+            assert _group_candidates("sp2", "c") == (("groups", "sp2"), ["a", "b", "c", "d", "e"])
+    finally:
+        MERCURY_CLI.cache().clear()
@@ -0,0 +1,460 @@
+import sys
+import threading
+import time
+import os
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+
+import asyncio
+from lxml import etree
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+
+from benchmarks.run import compare
+from benchmarks.server import Dataset, FakeOCIServer
+from mercury_cli.utils.async_completer import BackgroundCompleter
+from mercury_cli.commands.bulk.batch import build_batch_document, split_batch_response
+from mercury_cli.utils.cache import TTLCache
+from mercury_cli.utils.client_pool import ClientPool
+from mercury_cli.utils.completion_index import CompletionIndex
+from mercury_cli.utils.governor import TrafficGovernor
+from mercury_cli.utils.instrumentation import InstrumentedClient, RequestStats
+from mercury_cli.utils.metrics import LatencyStats
+from mercury_cli.utils.prefix_index import PrefixIndex
+from mercury_cli.utils.records import message_console, open_records
+from mercury_cli.utils.response_cache import ResponseCache, fresh_responses
+
+
+def test_cache_expires_entries():
+    """Entries are not served once their TTL has passed."""
+    cache = TTLCache()
+
+    with patch("mercury_cli.utils.cache.time.monotonic", return_value=100.0):
+        cache.set("key", "value", ttl=10)
+        assert cache.get("key") == "value"
+
+    with patch("mercury_cli.utils.cache.time.monotonic", return_value=111.0):
+        assert cache.get("key") is None
+
+
+def test_cache_evicts_least_recently_used():
+    """The least recently used entry is evicted once the cache is full."""
+    cache = TTLCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_cache_refresh_uses_loaders():
+    """refresh() re-runs the loader recorded by get_or_fetch."""
+    cache = TTLCache()
+    loader = MagicMock(side_effect=["first", "second"])
+
+    assert cache.get_or_fetch("key", loader) == "first"
+    assert cache.get_or_fetch("key", loader) == "first"
+    assert cache.refresh() == 1
+    assert cache.get("key") == "second"
+    assert loader.call_count == 2
+
+
+def test_completion_index_serves_previous_session(tmp_path):
+    """A new cache completes from the index at once and revalidates in the background."""
+    index = CompletionIndex(str(tmp_path / "index.sqlite3"))
+    index.save(("groups", "sp1"), ["grpB", "grpA", "other"])
+    index.save(("groups", "sp1"), ["grpB", "grpA", "grpC"])
+    assert index.load(("groups", "sp1")) == ["grpA", "grpB", "grpC"]
+    assert index.load(("groups", "sp1"), prefix="grpB") == ["grpB"]
+    assert index.load(("groups", "sp2")) is None
+
+    fetched = threading.Event()
+
+    def loader():
+        fetched.set()
+        return ["grpA", "grpD"]
+
+    cache = TTLCache(store=index)
+    assert cache.get_or_fetch(("groups", "sp1"), loader) == ["grpA", "grpB", "grpC"]
+    assert fetched.wait(1)
+    for _ in range(100):
+        if index.load(("groups", "sp1")) == ["grpA", "grpD"]:
+            break
+        time.sleep(0.01)
+    assert cache.get(("groups", "sp1")) == ["grpA", "grpD"]
+    assert index.load(("groups", "sp1")) == ["grpA", "grpD"]
+
+    rows = ["b,2", "a,1"]
+    assert cache.get_or_fetch(("aliases", "sp1"), lambda: rows, persist=False) == rows
+    assert index.load(("aliases", "sp1")) is None  # Kept in memory, in order
+
+    cache.clear(include_store=True)
+    assert index.load(("groups", "sp1")) is None
+    index.close()
+
+
+def test_prefix_index_falls_back_to_substring_matches():
+    """Prefix matches come in sorted order; entries containing the text only when none match."""
+    index = PrefixIndex(["site_b", "Main", "SiteA", "Sites", "east_site", "mainsite"])
+
+    assert index.prefix("site") == ["site_b", "SiteA", "Sites"]
+    assert index.search("site") == ["site_b", "SiteA", "Sites"]
+    assert index.search("site", limit=2) == ["site_b", "SiteA"]
+    assert index.search("ite") == ["site_b", "SiteA", "Sites", "mainsite", "east_site"]
+    assert index.search("ite", limit=2) == ["site_b", "SiteA"]
+    assert index.search("") == sorted(index.search(""), key=str.casefold)
+    assert len(index.search("")) == 6
+    assert index.search("zzz") == []
+
+
+def test_completion_indexes_are_bounded():
+    """Only the most recently used prefix indexes are kept."""
+    from mercury_cli.utils import service_group_id_callable as completions
+
+    lists = {key: [f"grp{key}"] for key in range(completions.INDEX_LIMIT + 1)}
+    for key, values in lists.items():
+        assert completions._matching(("test", key), values, "grp") == values
+
+    assert len(completions._indexes) <= completions.INDEX_LIMIT
+    assert ("test", 0) not in completions._indexes
+    assert ("test", completions.INDEX_LIMIT) in completions._indexes
+
+
+def test_records_append_when_resuming(tmp_path, capsys):
+    """Appending keeps earlier records without a second header; streamed runs talk on stderr."""
+    target = str(tmp_path / "out.csv")
+    with open_records(target, ["index", "success"]) as writer:
+        writer.write({"index": 0, "success": True})
+    with open_records(target, ["index", "success"], append=True) as writer:
+        writer.write({"index": 1, "success": False})
+    assert open(target).read().splitlines() == ["index,success", "0,True", "1,False"]
+
+    json_target = str(tmp_path / "out.json")
+    with open_records(json_target) as writer:
+        writer.write({"index": 0})
+    try:
+        with open_records(json_target, append=True):
+            pass
+        raise AssertionError("appended to a JSON array")
+    except ValueError:
+        pass
+
+    console = MagicMock()
+    assert message_console(console, target) is console
+    message_console(console, "jsonl").print("✘ failed")
+    captured = capsys.readouterr()
+    assert "failed" in captured.err and captured.out == ""
+
+
+def test_background_completer_fills_in_server_results():
+    """Cache misses are fetched off-thread and cached results are served at once."""
+    cache = TTLCache()
+    loader = MagicMock(return_value=["SP1", "SP2"])
+
+    class _CachedCompleter(Completer):
+        def get_completions(self, document, complete_event):
+            try:
+                ids = cache.get_or_fetch("sps", loader)
+            except Exception:
+                return
+            for sp_id in ids:
+                yield Completion(sp_id)
+
+    completer = BackgroundCompleter(_CachedCompleter(), poll_interval=0.01)
+
+    async def _collect():
+        return [
+            c.text
+            async for c in completer.get_completions_async(
+                Document("SP"), CompleteEvent()
+            )
+        ]
+
+    assert asyncio.run(_collect()) == ["SP1", "SP2"]
+    assert asyncio.run(_collect()) == ["SP1", "SP2"]
+    assert loader.call_count == 1
+
+
+def test_latency_stats_percentiles():
+    """Percentiles come from the recent window, totals from every sample."""
+    stats = LatencyStats(window=100)
+    for ms in range(1, 201):
+        stats.observe(ms / 1000)
+
+    assert stats.count == 200
+    assert stats.percentile(50) == 0.15
+    assert stats.percentile(95) == 0.195
+    assert stats.summary()["max_ms"] == 200.0
+    assert LatencyStats().percentile(50) is None
+
+
+def test_instrumented_client_records_requests():
+    """Commands are recorded per request type with payload sizes and errors."""
+
+    class FakeRequest:
+        pass
+
+    inner = MagicMock()
+    inner._dispatch_table = {"FakeRequest": FakeRequest}
+
+    def command(cmd):
+        inner._requester.send_request("<request/>")
+        return "ok"
+
+    inner.command.side_effect = command
+    inner._requester.send_request.return_value = "<response>ok</response>"
+    stats = RequestStats()
+    client = InstrumentedClient(inner, stats)
+
+    assert client.raw_command("FakeRequest") == "ok"
+    inner.command.side_effect = RuntimeError("boom")
+    try:
+        client.command(FakeRequest())
+    except RuntimeError:
+        pass
+
+    (row,) = stats.rows()
+    assert row["request_type"] == "FakeRequest"
+    assert (row["count"], row["errors"]) == (2, 1)
+    assert (row["request_bytes"], row["response_bytes"]) == (10, 23)
+
+
+def test_response_cache_reuses_reads_until_a_change():
+    """Repeated reads are served from the cache; a change in the same group drops them."""
+
+    class _Command:
+        def __init__(self, service_provider_id, group_id):
+            self.service_provider_id = service_provider_id
+            self.group_id = group_id
+
+        def to_xml(self):
+            return f"<{type(self).__name__} {self.service_provider_id} {self.group_id}/>"
+
+    class GroupGetRequest22(_Command):
+        pass
+
+    class GroupModifyRequest(_Command):
+        pass
+
+    inner = MagicMock()
+    inner._requester = MagicMock()
+    inner.command.side_effect = lambda command: f"response {inner.command.call_count}"
+    stats = RequestStats()
+    client = InstrumentedClient(inner, stats, ResponseCache(ttl=60))
+
+    assert client.command(GroupGetRequest22("sp", "g1")) == "response 1"
+    assert client.command(GroupGetRequest22("sp", "g1")) == "response 1"
+    assert client.command(GroupGetRequest22("sp", "g2")) == "response 2"
+    assert inner.command.call_count == 2
+    assert {row["request_type"]: row["count"] for row in stats.rows()}[
+        "GroupGetRequest22 (cached)"
+    ] == 1
+
+    with fresh_responses():
+        assert client.command(GroupGetRequest22("sp", "g1")) == "response 3"
+
+    client.command(GroupModifyRequest("sp", "g1"))
+    assert client.command(GroupGetRequest22("sp", "g1")) == "response 5"
+    assert client.command(GroupGetRequest22("sp", "g2")) == "response 2"
+    assert client.command(GroupGetRequest22("other", "g1")) == "response 6"
+
+    inner.command.side_effect = TimeoutError("no reply")  # But maybe applied
+    try:
+        client.command(GroupModifyRequest("sp", "g2"))
+    except TimeoutError:
+        pass
+    inner.command.side_effect = lambda command: f"response {inner.command.call_count}"
+    assert client.command(GroupGetRequest22("sp", "g2")) == "response 8"
+
+
+def test_response_cache_drops_a_read_that_raced_a_change():
+    """A read sent before a change but answered after it is not cached."""
+
+    class GroupGetRequest22:
+        service_provider_id, group_id = "sp", "g1"
+
+        def to_xml(self):
+            return "<GroupGetRequest22/>"
+
+    class GroupModifyRequest:
+        service_provider_id, group_id = "sp", "g1"
+
+    read_sent, changed = threading.Event(), threading.Event()
+
+    def command(request):
+        if isinstance(request, GroupModifyRequest):
+            return "modified"
+        if not changed.is_set():  # The read in flight while the change is made
+            read_sent.set()
+            assert changed.wait(2)
+            return "before the change"
+        return "after the change"
+
+    inner = MagicMock()
+    inner._requester = MagicMock()
+    inner.command.side_effect = command
+    client = InstrumentedClient(inner, RequestStats(), ResponseCache(ttl=60))
+
+    reader = threading.Thread(target=client.command, args=(GroupGetRequest22(),))
+    reader.start()
+    assert read_sent.wait(2)
+    client.command(GroupModifyRequest())
+    changed.set()
+    reader.join()
+
+    assert client.command(GroupGetRequest22()) == "after the change"
+    assert client.command(GroupGetRequest22()) == "after the change"
+    assert inner.command.call_count == 3
+
+
+def test_client_pool_runs_commands_on_separate_sessions():
+    """Concurrent commands get their own session, and expired ones log in again."""
+
+    class ErrorResponse:
+        summary = "[Error 4962] Invalid session"
+
+    logins = []
+    running = threading.Barrier(3, timeout=2)
+
+    def login():
+        client = MagicMock()
+        client.session_id = f"session-{len(logins)}"
+        logins.append(client)
+
+        def command(request):
+            if request == "expire" and client.authenticated is not False:
+                return ErrorResponse()
+            if request == "wait":
+                running.wait()
+            return client.session_id
+
+        client.command.side_effect = command
+        return client
+
+    pool = ClientPool(login, size=3)
+    stats = RequestStats()
+    client = InstrumentedClient(pool, stats)
+
+    threads = [threading.Thread(target=client.command, args=("wait",)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert pool.members == len(logins) == 3
+    assert {row["count"] for row in stats.rows()} == {3}
+
+    session = client.command("expire")
+    assert session != "session-0" and session.count("-") == 4  # A new uuid
+    assert len(logins) == 3
+    pool.disconnect()
+    assert all(login.disconnect.called for login in logins)
+
+
+def test_governor_retries_transient_failures_and_adapts():
+    """Load-shedding errors are retried and halve the limit; successes grow it back."""
+
+    class ErrorResponse:
+        summary = "Server busy, try again later"
+
+    governor = TrafficGovernor(max_concurrency=8, max_retries=2)
+    governor.backoff = lambda attempt: 0
+    assert governor.limit == 4
+
+    send = MagicMock(side_effect=[ErrorResponse(), ErrorResponse(), "ok"])
+    assert governor.call(send) == "ok"
+    assert send.call_count == 3
+    assert governor.retries == 2
+    assert governor.limit < 4 and governor.throttled >= 1
+
+    rejected = MagicMock(side_effect=ValueError("bad request"))
+    try:
+        governor.call(rejected)
+    except ValueError:
+        pass
+    assert rejected.call_count == 1  # Not transient, so not retried
+
+    class MErrorSocketTimeout(Exception):
+        pass
+
+    class MErrorSocketInitialisation(Exception):
+        pass
+
+    timed_out = MagicMock(side_effect=MErrorSocketTimeout("timed out"))
+    try:
+        governor.call(timed_out, idempotent=False)
+    except MErrorSocketTimeout:
+        pass
+    assert timed_out.call_count == 1  # A change may have been applied already
+
+    unsent = MagicMock(side_effect=[MErrorSocketInitialisation("refused"), "ok"])
+    assert governor.call(unsent, idempotent=False) == "ok"
+    assert unsent.call_count == 2
+
+    for _ in range(100):
+        governor.call(lambda: "ok")
+    assert governor.limit == 8
+    assert governor.snapshot()["in_flight"] == 0
+
+
+def test_batch_document_round_trip():
+    """Several commands share one document and responses split back per command."""
+    document = build_batch_document(
+        "sid",
+        [
+            '<command xmlns="" xsi:type="UserGetRequest23V2"><userId>a</userId></command>',
+            '<command xmlns="" xsi:type="UserGetRequest23V2"><userId>b</userId></command>',
+        ],
+    ).decode("ISO-8859-1")
+    assert document.count("<command") == 2
+    assert '<sessionId xmlns="">sid</sessionId>' in document
+    root = etree.fromstring(document.encode("ISO-8859-1"))
+    assert [child.tag for child in root] == ["sessionId", "command", "command"]
+
+    response = (
+        '<?xml version="1.0" encoding="ISO-8859-1"?>'
+        '<BroadsoftDocument protocol="OCI" xmlns="C" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance">'
+        '<sessionId xmlns="">sid</sessionId>'
+        '<command echo="" xsi:type="SuccessResponse" xmlns=""/>'
+        '<command type="Error" echo="" xsi:type="ErrorResponse" xmlns="">'
+        "<summary>Duplicate</summary></command>"
+        "</BroadsoftDocument>"
+    )
+    first, second = split_batch_response(response)
+    assert "SuccessResponse" in first and "ErrorResponse" not in first
+    assert "<summary>Duplicate</summary>" in second
+    assert "<sessionId" in second
+
+
+def test_benchmark_server_answers_a_real_client():
+    """The benchmark's fake server logs a client in and serves its dataset."""
+    from mercury_ocip import Client
+
+    with FakeOCIServer(Dataset(service_providers=2, groups=3, users=4)) as server:
+        client = Client(
+            host=server.url, username="bench", password="bench", conn_type="SOAP"
+        )
+        response = client.raw_command(
+            "GroupGetListInServiceProviderRequest", service_provider_id="SP0002"
+        )
+        stats = server.stats.snapshot()
+
+    groups = [row.col[0] for row in response.group_table.row]
+    assert groups == ["SP0002-G0001", "SP0002-G0002", "SP0002-G0003"]
+    assert stats["by_command"]["GroupGetListInServiceProviderRequest"] == 1
+
+    command = '<command xmlns="" xsi:type="SystemSoftwareVersionGetRequest"/>'
+    batch = build_batch_document("sid", [command]).decode("ISO-8859-1")
+    assert "ErrorResponse" not in server.process(batch)
+    qualified = batch.replace('<sessionId xmlns="">', "<sessionId>")
+    assert "Invalid session" in server.process(qualified)
+
+    baseline = {"scenarios": {"bulk": {"rows_per_second": 100, "p50_ms": 10.0}}}
+    current = {"scenarios": {"bulk": {"rows_per_second": 80, "p50_ms": 10.5}}}
+    rows = {row["metric"]: row for row in compare(current, baseline, threshold=10)}
+    assert rows["bulk.rows_per_second"]["regressed"]
+    assert not rows["bulk.p50_ms"]["regressed"]
@@ -0,0 +1,113 @@
+import asyncio
+from collections.abc import AsyncGenerator, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from prompt_toolkit.application.current import get_app_or_none
+from prompt_toolkit.completion import CompleteEvent, Completer, Completion
+from prompt_toolkit.document import Document
+
+from mercury_cli.utils.cache import cached_only
+
+
+class BackgroundCompleter(Completer):
+    """
+    Wraps a completer so slow server lookups never block the prompt.
+
+    Each completion pass first runs the wrapped completer against the cache
+    only, yielding whatever is already known (including stale entries) straight
+    away. If anything was missing, the full completer is run on a worker thread
+    and its extra results are yielded once they arrive. Lookups for text the
+    user has since changed are cancelled, or simply abandoned if already
+    running, so the results still land in the cache for the next keystroke.
+
+    Args:
+        completer (Completer): The completer to wrap, normally the ActionCompleter.
+        max_workers (int): Number of threads used for server lookups.
+        poll_interval (float): Seconds between checks for a changed buffer while waiting.
+    """
+
+    def __init__(
+        self, completer: Completer, max_workers: int = 2, poll_interval: float = 0.05
+    ):
+        self.completer = completer
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="completion"
+        )
+        self._pending: list[Future] = []
+
+    def get_completions(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> Iterable[Completion]:
+        """
+        Synchronous completions, delegated directly to the wrapped completer.
+        """
+        yield from self.completer.get_completions(document, complete_event)
+
+    async def get_completions_async(
+        self, document: Document, complete_event: CompleteEvent
+    ) -> AsyncGenerator[Completion, None]:
+        """
+        Yields cached completions at once, then any the server adds.
+
+        Args:
+            document (Document): The document being completed.
+            complete_event (CompleteEvent): The event that triggered completion.
+
+        Yields:
+            Completion: Completions for the document.
+        """
+        with cached_only() as state:
+            try:
+                immediate = list(
+                    self.completer.get_completions(document, complete_event)
+                )
+            except Exception:  # noqa: BLE001
+                immediate = []
+
+        for completion in immediate:
+            yield completion
+
+        if not state.missed:
+            return
+
+        self._cancel_pending()
+        future = self._executor.submit(
+            lambda: list(self.completer.get_completions(document, complete_event))
+        )
+        self._pending.append(future)
+
+        try:
+            while not future.done():
+                if self._is_stale(document):
+                    future.cancel()
+                    return
+                await asyncio.sleep(self.poll_interval)
+
+            seen = {completion.text for completion in immediate}
+            for completion in future.result():
+                if completion.text not in seen:
+                    yield completion
+        except Exception:  # noqa: BLE001
+            return
+        finally:
+            if future in self._pending:
+                self._pending.remove(future)
+
+    def _cancel_pending(self) -> None:
+        """
+        Cancels lookups that are queued but have not started yet.
+        """
+        for future in self._pending:
+            future.cancel()
+        self._pending = [future for future in self._pending if not future.cancelled()]
+
+    @staticmethod
+    def _is_stale(document: Document) -> bool:
+        """
+        Checks whether the prompt text has moved on from the given document.
+        """
+        app = get_app_or_none()
+        if app is None:
+            return False
+        return app.current_buffer.document.text != document.text
@@ -0,0 +1,355 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import Future
+from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+
+class CacheMiss(Exception):
+    """
+    Raised by `TTLCache.get_or_fetch` on a miss while in `cached_only` mode.
+    """
+
+
+@dataclass
+class CachedOnlyState:
+    """
+    Tracks whether any lookup missed while in `cached_only` mode.
+    """
+
+    missed: bool = False
+
+
+_cached_only: ContextVar[CachedOnlyState | None] = ContextVar(
+    "cached_only", default=None
+)
+
+
+@contextmanager
+def cached_only() -> Iterator[CachedOnlyState]:
+    """
+    Serves lookups from the cache without ever calling a loader.
+
+    While active, `TTLCache.get_or_fetch` returns expired values if it still
+    holds them and raises `CacheMiss` when it has nothing at all. The yielded
+    state records whether any lookup needed the server.
+
+    Yields:
+        CachedOnlyState: The state for this block.
+    """
+    state = CachedOnlyState()
+    token = _cached_only.set(state)
+    try:
+        yield state
+    finally:
+        _cached_only.reset(token)
+
+
+class CacheStore(Protocol):
+    """
+    Persistent backing store for a `TTLCache`, e.g. a `CompletionIndex`.
+    """
+
+    def load(self, key: Hashable) -> Any | None: ...
+
+    def save(self, key: Hashable, value: Any) -> None: ...
+
+    def delete(self, key: Hashable) -> None: ...
+
+    def clear(self) -> None: ...
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with a per-key time to live.
+
+    Entries remember the loader that produced them so they can be re-fetched on
+    demand (see `refresh`). Concurrent lookups of the same missing key share a
+    single in-flight fetch rather than each hitting the server.
+
+    With a `store`, every fetched value is also saved to it, and a key missing
+    from memory is served straight from the store (typically saved by an
+    earlier session) while it is re-fetched in the background. Keys fetched
+    with `persist=False` bypass the store and live in memory only.
+
+    Args:
+        max_entries (int): Maximum number of entries kept before the least recently used is evicted.
+        default_ttl (float): Time to live in seconds used when `set` is not given one.
+        store (CacheStore | None): Persistent store backing the cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 512,
+        default_ttl: float = 300.0,
+        store: CacheStore | None = None,
+    ):
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self.store = store
+        self._entries: OrderedDict[
+            Hashable, tuple[Any, float, Callable[[], Any] | None, float]
+        ] = OrderedDict()
+        self._inflight: dict[Hashable, Future] = {}
+        self._revalidating: set[Hashable] = set()
+        self._memory_only: set[Hashable] = (
+            set()
+        )  # Keys never read from or saved to the store
+        self._lock = threading.RLock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Returns the cached value for a key, or `default` if it is missing or expired.
+
+        Args:
+            key (Hashable): The cache key.
+            default (Any): Value returned on a miss.
+
+        Returns:
+            Any: The cached value or `default`.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at, _, _ = entry
+            if expires_at <= time.monotonic():
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl: float | None = None,
+        loader: Callable[[], Any] | None = None,
+    ) -> None:
+        """
+        Stores a value, evicting the least recently used entries when full.
+
+        Args:
+            key (Hashable): The cache key.
+            value (Any): The value to store.
+            ttl (float | None): Time to live in seconds. Defaults to `default_ttl`.
+            loader (Callable[[], Any] | None): Callable used by `refresh` to re-fetch the value.
+        """
+        ttl = self._ttl(ttl)
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + ttl, loader, ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get_or_fetch(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        ttl: float | None = None,
+        persist: bool = True,
+    ) -> Any:
+        """
+        Returns the cached value for a key, calling `loader` to fetch it on a miss.
+
+        Exceptions raised by the loader are propagated and nothing is cached.
+
+        Args:
+            key (Hashable): The cache key.
+            loader (Callable[[], Any]): Fetches the value when it is not cached.
+            ttl (float | None): Time to live in seconds. Defaults to `default_ttl`.
+            persist (bool): Whether the value may be served from and saved to the
+                store. Pass False for values the store would not keep as they are,
+                e.g. ordered rows, or that must not outlive the session.
+
+        Returns:
+            Any: The cached or freshly fetched value.
+        """
+        missing = object()
+        with self._lock:
+            if not persist:
+                self._memory_only.add(key)
+            value = self.get(key, missing)
+            if value is not missing:
+                return value
+
+            stored = (
+                self._load_stored(key, missing) if key not in self._entries else missing
+            )
+
+            if (state := _cached_only.get()) is not None:
+                state.missed = True
+                if stored is not missing:
+                    # Keep it as already expired, so the next full lookup fetches
+                    self._entries[key] = (stored, 0.0, loader, self._ttl(ttl))
+                    return stored
+                entry = self._entries.get(key)
+                if entry is None:
+                    raise CacheMiss(key)
+                return entry[0]  # Stale, but better than blocking the prompt
+
+            if stored is not missing:
+                self.set(key, stored, ttl=ttl, loader=loader)
+                self._revalidate(key, loader, ttl)
+                return stored
+
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            self.set(key, value, ttl=ttl, loader=loader)
+            self._save_stored(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def prefetch(
+        self, key: Hashable, loader: Callable[[], Any], ttl: float | None = None
+    ) -> threading.Thread:
+        """
+        Fetches a key in a background daemon thread, ignoring any errors.
+
+        Args:
+            key (Hashable): The cache key.
+            loader (Callable[[], Any]): Fetches the value.
+            ttl (float | None): Time to live in seconds. Defaults to `default_ttl`.
+
+        Returns:
+            threading.Thread: The started thread.
+        """
+
+        def _run():
+            with suppress(Exception):
+                self.get_or_fetch(key, loader, ttl=ttl)
+
+        thread = threading.Thread(target=_run, name=f"prefetch-{key}", daemon=True)
+        thread.start()
+        return thread
+
+    def refresh(self) -> int:
+        """
+        Re-fetches every cached entry that has a loader.
+
+        Entries whose loader fails are dropped so the next lookup fetches again.
+
+        Returns:
+            int: The number of entries successfully refreshed.
+        """
+        with self._lock:
+            entries = [
+                (key, loader, ttl)
+                for key, (_, _, loader, ttl) in self._entries.items()
+                if loader is not None
+            ]
+
+        refreshed = 0
+        for key, loader, ttl in entries:
+            try:
+                value = loader()
+                self.set(key, value, ttl=ttl, loader=loader)
+                self._save_stored(key, value)
+                refreshed += 1
+            except Exception:  # noqa: BLE001
+                with self._lock:
+                    self._entries.pop(key, None)
+        return refreshed
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Removes a single key from the cache and its store, so the next lookup fetches it.
+
+        Args:
+            key (Hashable): The cache key.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            if self.store is not None:
+                with suppress(Exception):
+                    self.store.delete(key)
+
+    def clear(self, include_store: bool = False) -> None:
+        """
+        Removes every entry from the cache.
+
+        Args:
+            include_store (bool): If True, the persistent store is emptied too.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._memory_only.clear()
+            if include_store and self.store is not None:
+                self.store.clear()
+
+    def _ttl(self, ttl: float | None) -> float:
+        return self.default_ttl if ttl is None else ttl
+
+    def _load_stored(self, key: Hashable, default: Any) -> Any:
+        """
+        Returns a key's value from the store, or `default` if it has none.
+        """
+        if self.store is None or key in self._memory_only:
+            return default
+        try:
+            value = self.store.load(key)
+        except Exception:  # noqa: BLE001
+            return default
+        return default if value is None else value
+
+    def _save_stored(self, key: Hashable, value: Any) -> None:
+        """
+        Saves a fetched value to the store, ignoring any errors writing it.
+        """
+        if self.store is None or key in self._memory_only:
+            return
+        with suppress(Exception):
+            self.store.save(key, value)
+
+    def _revalidate(
+        self, key: Hashable, loader: Callable[[], Any], ttl: float | None
+    ) -> None:
+        """
+        Re-fetches a key served from the store in a background daemon thread.
+        """
+        with self._lock:
+            if key in self._revalidating:
+                return
+            self._revalidating.add(key)
+
+        def _run():
+            try:
+                with suppress(Exception):
+                    value = loader()
+                    self.set(key, value, ttl=ttl, loader=loader)
+                    self._save_stored(key, value)
+            finally:
+                with self._lock:
+                    self._revalidating.discard(key)
+
+        threading.Thread(target=_run, name=f"revalidate-{key}", daemon=True).start()
+
+    def keys(self) -> list[Hashable]:
+        """
+        Returns every key currently held, expired or not.
+        """
+        with self._lock:
+            return list(self._entries)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,313 @@
+import threading
+import time
+import uuid
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, suppress
+from typing import Any
+
+from mercury_cli.utils.governor import TrafficGovernor
+from mercury_cli.utils.response_cache import is_read_only
+
+DEFAULT_POOL_SIZE = 4  # Authenticated sessions kept open per login
+KEEPALIVE_INTERVAL = 300.0  # Seconds a session may sit idle before it is pinged
+KEEPALIVE_REQUEST = "SystemSoftwareVersionGetRequest"
+
+# Error summaries meaning the server no longer knows the session
+SESSION_EXPIRED_MARKERS = (
+    "session has expired",
+    "invalid session",
+    "session not found",
+    "not authenticated",
+    "not logged in",
+)
+
+
+def session_expired(response: Any) -> bool:
+    """
+    Checks whether a response says the command's session is no longer valid.
+
+    Args:
+        response (Any): The parsed response to a command.
+
+    Returns:
+        bool: True if the response is an error about an expired or unknown session.
+    """
+    summary = getattr(response, "summary", None)
+    if type(response).__name__ != "ErrorResponse" or not summary:
+        return False
+    summary = str(summary).lower()
+    return any(marker in summary for marker in SESSION_EXPIRED_MARKERS)
+
+
+class _Member:
+    """
+    One pooled client and when it was last used.
+    """
+
+    def __init__(self, client: Any):
+        self.client = client
+        self.last_used = time.monotonic()
+
+
+class ClientPool:
+    """
+    Pool of authenticated Mercury clients sharing one set of credentials.
+
+    Each member is a separate OCI-P session with its own keep-alive HTTP
+    connection, so concurrent work (parallel bulk rows, background completion
+    fetches, audits) runs side by side instead of queueing on one session.
+    Members are created on demand up to `size`, the most recently used first
+    so connections stay warm. A command whose session has expired is retried
+    once after logging that member in again, and idle members are pinged by
+    `start_keepalive` so they don't expire in the first place.
+
+    With a `governor`, every command (and batch, see `run`) is sent under
+    its adaptive concurrency limit and retried on transient failures, reads
+    always and changes only if they never reached the server.
+
+    Everything other than running commands is delegated to the first member,
+    so the pool can stand in for a single client.
+
+    Args:
+        factory (Callable[[], Any]): Creates and authenticates a new client.
+        size (int): Most sessions kept open at once.
+        governor (TrafficGovernor | None): Paces and retries requests.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        size: int = DEFAULT_POOL_SIZE,
+        governor: TrafficGovernor | None = None,
+    ):
+        if size < 1:
+            raise ValueError("pool size must be at least 1")
+        self.size = size
+        self.governor = governor
+        self._factory = factory
+        self._hooks: list[Callable[[Any], None]] = []
+        self._condition = threading.Condition()
+        self._stop = threading.Event()
+        self._keepalive: threading.Thread | None = None
+
+        # Created straight away, so bad credentials fail the login
+        self._primary = _Member(factory())
+        self._members: list[_Member] = [self._primary]
+        self._idle: list[_Member] = [self._primary]
+
+    @property
+    def primary(self) -> Any:
+        """
+        The first client created, used for anything but running commands.
+        """
+        return self._primary.client
+
+    @property
+    def members(self) -> int:
+        """
+        Number of sessions currently open.
+        """
+        with self._condition:
+            return len(self._members)
+
+    def on_member(self, hook: Callable[[Any], None]) -> None:
+        """
+        Registers a function called with every member client, existing and future.
+
+        Args:
+            hook (Callable[[Any], None]): Called once per member client.
+        """
+        with self._condition:
+            self._hooks.append(hook)
+            members = list(self._members)
+        for member in members:
+            hook(member.client)
+
+    def _checkout(self) -> _Member:
+        """
+        Takes an idle member, creating one if the pool has room, else waits for one.
+        """
+        with self._condition:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._members) < self.size:
+                    self._members.append(None)  # Reserve the slot while logging in
+                    break
+                self._condition.wait()
+
+        try:
+            member = _Member(self._factory())
+            for hook in list(self._hooks):
+                hook(member.client)
+        except BaseException:
+            with self._condition:
+                self._members.remove(None)
+                self._condition.notify()
+            raise
+
+        with self._condition:
+            self._members[self._members.index(None)] = member
+        return member
+
+    def _checkin(self, member: _Member) -> None:
+        member.last_used = time.monotonic()
+        with self._condition:
+            self._idle.append(member)
+            self._condition.notify()
+
+    @contextmanager
+    def lease(self) -> Iterator[Any]:
+        """
+        Lends a member client for the duration of the block.
+
+        Yields:
+            Any: A client no other thread is using.
+        """
+        member = self._checkout()
+        try:
+            yield member.client
+        finally:
+            self._checkin(member)
+
+    def relogin(self, client: Any) -> None:
+        """
+        Logs a member in again on a new session, reconnecting its HTTP connection.
+
+        Args:
+            client (Any): The member client whose session expired.
+        """
+        requester = client._requester
+        requester.disconnect()
+        client.authenticated = False
+        client.session_id = requester.session_id = str(uuid.uuid4())
+        requester.connect()
+        client.authenticate()
+
+    def run(self, send: Callable[[Any], Any], idempotent: bool = True) -> Any:
+        """
+        Calls `send` with an idle member, under the governor if there is one.
+
+        Args:
+            send (Callable[[Any], Any]): Sends a request on the given client and returns the response.
+            idempotent (bool): Whether the request only reads, so the governor may repeat it.
+
+        Returns:
+            Any: The response from the server.
+        """
+
+        def _attempt() -> Any:
+            with self.lease() as client:
+                return send(client)
+
+        if self.governor is None:
+            return _attempt()
+        return self.governor.call(_attempt, idempotent)
+
+    def command(self, command: Any) -> Any:
+        """
+        Executes a command on an idle member, logging in again if its session expired.
+
+        Args:
+            command (Any): The OCI-P command to execute.
+
+        Returns:
+            Any: The response from the server.
+        """
+
+        def _send(client: Any) -> Any:
+            response = client.command(command)
+            if session_expired(response):
+                self.relogin(client)
+                response = client.command(command)
+            return response
+
+        return self.run(_send, is_read_only(command))
+
+    def raw_command(self, command: str, **kwargs: str) -> Any:
+        """
+        Instantiates a command by name and executes it through `command`.
+
+        Raises:
+            ValueError: If the command is not found in the dispatch table.
+        """
+        command_class = self.primary._dispatch_table.get(command)
+        if not command_class:
+            raise ValueError(f"Command {command} not found in dispatch table")
+        return self.command(command_class(**kwargs))
+
+    def ping_idle(self, idle_for: float = KEEPALIVE_INTERVAL) -> int:
+        """
+        Sends a cheap request on every member idle for at least `idle_for` seconds.
+
+        A member whose session has expired is logged in again; one that cannot
+        be reached is closed and dropped from the pool.
+
+        Args:
+            idle_for (float): Seconds a member must have been idle to be pinged.
+
+        Returns:
+            int: The number of members pinged.
+        """
+        now = time.monotonic()
+        with self._condition:
+            stale = [m for m in self._idle if now - m.last_used >= idle_for]
+            for member in stale:
+                self._idle.remove(member)
+
+        pinged = 0
+        for member in stale:
+            try:
+                request = member.client._dispatch_table[KEEPALIVE_REQUEST]()
+                if session_expired(member.client.command(request)):
+                    self.relogin(member.client)
+                pinged += 1
+            except Exception:  # noqa: BLE001
+                if member is not self._primary:
+                    self._drop(member)
+                    continue
+            self._checkin(member)
+        return pinged
+
+    def _drop(self, member: _Member) -> None:
+        with suppress(Exception):
+            member.client.disconnect()
+        with self._condition:
+            self._members.remove(member)
+            self._condition.notify()
+
+    def start_keepalive(self, interval: float = KEEPALIVE_INTERVAL) -> None:
+        """
+        Pings idle members in a background daemon thread until `disconnect`.
+
+        Args:
+            interval (float): Seconds a member may sit idle before it is pinged.
+        """
+        if self._keepalive is not None:
+            return
+
+        def _run():
+            while not self._stop.wait(interval / 2):
+                self.ping_idle(interval)
+
+        self._keepalive = threading.Thread(
+            target=_run, name="client-keepalive", daemon=True
+        )
+        self._keepalive.start()
+
+    def disconnect(self) -> None:
+        """
+        Stops the keep-alive thread and disconnects every member.
+        """
+        self._stop.set()
+        with self._condition:
+            members = [m for m in self._members if m is not None]
+            self._idle.clear()
+        for member in members:
+            with suppress(Exception):
+                member.client.disconnect()
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "_primary":  # Not set yet, e.g. the first login failed
+            raise AttributeError(name)
+        return getattr(self._primary.client, name)
@@ -0,0 +1,148 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Hashable
+
+from mercury_cli.utils.paths import state_dir
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS lists (
+    key TEXT PRIMARY KEY,
+    fetched_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (key, value)
+) WITHOUT ROWID;
+"""
+
+
+class CompletionIndex:
+    """
+    On-disk store of completion lists, shared across sessions.
+
+    Each list (service providers, a service provider's groups, a group's
+    service packs) is stored under its cache key in a small SQLite database,
+    one per host and user. Saving a list only writes the entries that changed,
+    and entries are kept sorted by the primary key so prefix lookups are a
+    range scan.
+
+    Args:
+        path (str): The database file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.executescript(SCHEMA)
+
+    @classmethod
+    def for_account(cls, host: str, username: str) -> "CompletionIndex":
+        """
+        Opens the index for a host and user, creating it if needed.
+
+        Args:
+            host (str): The server the completions come from.
+            username (str): The user they were fetched as.
+
+        Returns:
+            CompletionIndex: The open index.
+        """
+        digest = hashlib.sha1(f"{host}\n{username}".encode()).hexdigest()[:16]
+        return cls(os.path.join(state_dir("index"), f"{digest}.sqlite3"))
+
+    @staticmethod
+    def _key(key: Hashable) -> str:
+        return json.dumps(list(key) if isinstance(key, tuple) else [key])
+
+    def load(self, key: Hashable, prefix: str = "") -> list[str] | None:
+        """
+        Returns a stored list, or only its entries starting with `prefix`.
+
+        Args:
+            key (Hashable): The list's cache key.
+            prefix (str): Only return entries starting with this.
+
+        Returns:
+            list[str] | None: The sorted entries, or None if the list was never stored.
+        """
+        key = self._key(key)
+        with self._lock:
+            if not self._connection.execute(
+                "SELECT 1 FROM lists WHERE key = ?", (key,)
+            ).fetchone():
+                return None
+            if prefix:
+                rows = self._connection.execute(
+                    "SELECT value FROM entries WHERE key = ? AND value >= ? AND value < ?"
+                    " ORDER BY value",
+                    (key, prefix, prefix + "\U0010ffff"),
+                )
+            else:
+                rows = self._connection.execute(
+                    "SELECT value FROM entries WHERE key = ? ORDER BY value", (key,)
+                )
+            return [value for (value,) in rows]
+
+    def save(self, key: Hashable, values: list[str]) -> None:
+        """
+        Stores a list, writing only the entries added or removed since last time.
+
+        Args:
+            key (Hashable): The list's cache key.
+            values (list[str]): The full, current list.
+        """
+        key = self._key(key)
+        new = set(values)
+        with self._lock, self._connection:
+            old = {
+                value
+                for (value,) in self._connection.execute(
+                    "SELECT value FROM entries WHERE key = ?", (key,)
+                )
+            }
+            self._connection.executemany(
+                "DELETE FROM entries WHERE key = ? AND value = ?",
+                [(key, value) for value in old - new],
+            )
+            self._connection.executemany(
+                "INSERT INTO entries (key, value) VALUES (?, ?)",
+                [(key, value) for value in new - old],
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO lists (key, fetched_at) VALUES (?, ?)",
+                (key, time.time()),
+            )
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Removes a stored list.
+
+        Args:
+            key (Hashable): The list's cache key.
+        """
+        key = self._key(key)
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._connection.execute("DELETE FROM lists WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """
+        Removes every stored list.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries")
+            self._connection.execute("DELETE FROM lists")
+
+    def close(self) -> None:
+        """
+        Closes the database.
+        """
+        with self._lock:
+            self._connection.close()
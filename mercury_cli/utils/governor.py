@@ -0,0 +1,255 @@
+import random
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+
+DEFAULT_MAX_RETRIES = 3  # Extra attempts for a request failing transiently
+BACKOFF_BASE = 0.25  # Seconds, doubled per attempt before jitter
+BACKOFF_CAP = 8.0  # Longest single backoff in seconds
+LATENCY_TOLERANCE = 3.0  # Slowdown over the usual latency treated as congestion
+LATENCY_FLOOR = 0.25  # Seconds below which a request is never "slow"
+BASELINE_ALPHA = 0.05  # Weight of each new sample in the usual latency
+
+# Exceptions raised before the request left the client, so even a change is
+# safe to send again
+UNSENT_ERRORS = (
+    "MErrorSocketInitialisation",
+    "MErrorClientInitialisation",
+    "ConnectTimeout",
+    "ConnectionRefusedError",
+)
+
+# Exceptions raised when the server couldn't be reached, by the Mercury
+# requesters or (for batches sent directly) requests and the standard library
+TRANSIENT_ERRORS = UNSENT_ERRORS + (
+    "MErrorSocketTimeout",
+    "MErrorSendRequestFailed",
+    "MErrorTimeOut",
+    "ConnectionError",
+    "ReadTimeout",
+    "Timeout",
+    "TimeoutError",
+)
+
+# Error summaries from a server shedding load rather than rejecting the request
+TRANSIENT_MARKERS = (
+    "too many",
+    "busy",
+    "overload",
+    "try again",
+    "temporarily",
+    "timed out",
+    "timeout",
+)
+
+
+def is_transient(outcome: Any) -> bool:
+    """
+    Checks whether a request's outcome is a transient failure worth retrying.
+
+    Args:
+        outcome (Any): The response returned, or the exception raised.
+
+    Returns:
+        bool: True for connection failures, timeouts and load-shedding error responses.
+    """
+    if isinstance(outcome, BaseException):
+        return type(outcome).__name__ in TRANSIENT_ERRORS
+    if type(outcome).__name__ != "ErrorResponse":
+        return False
+    summary = str(getattr(outcome, "summary", "") or "").lower()
+    return any(marker in summary for marker in TRANSIENT_MARKERS)
+
+
+def was_sent(outcome: Any) -> bool:
+    """
+    Checks whether a failed request may have been carried out by the server.
+
+    Args:
+        outcome (Any): The response returned, or the exception raised.
+
+    Returns:
+        bool: False only when the request never reached the server, or the
+        server turned it away unprocessed because it was busy.
+    """
+    if isinstance(outcome, BaseException):
+        return type(outcome).__name__ not in UNSENT_ERRORS
+    return type(outcome).__name__ != "ErrorResponse"
+
+
+class TrafficGovernor:
+    """
+    Client-side traffic control for OCI-P requests.
+
+    Requests take a permit before they are sent. The number of permits adapts
+    AIMD-style: it grows by about one per round of successful requests and
+    halves (at most once per round trip) when a request fails transiently or
+    takes far longer than usual, so concurrency settles at what the server
+    can sustain. An optional token bucket caps the request rate outright.
+    Transient failures are retried with jittered exponential backoff, though
+    a change is only sent again if it cannot have reached the server, so a
+    timed out create or delete is never applied twice.
+
+    Args:
+        max_concurrency (int): Most permits ever handed out at once.
+        rate (float | None): Most requests started per second, None for no cap.
+        max_retries (int): Extra attempts for a request failing transiently.
+        initial_concurrency (int | None): Permits to start with, defaults to half of `max_concurrency`.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        rate: float | None = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        initial_concurrency: int | None = None,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if rate is not None and rate <= 0:
+            raise ValueError("rate must be positive")
+        if max_retries < 0:
+            raise ValueError("max_retries cannot be negative")
+
+        self.max_concurrency = max_concurrency
+        self.rate = rate
+        self.max_retries = max_retries
+        self.limit = float(initial_concurrency or max(1, max_concurrency // 2))
+        self.limit = min(max(self.limit, 1.0), float(max_concurrency))
+
+        self.in_flight = 0
+        self.retries = 0
+        self.throttled = 0  # Times the limit was cut
+        self.baseline: float | None = None  # Usual latency of a request
+        self._last_cut = 0.0
+        self._tokens = float(max(1, int(rate or 1)))
+        self._refilled = time.monotonic()
+        self._condition = threading.Condition()
+
+    def _take_token(self) -> float:
+        """
+        Takes a token from the bucket, returning how long to wait if it was empty.
+        """
+        if self.rate is None:
+            return 0.0
+        now = time.monotonic()
+        burst = max(1.0, self.rate)
+        self._tokens = min(burst, self._tokens + (now - self._refilled) * self.rate)
+        self._refilled = now
+        self._tokens -= 1
+        return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> None:
+        """
+        Waits for a permit, and a token when the rate is capped.
+        """
+        with self._condition:
+            while self.in_flight >= int(self.limit):
+                self._condition.wait()
+            self.in_flight += 1
+            wait = self._take_token()
+        if wait:
+            time.sleep(wait)
+
+    def release(self, seconds: float, congested: bool) -> None:
+        """
+        Returns a permit and adapts the limit to how the request went.
+
+        Args:
+            seconds (float): How long the request took.
+            congested (bool): Whether it failed transiently.
+        """
+        with self._condition:
+            self.in_flight -= 1
+            baseline = self.baseline
+            slow = baseline is not None and seconds > max(
+                LATENCY_FLOOR, baseline * LATENCY_TOLERANCE
+            )
+
+            if congested or slow:
+                now = time.monotonic()
+                if now - self._last_cut >= (baseline or 0.0):  # Once per round trip
+                    self.limit = max(1.0, self.limit / 2)
+                    self.throttled += 1
+                    self._last_cut = now
+            else:
+                self.limit = min(
+                    float(self.max_concurrency), self.limit + 1 / self.limit
+                )
+
+            # Drifts, so a server that stays slower stops counting as congested
+            if not congested:
+                self.baseline = (
+                    seconds
+                    if baseline is None
+                    else baseline + BASELINE_ALPHA * (seconds - baseline)
+                )
+            self._condition.notify_all()
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the seconds to wait before a retry, with full jitter.
+
+        Args:
+            attempt (int): The retry number, starting at 0.
+        """
+        return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2**attempt))
+
+    def call(self, send: Callable[[], Any], idempotent: bool = True) -> Any:
+        """
+        Sends a request under a permit, retrying transient failures.
+
+        Args:
+            send (Callable[[], Any]): Sends the request and returns its response.
+            idempotent (bool): Whether the request is safe to repeat, i.e. only
+                reads. Otherwise it is only retried if it was never sent.
+
+        Returns:
+            Any: The response from the last attempt.
+
+        Raises:
+            Exception: Whatever the last attempt raised.
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            started = time.monotonic()
+            try:
+                outcome = send()
+            except Exception as e:  # noqa: BLE001
+                outcome = e
+            except BaseException:  # e.g. Ctrl+C, hand the permit back and stop
+                self.release(time.monotonic() - started, False)
+                raise
+
+            transient = is_transient(outcome)
+            self.release(time.monotonic() - started, transient)
+
+            retry = transient and (idempotent or not was_sent(outcome))
+            if not retry or attempt >= self.max_retries:
+                if isinstance(outcome, Exception):
+                    raise outcome
+                return outcome
+
+            with self._condition:
+                self.retries += 1
+            time.sleep(self.backoff(attempt))
+            attempt += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Returns the governor's current state as a serialisable dictionary.
+        """
+        with self._condition:
+            return {
+                "limit": round(self.limit, 2),
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self.in_flight,
+                "rate": self.rate,
+                "retries": self.retries,
+                "throttled": self.throttled,
+                "baseline_ms": None
+                if self.baseline is None
+                else round(self.baseline * 1000, 1),
+            }
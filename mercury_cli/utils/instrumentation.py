@@ -0,0 +1,227 @@
+import threading
+import time
+from typing import Any
+
+from mercury_cli.utils.metrics import LatencyStats
+from mercury_cli.utils.response_cache import ResponseCache
+
+
+class RequestStats:
+    """
+    Thread-safe per-request-type statistics for the session.
+
+    For each OCI-P request type it keeps a latency histogram (see
+    `LatencyStats`), the number of errors and the bytes sent and received.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._types: dict[str, dict[str, Any]] = {}
+
+    def record(
+        self,
+        request_type: str,
+        seconds: float,
+        request_bytes: int = 0,
+        response_bytes: int = 0,
+        error: bool = False,
+    ) -> None:
+        """
+        Records a single request.
+
+        Args:
+            request_type (str): The request class name, e.g. `UserGetRequest23V2`.
+            seconds (float): Time taken for the round trip.
+            request_bytes (int): Size of the request payload sent.
+            response_bytes (int): Size of the response payload received.
+            error (bool): Whether the request raised or the server returned an error.
+        """
+        with self._lock:
+            entry = self._types.get(request_type)
+            if entry is None:
+                entry = self._types[request_type] = {
+                    "latency": LatencyStats(),
+                    "errors": 0,
+                    "request_bytes": 0,
+                    "response_bytes": 0,
+                }
+            entry["errors"] += int(error)
+            entry["request_bytes"] += request_bytes
+            entry["response_bytes"] += response_bytes
+        entry["latency"].observe(seconds)
+
+    def rows(self) -> list[dict[str, Any]]:
+        """
+        Returns a serialisable summary per request type, slowest in total first.
+
+        Returns:
+            list[dict[str, Any]]: One entry per request type with its count, errors,
+            latency percentiles in milliseconds and total bytes.
+        """
+        with self._lock:
+            types = list(self._types.items())
+
+        rows = [
+            {
+                "request_type": request_type,
+                **entry["latency"].summary(),
+                "total_ms": round(entry["latency"].total * 1000, 1),
+                "errors": entry["errors"],
+                "request_bytes": entry["request_bytes"],
+                "response_bytes": entry["response_bytes"],
+            }
+            for request_type, entry in types
+        ]
+        return sorted(rows, key=lambda row: row["total_ms"], reverse=True)
+
+    def reset(self) -> None:
+        """
+        Drops every recorded request.
+        """
+        with self._lock:
+            self._types.clear()
+
+
+class _MeteredRequester:
+    """
+    Wraps a client's requester to measure the payloads it sends and receives.
+
+    Sizes are left on a thread-local for the `InstrumentedClient` call that
+    triggered the request, so concurrent bulk workers don't mix them up.
+    """
+
+    def __init__(self, requester: Any, sizes: threading.local):
+        self._requester = requester
+        self._sizes = sizes
+
+    def send_request(self, command: str) -> Any:
+        response = self._requester.send_request(command)
+        sizes = self._sizes
+        sizes.request_bytes = getattr(sizes, "request_bytes", 0) + len(command)
+        if isinstance(response, (str, bytes)):
+            sizes.response_bytes = getattr(sizes, "response_bytes", 0) + len(response)
+        return response
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._requester, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+        else:  # e.g. a new session_id after logging in again
+            setattr(self._requester, name, value)
+
+
+class InstrumentedClient:
+    """
+    Proxy around a Mercury `Client` that records every command it executes.
+
+    `command` and `raw_command` are timed and recorded into a `RequestStats`
+    under the request's class name, with payload sizes and whether it failed.
+    Everything else is delegated to the wrapped client, so the proxy can be
+    handed to the Agent and anything else expecting a client.
+
+    With a `ResponseCache`, read-only commands answered from it are recorded
+    under `<request type> (cached)` without reaching the client, and any other
+    command drops the responses it may affect before and after it is sent.
+
+    Args:
+        client (Any): The client, or `ClientPool` of clients, to wrap.
+        stats (RequestStats): Where requests are recorded.
+        responses (ResponseCache | None): Cache of read-only responses.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        stats: RequestStats,
+        responses: ResponseCache | None = None,
+    ):
+        self._client = client
+        self._stats = stats
+        self.responses = responses
+        self._sizes = threading.local()
+        if hasattr(type(client), "on_member"):  # A ClientPool, meter every session
+            client.on_member(self._meter)
+        else:
+            self._meter(client)
+
+    def _meter(self, client: Any) -> None:
+        client._requester = _MeteredRequester(client._requester, self._sizes)
+
+    @property
+    def wrapped(self) -> Any:
+        """
+        The underlying client.
+        """
+        return self._client
+
+    def command(self, command: Any) -> Any:
+        """
+        Executes a command on the wrapped client and records it.
+
+        Args:
+            command (Any): The OCI-P command to execute.
+
+        Returns:
+            Any: The response from the server.
+        """
+        from mercury_ocip.commands.base_command import ErrorResponse
+
+        if self.responses is not None:
+            started = time.monotonic()
+            cached = self.responses.get(command)
+            if cached is not None:
+                self._stats.record(
+                    f"{type(command).__name__} (cached)", time.monotonic() - started
+                )
+                return cached
+
+        self._sizes.request_bytes = 0
+        self._sizes.response_bytes = 0
+        error = True
+        started = time.monotonic()
+        try:
+            if self.responses is None:
+                response = self._client.command(command)
+            else:
+                generation = self.responses.generation
+                with self.responses.changing([command]):
+                    response = self._client.command(command)
+                self.responses.store(command, response, generation)
+            error = isinstance(response, ErrorResponse)
+            return response
+        finally:
+            self._stats.record(
+                type(command).__name__,
+                time.monotonic() - started,
+                request_bytes=self._sizes.request_bytes,
+                response_bytes=self._sizes.response_bytes,
+                error=error,
+            )
+
+    def record(self, request_type: str, seconds: float, **kwargs: Any) -> None:
+        """
+        Records a request sent without going through `command`, e.g. a batch.
+
+        Args:
+            request_type (str): The label to record the request under.
+            seconds (float): Time taken for the round trip.
+            **kwargs: Passed to `RequestStats.record`.
+        """
+        self._stats.record(request_type, seconds, **kwargs)
+
+    def raw_command(self, command: str, **kwargs: str) -> Any:
+        """
+        Instantiates a command by name and executes it through `command`.
+
+        Raises:
+            ValueError: If the command is not found in the dispatch table.
+        """
+        command_class = self._client._dispatch_table.get(command)
+        if not command_class:
+            raise ValueError(f"Command {command} not found in dispatch table")
+        return self.command(command_class(**kwargs))
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._client, name)
@@ -0,0 +1,123 @@
+import importlib
+import threading
+from collections.abc import Callable, Iterable
+
+from action_completer import ActionCompleter
+from action_completer.types import ActionGroup
+
+
+class LazyChildren(dict):
+    """
+    Children of an action group whose modules are imported on first use.
+
+    The group is registered up front with just its name and description. The
+    first time anything looks inside it (completing, running or listing its
+    actions) the modules that register those actions are imported, and they
+    fill in this dictionary as they normally would.
+
+    Args:
+        modules (Iterable[str]): Modules registering the group's actions.
+        loader (Callable[[], None] | None): Registers the group's actions
+            itself, called once the modules are imported.
+    """
+
+    def __init__(
+        self, modules: Iterable[str] = (), loader: Callable[[], None] | None = None
+    ):
+        super().__init__()
+        self.modules: tuple[str, ...] = tuple(modules)
+        self.loader = loader
+        self.loaded = False
+        self._loading = False
+        self._lock = threading.RLock()
+
+    def load(self) -> None:
+        """
+        Imports the group's modules (and runs its loader) if not done yet.
+
+        Other threads wait for an import in progress; the importing thread
+        itself sees the children registered so far.
+        """
+        if self.loaded:
+            return
+        with self._lock:
+            if self.loaded or self._loading:
+                return
+            self._loading = True
+            try:
+                for module in self.modules:
+                    importlib.import_module(module)
+                if self.loader:
+                    self.loader()
+                self.loaded = True
+            finally:
+                self._loading = False
+
+    def __getitem__(self, key):
+        self.load()
+        return super().__getitem__(key)
+
+    def __contains__(self, key) -> bool:
+        self.load()
+        return super().__contains__(key)
+
+    def __iter__(self):
+        self.load()
+        return super().__iter__()
+
+    def __len__(self) -> int:
+        self.load()
+        return super().__len__()
+
+    def keys(self):
+        self.load()
+        return super().keys()
+
+    def values(self):
+        self.load()
+        return super().values()
+
+    def items(self):
+        self.load()
+        return super().items()
+
+    def get(self, key, default=None):
+        self.load()
+        return super().get(key, default)
+
+    def pop(self, key, *default):
+        self.load()
+        return super().pop(key, *default)
+
+
+def register_lazy_group(
+    completer: ActionCompleter, name: str, modules: Iterable[str], display_meta: str
+) -> ActionGroup:
+    """
+    Registers a top-level command group whose actions are imported on first use.
+
+    Args:
+        completer (ActionCompleter): The completer to register the group on.
+        name (str): The group's command name, e.g. `bulk`.
+        modules (Iterable[str]): Modules registering the group's actions.
+        display_meta (str): Description shown while the group is unloaded.
+
+    Returns:
+        ActionGroup: The registered group.
+    """
+    group = completer.group(name, display_meta=display_meta)
+    group.children = LazyChildren(modules)
+    return group
+
+
+def load_all(completer: ActionCompleter) -> None:
+    """
+    Imports every lazily registered group on the completer.
+
+    Args:
+        completer (ActionCompleter): The completer whose groups to load.
+    """
+    for group in list(completer.root.children.values()):
+        children = getattr(group, "children", None)
+        if isinstance(children, LazyChildren):
+            children.load()
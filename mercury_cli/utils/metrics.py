@@ -0,0 +1,96 @@
+import threading
+import time
+from collections import deque
+from typing import Any
+
+DEFAULT_LATENCY_WINDOW = 2048  # Most recent samples used for percentiles
+
+
+class LatencyStats:
+    """
+    Thread-safe running latency statistics.
+
+    Counts, totals and the maximum cover every sample. Percentiles are taken
+    over the most recent `window` samples so memory stays bounded however long
+    the run, and they track the server's current behaviour (e.g. throttling).
+
+    Args:
+        window (int): Number of recent samples kept for percentiles.
+    """
+
+    def __init__(self, window: int = DEFAULT_LATENCY_WINDOW):
+        self._samples: deque[float] = deque(maxlen=window)
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, seconds: float) -> None:
+        """
+        Records a single sample.
+
+        Args:
+            seconds (float): The measured latency in seconds.
+        """
+        with self._lock:
+            self._samples.append(seconds)
+            self.count += 1
+            self.total += seconds
+            self.max = max(self.max, seconds)
+
+    def percentile(self, p: float) -> float | None:
+        """
+        Returns the p-th percentile of the recent samples, or None without any.
+
+        Args:
+            p (float): The percentile, between 0 and 100.
+
+        Returns:
+            float | None: The latency in seconds at that percentile.
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, round(p / 100 * len(samples)) - 1))
+        return samples[index]
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / self.count if self.count else None
+
+    def summary(self) -> dict[str, Any]:
+        """
+        Returns the statistics in milliseconds as a serialisable dictionary.
+        """
+
+        def _ms(value: float | None) -> float | None:
+            return None if value is None else round(value * 1000, 1)
+
+        return {
+            "count": self.count,
+            "mean_ms": _ms(self.mean),
+            "p50_ms": _ms(self.percentile(50)),
+            "p95_ms": _ms(self.percentile(95)),
+            "max_ms": _ms(self.max if self.count else None),
+        }
+
+
+class Stopwatch:
+    """
+    Measures wall-clock time since it was created.
+    """
+
+    def __init__(self):
+        self.started = time.monotonic()
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def rate(self, count: int) -> float:
+        """
+        Returns `count` divided by the elapsed seconds.
+        """
+        elapsed = self.elapsed
+        return count / elapsed if elapsed > 0 else 0.0
@@ -0,0 +1,50 @@
+from collections.abc import Iterable
+from typing import Any
+
+
+def parse_options(args: Iterable[str], spec: dict[str, type]) -> dict[str, Any]:
+    """
+    Parses trailing `--name value` / `--flag` options captured by an action.
+
+    Options are looked up by their snake_case name, so `--host-limit 4` becomes
+    `{"host_limit": 4}`. Boolean options are flags and take no value.
+
+    Args:
+        args (Iterable[str]): The extra fragments captured after the action's params.
+        spec (dict[str, type]): Accepted option names mapped to the type to cast them to.
+
+    Returns:
+        dict[str, Any]: The parsed options, only containing those that were given.
+
+    Raises:
+        ValueError: If an option is unknown, missing its value or cannot be cast.
+    """
+    options: dict[str, Any] = {}
+    args = list(args)
+    i = 0
+
+    while i < len(args):
+        arg = args[i]
+        if not arg.startswith("--"):
+            raise ValueError(f"Unexpected argument '{arg}'")
+
+        name = arg[2:].replace("-", "_")
+        if name not in spec:
+            raise ValueError(f"Unknown option '{arg}'")
+
+        cast = spec[name]
+        if cast is bool:
+            options[name] = True
+            i += 1
+            continue
+
+        if i + 1 >= len(args):
+            raise ValueError(f"Option '{arg}' expects a value")
+
+        try:
+            options[name] = cast(args[i + 1])
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid value '{args[i + 1]}' for option '{arg}'")
+        i += 2
+
+    return options
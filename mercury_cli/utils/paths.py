@@ -0,0 +1,22 @@
+import os
+
+
+def state_dir(*parts: str) -> str:
+    """
+    Returns a directory for files the CLI keeps between sessions, creating it if needed.
+
+    Defaults to `~/.mercury_cli`, overridable with the `MERCURY_CLI_HOME`
+    environment variable.
+
+    Args:
+        *parts (str): Sub-directories below the state directory.
+
+    Returns:
+        str: The absolute path of the directory.
+    """
+    base = os.environ.get("MERCURY_CLI_HOME") or os.path.join(
+        os.path.expanduser("~"), ".mercury_cli"
+    )
+    path = os.path.abspath(os.path.join(base, *parts))
+    os.makedirs(path, exist_ok=True)
+    return path
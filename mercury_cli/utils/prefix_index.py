@@ -0,0 +1,92 @@
+from bisect import bisect_left
+from collections.abc import Iterable
+
+# Most completions offered per key press; the menu cannot usefully show more
+COMPLETION_LIMIT = 200
+
+
+class PrefixIndex:
+    """
+    Sorted, case-insensitive index of completion candidates.
+
+    Built once per fetched list, so each key press is a binary search for the
+    typed prefix (O(log n + k)) rather than a scan of every candidate. Only when
+    nothing starts with the text are entries containing it elsewhere offered,
+    earliest match first, so the linear scan is kept off the common path.
+
+    Args:
+        values (Iterable[str]): The completion candidates.
+    """
+
+    def __init__(self, values: Iterable[str]):
+        pairs = sorted({(str(value).casefold(), str(value)) for value in values})
+        self._folded: list[str] = [folded for folded, _ in pairs]
+        self._values: list[str] = [value for _, value in pairs]
+        # Every entry joined into one string, so substring search runs in C
+        self._haystack = "\n".join(self._folded)
+        self._offsets: list[int] = []
+        offset = 0
+        for entry in self._folded:
+            self._offsets.append(offset)
+            offset += len(entry) + 1
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def prefix(self, value: str, limit: int | None = COMPLETION_LIMIT) -> list[str]:
+        """
+        Returns the candidates starting with `value`, in sorted order.
+
+        Args:
+            value (str): The typed text, matched case-insensitively.
+            limit (int | None): Most candidates returned, None for all.
+
+        Returns:
+            list[str]: The matching candidates.
+        """
+        folded = value.casefold()
+        start = bisect_left(self._folded, folded)
+        end = len(self._folded) if limit is None else start + limit
+        matches = []
+        for index in range(start, min(end, len(self._folded))):
+            if not self._folded[index].startswith(folded):
+                break
+            matches.append(self._values[index])
+        return matches
+
+    def search(self, value: str, limit: int | None = COMPLETION_LIMIT) -> list[str]:
+        """
+        Returns prefix matches for `value`, or entries containing it if none start with it.
+
+        Args:
+            value (str): The typed text, matched case-insensitively.
+            limit (int | None): Most candidates returned, None for all.
+
+        Returns:
+            list[str]: The ranked candidates.
+        """
+        matches = self.prefix(value, limit)
+        if matches or not value:
+            return matches
+
+        ranked = sorted(
+            (position, self._folded[index], index)
+            for index, position in self._substring_matches(value.casefold())
+        )
+        return [self._values[index] for _, _, index in ranked[:limit]]
+
+    def _substring_matches(self, folded: str) -> Iterable[tuple[int, int]]:
+        """
+        Yields (entry index, match position) for every entry containing `folded`.
+        """
+        if "\n" in folded:
+            return
+
+        last = -1
+        found = self._haystack.find(folded)
+        while found != -1:
+            index = bisect_left(self._offsets, found + 1) - 1
+            if index != last:
+                last = index
+                yield index, found - self._offsets[index]
+            found = self._haystack.find(folded, found + 1)
@@ -0,0 +1,212 @@
+import csv
+import json
+import sys
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any, TextIO
+
+from rich.console import Console
+
+# Formats `--output` accepts by name, streamed to stdout instead of a file
+OUTPUT_FORMATS = ("jsonl", "csv", "json")
+
+
+def read_ids(file: TextIO, column: str) -> list[str]:
+    """
+    Reads IDs from a file, one per line or from a CSV column named `column`.
+
+    Blank lines and lines starting with `#` are skipped.
+
+    Args:
+        file (TextIO): The open file.
+        column (str): The CSV header holding the IDs, e.g. `user_id`.
+
+    Returns:
+        list[str]: The IDs, in file order and without duplicates.
+    """
+    lines = [line.strip() for line in file]
+    lines = [line for line in lines if line and not line.startswith("#")]
+
+    if lines and column in (header := next(csv.reader([lines[0]]))):
+        index = header.index(column)
+        ids = [
+            row[index].strip()
+            for row in csv.reader(lines[1:])
+            if len(row) > index and row[index].strip()
+        ]
+    else:
+        ids = lines
+
+    return list(dict.fromkeys(ids))
+
+
+def output_format(target: str) -> str:
+    """
+    Returns the record format for an `--output` value, a format name or a path.
+
+    Paths are written as CSV or a JSON array by their `.csv` or `.json`
+    extension, and as JSON lines otherwise.
+
+    Args:
+        target (str): The `--output` value.
+
+    Returns:
+        str: One of `OUTPUT_FORMATS`.
+    """
+    lowered = target.lower()
+    if lowered in OUTPUT_FORMATS:
+        return lowered
+    for fmt in ("csv", "json"):
+        if lowered.endswith(f".{fmt}"):
+            return fmt
+    return "jsonl"
+
+
+def _cell(value: Any) -> Any:
+    """
+    Flattens a nested value for a CSV cell as JSON.
+    """
+    if isinstance(value, (dict, list, tuple)):
+        return json.dumps(value, default=str)
+    return value
+
+
+class RecordWriter:
+    """
+    Streams flat records to CSV, JSON lines or a JSON array as they complete.
+
+    Each record is written and flushed straight away, so nothing is kept in
+    memory and a partial run keeps every finished record. CSV writes
+    `columns` (or the first record's keys) with a header row, unless `header`
+    is False because the file already has one, and nested values as JSON; a
+    JSON array is closed by `close`.
+
+    Args:
+        file (TextIO): The open output file.
+        fmt (str): One of `OUTPUT_FORMATS`.
+        columns (Sequence[str] | None): The record fields, in CSV column order.
+        header (bool): Whether to write the CSV header row.
+    """
+
+    def __init__(
+        self,
+        file: TextIO,
+        fmt: str,
+        columns: Sequence[str] | None = None,
+        header: bool = True,
+    ):
+        if fmt not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output format '{fmt}'")
+        self.file = file
+        self.format = fmt
+        self.columns = columns
+        self.header = header
+        self.count = 0
+        self._csv: csv.DictWriter | None = None
+
+    def write(self, record: dict[str, Any]) -> None:
+        """
+        Writes one record and flushes it.
+
+        Args:
+            record (dict[str, Any]): The record, keyed by the writer's columns.
+        """
+        if self.format == "csv":
+            if self._csv is None:
+                self._csv = csv.DictWriter(
+                    self.file,
+                    fieldnames=list(self.columns or record),
+                    extrasaction="ignore",
+                )
+                if self.header:
+                    self._csv.writeheader()
+            self._csv.writerow({key: _cell(value) for key, value in record.items()})
+        elif self.format == "json":
+            self.file.write("[\n" if not self.count else ",\n")
+            self.file.write(json.dumps(record, default=str))
+        else:
+            self.file.write(json.dumps(record, default=str) + "\n")
+        self.count += 1
+        self.file.flush()
+
+    def close(self) -> None:
+        """
+        Finishes the output, closing the JSON array or writing an empty CSV header.
+        """
+        if self.format == "json":
+            self.file.write("\n]\n" if self.count else "[]\n")
+        elif (
+            self.format == "csv" and self._csv is None and self.columns and self.header
+        ):
+            csv.DictWriter(self.file, fieldnames=list(self.columns)).writeheader()
+        self.file.flush()
+
+
+def streams_to_stdout(target: str | None) -> bool:
+    """
+    Checks whether an `--output` value names a format, streaming to stdout.
+    """
+    return target is not None and target.lower() in OUTPUT_FORMATS
+
+
+def message_console(console: Console, target: str | None) -> Console:
+    """
+    Returns the console for messages while writing to an `--output` value.
+
+    When records stream to stdout, messages go to the session's stderr
+    console instead, so the output stays parseable by whatever it is piped
+    into, and script mode still sees the failures printed there.
+
+    Args:
+        console (Console): The console used otherwise.
+        target (str | None): The `--output` value, if any.
+    """
+    if not streams_to_stdout(target):
+        return console
+    from mercury_cli.globals import MERCURY_CLI
+
+    return MERCURY_CLI.error_console()
+
+
+@contextmanager
+def open_records(
+    target: str, columns: Sequence[str] | None = None, append: bool = False
+) -> Iterator[RecordWriter]:
+    """
+    Opens a record writer for an `--output` value.
+
+    A format name (`jsonl`, `csv`, `json`) streams to stdout, anything else
+    is a file path, written in the format its extension implies.
+
+    Args:
+        target (str): The `--output` value.
+        columns (Sequence[str] | None): The record fields, in CSV column order.
+        append (bool): Whether to add to an existing file rather than replace it,
+            e.g. when resuming a job that wrote part of it.
+
+    Yields:
+        RecordWriter: The writer, finished when the block exits.
+
+    Raises:
+        ValueError: If asked to append to a non-empty JSON array file.
+    """
+    fmt = output_format(target)
+    if streams_to_stdout(target):
+        writer = RecordWriter(sys.stdout, fmt, columns)
+        try:
+            yield writer
+        finally:
+            writer.close()
+        return
+
+    with open(target, "a" if append else "w", encoding="utf-8", newline="") as file:
+        if file.tell() and fmt == "json":
+            raise ValueError(
+                f"Cannot add records to the JSON array in {target}, "
+                "write to a .jsonl or .csv file instead"
+            )
+        writer = RecordWriter(file, fmt, columns, header=not file.tell())
+        try:
+            yield writer
+        finally:
+            writer.close()
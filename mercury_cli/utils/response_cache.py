@@ -0,0 +1,251 @@
+import re
+import threading
+from collections import deque
+from collections.abc import Hashable, Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from mercury_cli.utils.cache import TTLCache
+
+DEFAULT_RESPONSE_TTL = 60.0  # Seconds a read-only response is reused
+DEFAULT_RESPONSE_ENTRIES = 1024  # Responses kept before the least recently used goes
+CHANGE_HISTORY = 256  # Recent changes remembered to spot reads that raced one
+
+# Words in a request class name that mean it changes something on the server
+MUTATING_WORDS = frozenset(
+    {
+        "Activate",
+        "Add",
+        "Assign",
+        "Deactivate",
+        "Delete",
+        "Modify",
+        "Move",
+        "Remove",
+        "Replace",
+        "Reset",
+        "Set",
+        "Unassign",
+    }
+)
+
+_bypass: ContextVar[bool] = ContextVar("response_cache_bypass", default=False)
+
+
+def _words(name: str) -> set[str]:
+    return set(re.findall(r"[A-Z][a-z]+", name))
+
+
+def is_read_only(command: Any) -> bool:
+    """
+    Checks whether a command only reads, i.e. is a `...Get...Request`.
+
+    Args:
+        command (Any): The OCI-P command.
+
+    Returns:
+        bool: True if the command's response can be reused.
+    """
+    words = _words(type(command).__name__)
+    return "Get" in words and not words & MUTATING_WORDS
+
+
+def command_scope(command: Any) -> tuple[str | None, str | None]:
+    """
+    Returns the service provider and group a command is about, where it says.
+
+    Args:
+        command (Any): The OCI-P command.
+
+    Returns:
+        tuple[str | None, str | None]: The service provider and group IDs, or None.
+    """
+    return (
+        getattr(command, "service_provider_id", None),
+        getattr(command, "group_id", None),
+    )
+
+
+def _overlaps(cached: tuple[str | None, ...], changed: tuple[str | None, ...]):
+    """
+    Checks whether a change in one scope can affect a response from another.
+
+    A response with no known service provider (e.g. a user's details) may be
+    affected by any change, as may any response when the change has none.
+    """
+    cached_sp, cached_group = cached
+    changed_sp, changed_group = changed
+    if cached_sp is None or changed_sp is None:
+        return True
+    if cached_sp != changed_sp:
+        return False
+    return (
+        cached_group is None or changed_group is None or cached_group == changed_group
+    )
+
+
+class ResponseCache:
+    """
+    Read-through cache of responses to read-only OCI-P requests.
+
+    Responses to `...Get...Request` commands are reused for `ttl` seconds,
+    keyed by the command's XML, so an automation re-reading what a completer
+    fetched moments ago doesn't go back to the server. Error responses are
+    never cached. Any other request counts as a change: it drops every cached
+    response for the same service provider or group, and every response that
+    isn't tied to one.
+
+    Every change also bumps a generation. A read records the generation when
+    it is sent (see `generation`) and its response is not stored if a change
+    it may overlap happened before the response came back, since it may show
+    the state from before that change.
+
+    Args:
+        ttl (float): Seconds a response is reused, 0 to disable the cache.
+        max_entries (int): Responses kept before the least recently used is evicted.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_RESPONSE_TTL,
+        max_entries: int = DEFAULT_RESPONSE_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.hits = 0
+        self._cache = TTLCache(max_entries=max_entries, default_ttl=ttl)
+        self._lock = threading.Lock()
+        self._generation = 0
+        # (generation, scope) of recent changes, oldest first
+        self._changes: deque = deque(maxlen=CHANGE_HISTORY)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0
+
+    @property
+    def generation(self) -> int:
+        """
+        The number of changes seen so far, recorded by a read before it is sent.
+        """
+        return self._generation
+
+    def _key(self, command: Any) -> Hashable:
+        return (*command_scope(command), command.to_xml())
+
+    def get(self, command: Any) -> Any | None:
+        """
+        Returns the cached response to a command, or None to send it.
+
+        Args:
+            command (Any): The OCI-P command about to be sent.
+        """
+        if not self.enabled or _bypass.get() or not is_read_only(command):
+            return None
+        response = self._cache.get(self._key(command))
+        if response is not None:
+            self.hits += 1
+        return response
+
+    def store(self, command: Any, response: Any, generation: int | None = None) -> None:
+        """
+        Caches a read-only command's response; changes are handled by `changing`.
+
+        Args:
+            command (Any): The OCI-P command that was sent.
+            response (Any): The server's response.
+            generation (int | None): `generation` when the command was sent.
+                If a change it may overlap has happened since, nothing is cached.
+        """
+        if not self.enabled or not is_read_only(command):
+            return
+        if type(response).__name__ == "ErrorResponse":
+            return
+        with self._lock:
+            if generation is not None and self._changed_since(generation, command):
+                return
+            self._cache.set(self._key(command), response, ttl=self.ttl)
+
+    def _changed_since(self, generation: int, command: Any) -> bool:
+        """
+        Checks whether a change since `generation` may affect a command's response.
+        """
+        if generation >= self._generation:
+            return False
+        if not self._changes or self._changes[0][0] > generation + 1:
+            return True  # Some changes since are no longer remembered
+        scope = command_scope(command)
+        return any(
+            _overlaps(scope, changed)
+            for changed_at, changed in self._changes
+            if changed_at > generation
+        )
+
+    @contextmanager
+    def changing(self, commands: Iterable[Any]) -> Iterator[None]:
+        """
+        Drops what changing commands may affect around the block that sends them.
+
+        Responses are dropped before the commands are sent and again once the
+        block exits, however it exits, even if the change timed out but was
+        applied anyway. With the generation each drop bumps, a read sent
+        before the block exits is never stored once it has.
+
+        Args:
+            commands (Iterable[Any]): The commands about to be sent; reads are ignored.
+        """
+        changes = [command for command in commands if not is_read_only(command)]
+        for command in changes:
+            self.invalidate_for(command)
+        try:
+            yield
+        finally:
+            for command in changes:
+                self.invalidate_for(command)
+
+    def invalidate_for(self, command: Any) -> int:
+        """
+        Drops the cached responses a changing command may have affected.
+
+        Args:
+            command (Any): The command that changed something.
+
+        Returns:
+            int: The number of responses dropped.
+        """
+        scope = command_scope(command)
+        dropped = 0
+        with self._lock:
+            self._generation += 1
+            self._changes.append((self._generation, scope))
+            cached = self._cache.keys()  # A copy, as keys are dropped below
+            for key in cached:
+                if _overlaps(key[:2], scope):
+                    self._cache.invalidate(key)
+                    dropped += 1
+        return dropped
+
+    def clear(self) -> None:
+        """
+        Drops every cached response, including any read still in flight.
+        """
+        with self._lock:
+            self._generation += 1
+            self._changes.append((self._generation, (None, None)))
+            self._cache.clear()
+            self.hits = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+@contextmanager
+def fresh_responses() -> Iterator[None]:
+    """
+    Sends read-only requests made inside the block to the server, caching the results.
+    """
+    token = _bypass.set(True)
+    try:
+        yield
+    finally:
+        _bypass.reset(token)
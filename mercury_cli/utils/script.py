@@ -0,0 +1,134 @@
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from rich.console import Console, ConsoleRenderable, RenderHook
+from rich.text import Text
+
+FAILURE_MARK = "✘"  # Prefix every command prints its failures with
+
+
+class FailureWatch(RenderHook):
+    """
+    Render hook noticing when a command reports a failure on the console.
+
+    Commands handle their own errors and print them prefixed with a cross
+    rather than raising, so this is how script mode tells that a line failed.
+    """
+
+    def __init__(self):
+        self.failed = False
+
+    def process_renderables(
+        self, renderables: list[ConsoleRenderable]
+    ) -> list[ConsoleRenderable]:
+        for renderable in renderables:
+            if isinstance(renderable, Text) and renderable.plain.lstrip().startswith(
+                FAILURE_MARK
+            ):
+                self.failed = True
+        return renderables
+
+
+@dataclass
+class ScriptLineResult:
+    """
+    The outcome of one script line.
+    """
+
+    line_number: int
+    action: str
+    ok: bool
+    elapsed: float
+    error: str = ""
+
+
+def script_actions(lines: Iterable[str]) -> Iterable[tuple[int, str]]:
+    """
+    Yields the actions in a script, skipping blank lines and `#` comments.
+
+    Args:
+        lines (Iterable[str]): The script's lines.
+
+    Yields:
+        tuple[int, str]: The 1-based line number and the action text.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        action = line.strip()
+        if action and not action.startswith("#"):
+            yield line_number, action
+
+
+def run_script(
+    completer,
+    console: Console,
+    lines: Iterable[str],
+    fail_fast: bool = False,
+    error_console: Console | None = None,
+) -> list[ScriptLineResult]:
+    """
+    Runs each action in a script through the completer on the current session.
+
+    A line fails if its action raises or reports a failure on either console.
+    The status and time of every line is printed as it finishes, followed by
+    a summary.
+
+    Args:
+        completer: The ActionCompleter actions are run through.
+        console (Console): Console the commands print to.
+        lines (Iterable[str]): The script's lines, read lazily (e.g. from stdin).
+        fail_fast (bool): If True, stop at the first failed line.
+        error_console (Console | None): Console commands report failures on
+            while streaming their output to stdout.
+
+    Returns:
+        list[ScriptLineResult]: The result of every line run.
+    """
+    results: list[ScriptLineResult] = []
+    started = time.monotonic()
+
+    for line_number, action in script_actions(lines):
+        watch = FailureWatch()
+        line_started = time.monotonic()
+        error = ""
+        consoles = [console] + ([error_console] if error_console else [])
+        for watched in consoles:
+            watched.push_render_hook(watch)
+        try:
+            completer.run_action(action)
+        except SystemExit:  # e.g. the exit command
+            break
+        except Exception as e:  # noqa: BLE001
+            error = str(e) or type(e).__name__
+        finally:
+            for watched in consoles:
+                watched.pop_render_hook()
+
+        result = ScriptLineResult(
+            line_number=line_number,
+            action=action,
+            ok=not error and not watch.failed,
+            elapsed=time.monotonic() - line_started,
+            error=error,
+        )
+        results.append(result)
+
+        mark, style = ("✔", "green") if result.ok else (FAILURE_MARK, "red")
+        console.print(
+            f"{mark} line {line_number} ({result.elapsed:.2f}s): {action}"
+            + (f" - {error}" if error else ""),
+            style=style,
+            markup=False,
+            highlight=False,
+        )
+
+        if fail_fast and not result.ok:
+            console.print("Stopping at first failure (--fail-fast).", style="red")
+            break
+
+    failed = sum(1 for result in results if not result.ok)
+    console.print(
+        f"{len(results)} actions, {failed} failed in {time.monotonic() - started:.2f}s",
+        style="red" if failed else "green",
+    )
+    return results
@@ -1,19 +1,269 @@
-from typing import Iterable, Optional
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Iterator
 from action_completer.types import ActionParam, Action
 from action_completer.utils import get_fragments
 from mercury_ocip.commands.commands import (
     GroupGetListInServiceProviderPagedSortedListRequest,
     GroupGetListInServiceProviderPagedSortedListResponse,
+    ResponsePagingControl,
+    SearchCriteriaGroupId,
     ServiceProviderGetListRequest,
     ServiceProviderGetListResponse,
     GroupServiceGetAuthorizedListRequest,
     GroupServiceGetAuthorizedListResponse,
 )
 from mercury_cli.globals import MERCURY_CLI
+from mercury_cli.utils.cache import CacheMiss, cached_only
+from mercury_cli.utils.prefix_index import PrefixIndex
+from mercury_cli.utils.response_cache import fresh_responses
+
+SERVICE_PROVIDER_TTL = 600.0  # Seconds the service provider list stays cached
+GROUP_TTL = 300.0  # Seconds a service provider's group list stays cached
+SERVICE_PACK_TTL = 300.0  # Seconds a group's service pack list stays cached
+GROUP_PAGE_SIZE = 500  # Groups asked for per request when paging a group list
+INDEX_LIMIT = 16  # Prefix indexes kept, the least recently completed evicted first
+
+_indexes: "OrderedDict[Hashable, tuple[list[str], PrefixIndex]]" = OrderedDict()
+_indexes_lock = threading.Lock()
+
+
+def _matching(key: Hashable, values: list[str], value: str) -> list[str]:
+    """
+    Returns the candidates matching typed text, via a prefix index of the list.
+
+    The index is built once per fetched list and reused for every key press
+    until the cache hands back a different list for the key. Only the
+    `INDEX_LIMIT` most recently used indexes are kept, so browsing many
+    service providers doesn't hold an index of every group list seen.
+
+    Args:
+        key (Hashable): The list's cache key.
+        values (list[str]): The cached list.
+        value (str): The typed text.
+
+    Returns:
+        list[str]: Prefix matches, or entries containing the text if there are none.
+    """
+    with _indexes_lock:
+        built = _indexes.get(key)
+        if built is not None:
+            _indexes.move_to_end(key)
+    if built is None or built[0] is not values:
+        built = (values, PrefixIndex(values))
+        with _indexes_lock:
+            _indexes[key] = built
+            _indexes.move_to_end(key)
+            while len(_indexes) > INDEX_LIMIT:
+                _indexes.popitem(last=False)
+    return built[1].search(value)
+
+
+def _fetch_service_provider_ids() -> list[str]:
+    """
+    Fetches every service provider ID from the server.
+
+    Returns:
+        list[str]: The service provider IDs.
+    """
+    service_providers: ServiceProviderGetListResponse = MERCURY_CLI.client().command(
+        ServiceProviderGetListRequest()
+    )
+
+    service_provider_table = (
+        service_providers.service_provider_table.to_dict()
+        if service_providers.service_provider_table
+        else []
+    )
+    return [sp.get("service_provider_id", "") for sp in service_provider_table]
+
+
+def iter_group_id_pages(
+    service_provider_id: str, prefix: str = "", page_size: int | None = None
+) -> Iterator[list[str]]:
+    """
+    Fetches a service provider's group IDs from the server a page at a time.
+
+    Each page is its own request, so no single response grows with the size
+    of the enterprise. A prefix is sent as a case-insensitive "Starts With"
+    search, so the server only returns the groups that match it.
+
+    Args:
+        service_provider_id (str): The service provider to list groups for.
+        prefix (str): Only return group IDs starting with this.
+        page_size (int | None): Group IDs asked for per request. Defaults to GROUP_PAGE_SIZE.
+
+    Yields:
+        list[str]: The group IDs in each page, sorted by ID, until the last page.
+    """
+    search = (
+        [
+            SearchCriteriaGroupId(
+                mode="Starts With", value=prefix, is_case_insensitive=True
+            )
+        ]
+        if prefix
+        else None
+    )
+    page_size = page_size or GROUP_PAGE_SIZE
+    start = 1
+    while True:
+        groups: GroupGetListInServiceProviderPagedSortedListResponse = (
+            MERCURY_CLI.client().command(
+                GroupGetListInServiceProviderPagedSortedListRequest(
+                    service_provider_id=service_provider_id,
+                    response_paging_control=ResponsePagingControl(
+                        response_start_index=start, response_page_size=page_size
+                    ),
+                    search_criteria_group_id=search,
+                )
+            )
+        )
+
+        group_table = groups.group_table.to_dict() if groups.group_table else []
+        page = [g.get("group_id", "") for g in group_table]
+        if page:
+            yield page
+        if len(page) < page_size:
+            return
+        start += page_size
+
+
+def _fetch_group_ids(service_provider_id: str) -> list[str]:
+    """
+    Fetches every group ID in a service provider from the server, page by page.
+
+    Args:
+        service_provider_id (str): The service provider to list groups for.
+
+    Returns:
+        list[str]: The group IDs.
+    """
+    return [
+        group_id
+        for page in iter_group_id_pages(service_provider_id)
+        for group_id in page
+    ]
+
+
+def _fetch_service_pack_names(service_provider_id: str, group_id: str) -> list[str]:
+    """
+    Fetches the service packs authorised to a group from the server.
+
+    Args:
+        service_provider_id (str): The group's service provider.
+        group_id (str): The group to list service packs for.
+
+    Returns:
+        list[str]: The service pack names.
+    """
+    service_table: GroupServiceGetAuthorizedListResponse = MERCURY_CLI.client().command(
+        GroupServiceGetAuthorizedListRequest(
+            service_provider_id=service_provider_id, group_id=group_id
+        )
+    )
+    return list(service_table.service_pack_name or [])
+
+
+def get_service_provider_ids() -> list[str]:
+    """
+    Returns the service provider IDs, served from the completion cache when fresh.
+    """
+    return MERCURY_CLI.cache().get_or_fetch(
+        ("service_providers",), _fetch_service_provider_ids, ttl=SERVICE_PROVIDER_TTL
+    )
+
+
+def get_group_ids(service_provider_id: str, fresh: bool = False) -> list[str]:
+    """
+    Returns a service provider's group IDs, served from the completion cache when fresh.
+
+    Args:
+        service_provider_id (str): The service provider to list groups for.
+        fresh (bool): If True, the list is always re-fetched (and re-cached).
+    """
+    if fresh:
+        MERCURY_CLI.cache().invalidate(("groups", service_provider_id))
+        with fresh_responses():
+            return _get_group_ids(service_provider_id)
+    return _get_group_ids(service_provider_id)
+
+
+def _get_group_ids(service_provider_id: str) -> list[str]:
+    return MERCURY_CLI.cache().get_or_fetch(
+        ("groups", service_provider_id),
+        lambda: _fetch_group_ids(service_provider_id),
+        ttl=GROUP_TTL,
+    )
+
+
+def _group_candidates(
+    service_provider_id: str, prefix: str, page_size: int | None = None
+) -> tuple[Hashable, list[str]]:
+    """
+    Returns the group IDs to complete typed text from, and the key they are cached under.
+
+    A service provider's full group list is used whenever it is already
+    cached or stored. Otherwise only the first page of groups starting with
+    the typed text is fetched, and a cached page for a shorter prefix that
+    held every match is narrowed locally instead of asking the server again.
+
+    Args:
+        service_provider_id (str): The service provider being completed.
+        prefix (str): The typed text.
+        page_size (int | None): Group IDs fetched per search. Defaults to GROUP_PAGE_SIZE.
+
+    Returns:
+        tuple[Hashable, list[str]]: The list's cache key and the candidate group IDs.
+    """
+    page_size = page_size or GROUP_PAGE_SIZE
+    cache = MERCURY_CLI.cache()
+    full_key = ("groups", service_provider_id)
+    with cached_only():
+        try:
+            return full_key, cache.get_or_fetch(
+                full_key, lambda: _fetch_group_ids(service_provider_id), ttl=GROUP_TTL
+            )
+        except CacheMiss:
+            pass
+
+    prefix = prefix.casefold()
+    for end in range(len(prefix) - 1, -1, -1):
+        key = ("group_search", service_provider_id, prefix[:end])
+        narrower = cache.get(key)
+        if narrower is not None and len(narrower) < page_size:
+            return key, narrower
+
+    key = ("group_search", service_provider_id, prefix)
+    return key, cache.get_or_fetch(
+        key,
+        lambda: next(iter_group_id_pages(service_provider_id, prefix, page_size), []),
+        ttl=GROUP_TTL,
+    )
+
+
+def get_service_pack_names(service_provider_id: str, group_id: str) -> list[str]:
+    """
+    Returns a group's service pack names, served from the completion cache when fresh.
+    """
+    return MERCURY_CLI.cache().get_or_fetch(
+        ("service_packs", service_provider_id, group_id),
+        lambda: _fetch_service_pack_names(service_provider_id, group_id),
+        ttl=SERVICE_PACK_TTL,
+    )
+
+
+def prefetch_service_provider_ids() -> None:
+    """
+    Warms the completion cache with the service provider list in the background.
+    """
+    MERCURY_CLI.cache().prefetch(
+        ("service_providers",), _fetch_service_provider_ids, ttl=SERVICE_PROVIDER_TTL
+    )
 
 
 def _get_group_id_completions(
-    action: Action, param: Optional[ActionParam] = None, value: str = ""
+    action: Action, param: ActionParam | None = None, value: str = ""
 ) -> Iterable[str]:
     """
     Provides dynamic completions for the 'group_id' parameter based on the selected 'service_provider_id'.
@@ -62,26 +312,13 @@ def _get_group_id_completions(
         return []
 
     try:
-        groups: GroupGetListInServiceProviderPagedSortedListResponse = (
-            MERCURY_CLI.client().command(
-                GroupGetListInServiceProviderPagedSortedListRequest(
-                    service_provider_id=service_provider_id
-                )
-            )
-        )
-
-        group_table = groups.group_table.to_dict() if groups.group_table else []
-
-        group_ids = [g.get("group_id", "") for g in group_table]
-        if value:
-            group_ids = [gid for gid in group_ids if str(gid).startswith(value)]
-        return group_ids
+        return _matching(*_group_candidates(service_provider_id, value), value)
     except Exception:
         return []
 
 
 def _get_service_provider_id_completions(
-    action: Action, param: Optional[ActionParam] = None, value: str = ""
+    action: Action, param: ActionParam | None = None, value: str = ""
 ) -> Iterable[str]:
     """
     Provides dynamic completions for the 'service_provider_id' parameter.
@@ -94,30 +331,14 @@ def _get_service_provider_id_completions(
     Returns:
         Iterable[str]: A list of possible completions for the 'service_provider_id' parameter.
     """
-    service_providers: Optional[ServiceProviderGetListResponse] = None
     try:
-        service_providers = MERCURY_CLI.client().command(
-            ServiceProviderGetListRequest()
-        )
-
-        service_provider_table = (
-            service_providers.service_provider_table.to_dict()
-            if service_providers.service_provider_table
-            else []
-        )
+        return _matching(("service_providers",), get_service_provider_ids(), value)
     except Exception:
         return []
 
-    try:
-        sp_ids = [sp.get("service_provider_id", "") for sp in service_provider_table]
-        if value:
-            sp_ids = [sid for sid in sp_ids if str(sid).startswith(value)]
-        return sp_ids
-    except Exception:
-        return []
 
 def _get_group_service_pack_completions(
-    action: Action, param: Optional[ActionParam] = None, value: str = ""
+    action: Action, param: ActionParam | None = None, value: str = ""
 ) -> Iterable[str]:
     """
     Provide completions for a group's service packs.
@@ -160,7 +381,7 @@ def _get_group_service_pack_completions(
         return []
 
     # Helper to get a fragment value for a target param index relative to the current param
-    def _fragment_for(target_index: int) -> Optional[str]:
+    def _fragment_for(target_index: int) -> str | None:
         offset = current_param_index - target_index
         fragment_index = len(fragments) - 1 - offset
         if 0 <= fragment_index < len(fragments):
@@ -175,17 +396,12 @@ def _get_group_service_pack_completions(
         return []
 
     try:
-        service_table: GroupServiceGetAuthorizedListResponse = (
-            MERCURY_CLI.client().command(
-                GroupServiceGetAuthorizedListRequest(
-                    service_provider_id=service_provider_id,
-                    group_id=group_id
-                )
-            )
+        return _matching(
+            ("service_packs", service_provider_id, group_id),
+            get_service_pack_names(service_provider_id, group_id),
+            value,
         )
-
-        return service_table.service_pack_name
     except Exception:
         return []
 
-    return []
\ No newline at end of file
+    return []